@@ -0,0 +1,34 @@
+"""
+benchlib.py — Helpers shared by the bridge benchmarks.
+"""
+
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCH_DIR)
+KB_ROOT = os.path.normpath(os.path.join(SCRIPTS_DIR, '..', '..', '..'))
+
+sys.path.insert(0, os.path.join(KB_ROOT, 'runtime', 'tools'))
+sys.path.insert(0, SCRIPTS_DIR)
+
+
+def load_contract_gen():
+    """
+    A fresh copy of scripts/contract_gen.py, so a benchmark that edits the
+    configuration tables does not leak into the next one.
+    """
+    import contract_gen
+    sys.modules.pop('contract_gen')
+    return contract_gen
+
+
+def best_of(repeat, fn):
+    """Fastest wall time of fn() over repeat runs, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+classifier-bench.py — Command/query routing: table scans vs compiled tables.
+
+Compares contract_gen.py's compiled routing (COMMAND_ROUTES, QUERY_ROUTES,
+QUERY_PATTERN_INDEX) against the previous per-operation scans of the verb sets and
+SUB_RESOURCE_PATTERNS / FIELD_QUERY_PATTERNS, on the default tables and on
+tables padded with synthetic patterns. Both must classify every operation
+identically. Pattern tables below PatternIndex.SCAN_LIMIT entries (the
+default ones, and up to 19 extra patterns per table) are still scanned in
+order, so those rows time the verb dicts and the merged scan.
+
+Usage:
+  python3 classifier-bench.py [--operations N] [--patterns 0,100,1000] [--repeat N]
+"""
+
+import argparse
+import random
+
+from benchlib import best_of, load_contract_gen
+
+WORDS = ['card', 'account', 'transfer', 'payment', 'loan', 'party', 'policy', 'limit',
+         'by', 'id', 'current', 'global', 'pending', 'monthly']
+
+
+def scan_command(cg, command_id):
+    """Previous routing: verb sets checked one after another."""
+    verb = cg.extract_verb(command_id)
+    if verb in cg.CREATE_VERBS:
+        return 'create'
+    elif verb in cg.STATE_CHANGE_VERBS:
+        return 'state-change'
+    elif verb in cg.DELETE_VERBS:
+        return 'delete'
+    return None
+
+
+def scan_query(cg, query_id):
+    """Previous routing: substring scan of each pattern table in order."""
+    q_id = query_id.lower()
+    verb = q_id.split('-')[0]
+    for pattern, sub_path in cg.SUB_RESOURCE_PATTERNS.items():
+        if pattern in q_id:
+            return ('sub-resource', sub_path)
+    for pattern, sub_path in cg.FIELD_QUERY_PATTERNS.items():
+        if pattern in q_id and verb in ('get', 'retrieve', 'fetch', 'read'):
+            return ('field', sub_path)
+    if verb in ('list', 'search', 'find'):
+        return ('list', None)
+    if verb in ('get', 'retrieve', 'fetch', 'read'):
+        return ('get', None)
+    return ('list', None)
+
+
+def compiled_command(cg, command_id):
+    return cg.COMMAND_ROUTES.get(cg.extract_verb(command_id))
+
+
+def compiled_query(cg, query_id):
+    q_id = query_id.lower()
+    route = cg.QUERY_ROUTES.get(q_id.split('-', 1)[0])
+    match = cg.QUERY_PATTERN_INDEX.first_match(q_id)
+    if match and (match[1][0] == 'sub-resource' or route == 'get'):
+        return match[1]
+    return (route or 'list', None)
+
+
+def synthetic_operations(cg, count, rng):
+    command_verbs = sorted(cg.CREATE_VERBS | cg.STATE_CHANGE_VERBS | cg.DELETE_VERBS) + ['recalculate']
+    query_verbs = sorted(cg.QUERY_GET_VERBS | cg.QUERY_LIST_VERBS) + ['compute']
+    fields = list(cg.SUB_RESOURCE_PATTERNS)[:4] + list(cg.FIELD_QUERY_PATTERNS)[:4]
+    commands, queries = [], []
+    for i in range(count):
+        noun = '-'.join(rng.choice(WORDS) for _ in range(rng.randint(1, 3)))
+        commands.append(f'{rng.choice(command_verbs)}-{noun}')
+        tail = f'-{rng.choice(fields)}' if rng.random() < 0.4 else ''
+        queries.append(f'{rng.choice(query_verbs)}-{noun}{tail}')
+    return commands, queries
+
+
+def pad_tables(cg, extra, rng):
+    """Append synthetic patterns after the real ones (real entries keep precedence)."""
+    for i in range(extra):
+        word = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(5, 12)))
+        cg.SUB_RESOURCE_PATTERNS.setdefault(f'{word}{i}', f'{word}s')
+        cg.FIELD_QUERY_PATTERNS.setdefault(f'{word}-f{i}', word)
+    cg.compile_routing_tables()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark contract-gen command/query routing.')
+    parser.add_argument('--operations', type=int, default=20000, help='commands and queries each')
+    parser.add_argument('--patterns', default='0,100,1000',
+                        help='comma-separated synthetic patterns added per table (default: 0,100,1000)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"  {'extra patterns':>14} {'scan (s)':>9} {'compiled (s)':>13} {'speedup':>8}")
+    for extra in (int(n) for n in args.patterns.split(',') if n.strip()):
+        cg = load_contract_gen()
+        rng = random.Random(extra)
+        pad_tables(cg, extra, rng)
+        commands, queries = synthetic_operations(cg, args.operations, rng)
+
+        def scan():
+            return ([scan_command(cg, c) for c in commands],
+                    [scan_query(cg, q) for q in queries])
+
+        def compiled():
+            return ([compiled_command(cg, c) for c in commands],
+                    [compiled_query(cg, q) for q in queries])
+
+        if scan() != compiled():
+            print(f"ERROR: compiled routing differs from table scan ({extra} extra patterns)")
+            raise SystemExit(1)
+        t_scan = best_of(args.repeat, scan)
+        t_compiled = best_of(args.repeat, compiled)
+        print(f"  {extra:>14} {t_scan:9.3f} {t_compiled:13.3f} {t_scan / t_compiled:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+contract-gen-bench.py — Scaling benchmark for contract-gen.py.
+
+For each requested model size, writes a synthetic DESIGN tree, then times the
+three per-context phases of contract generation separately:
+
+  load      yaml_io.load_file(aggregate-definitions.yaml)
+  generate  generate_openapi()
+  dump      yaml_io.dump_file(openapi-spec.yaml)
+
+Reports throughput (endpoints/sec, schemas/sec) and peak traced memory per
+phase (measured in a separate, untimed tracemalloc pass), and writes all
+results as JSON so bridge-phase regressions can be compared across releases.
+
+Usage:
+  python3 contract-gen-bench.py [--aggregates 10,100,500] [--contexts N]
+                                [--commands N] [--queries N] [--value-objects N]
+                                [--repeat N] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from benchlib import load_contract_gen
+from synthetic_model import (DEFAULT_COMMANDS, DEFAULT_QUERIES, DEFAULT_VALUE_OBJECTS,
+                             write_design_tree)
+
+import yaml_io
+
+PHASES = ('load', 'generate', 'dump')
+HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch')
+
+
+def run_phases(cg, jobs):
+    """One pass over all contexts. Returns per-phase seconds and the output counts."""
+    timings = dict.fromkeys(PHASES, 0.0)
+    endpoints = schemas = 0
+    for ctx_id, agg_file, out_file in jobs:
+        start = time.perf_counter()
+        agg_data = yaml_io.load_file(agg_file)
+        loaded = time.perf_counter()
+        openapi, _ = cg.generate_openapi(ctx_id, agg_data)
+        generated = time.perf_counter()
+        yaml_io.dump_file(openapi, out_file, aliases=False)
+        dumped = time.perf_counter()
+
+        timings['load'] += loaded - start
+        timings['generate'] += generated - loaded
+        timings['dump'] += dumped - generated
+        endpoints += sum(len([m for m in methods if m in HTTP_METHODS])
+                         for methods in openapi['paths'].values())
+        schemas += len(openapi['components']['schemas'])
+    return timings, endpoints, schemas
+
+
+def peak_memory(cg, jobs):
+    """Peak tracemalloc bytes per phase (maximum over contexts)."""
+    peaks = dict.fromkeys(PHASES, 0)
+    for ctx_id, agg_file, out_file in jobs:
+        tracemalloc.start()
+        agg_data = yaml_io.load_file(agg_file)
+        peaks['load'] = max(peaks['load'], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        openapi, _ = cg.generate_openapi(ctx_id, agg_data)
+        peaks['generate'] = max(peaks['generate'], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        yaml_io.dump_file(openapi, out_file, aliases=False)
+        peaks['dump'] = max(peaks['dump'], tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del agg_data, openapi
+    return peaks
+
+
+def bench_size(cg, workdir, aggregates, args):
+    design_dir = os.path.join(workdir, f'design-{aggregates}')
+    output_dir = os.path.join(workdir, f'bridge-{aggregates}')
+    ctx_ids = write_design_tree(design_dir, args.contexts, aggregates,
+                                commands=args.commands, queries=args.queries,
+                                value_objects=args.value_objects)
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [(c, os.path.join(design_dir, c, 'aggregate-definitions.yaml'),
+             os.path.join(output_dir, f'{c}.yaml')) for c in ctx_ids]
+
+    best = None
+    for _ in range(args.repeat):
+        timings, endpoints, schemas = run_phases(cg, jobs)
+        if best is None or sum(timings.values()) < sum(best.values()):
+            best = timings
+    peaks = peak_memory(cg, jobs)
+    total = sum(best.values())
+    input_bytes = sum(os.path.getsize(j[1]) for j in jobs)
+    output_bytes = sum(os.path.getsize(j[2]) for j in jobs)
+
+    return {
+        'contexts': args.contexts,
+        'aggregates_per_context': aggregates,
+        'endpoints': endpoints,
+        'schemas': schemas,
+        'input_bytes': input_bytes,
+        'output_bytes': output_bytes,
+        'seconds': dict(best, total=total),
+        'throughput': {
+            'endpoints_per_sec': endpoints / total,
+            'schemas_per_sec': schemas / total,
+            'generate_endpoints_per_sec': endpoints / best['generate'],
+            'generate_schemas_per_sec': schemas / best['generate'],
+        },
+        'peak_traced_bytes': peaks,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark contract-gen.py scaling.')
+    parser.add_argument('--aggregates', default='10,100,500',
+                        help='comma-separated aggregates-per-context sizes (default: 10,100,500)')
+    parser.add_argument('--contexts', type=int, default=1)
+    parser.add_argument('--commands', type=int, default=DEFAULT_COMMANDS, help='commands per aggregate')
+    parser.add_argument('--queries', type=int, default=DEFAULT_QUERIES, help='queries per aggregate')
+    parser.add_argument('--value-objects', type=int, default=DEFAULT_VALUE_OBJECTS,
+                        help='value objects per aggregate')
+    parser.add_argument('--repeat', type=int, default=3, help='timed passes per size (best is kept)')
+    parser.add_argument('--output', help='write JSON results to this file (default: stdout only)')
+    args = parser.parse_args()
+    sizes = [int(n) for n in args.aggregates.split(',') if n.strip()]
+
+    cg = load_contract_gen()
+    workdir = tempfile.mkdtemp(prefix='contract-gen-bench-')
+    try:
+        results = [bench_size(cg, workdir, n, args) for n in sizes]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        'benchmark': 'contract-gen',
+        'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'yaml_backend': 'libyaml' if yaml_io.LIBYAML else 'pure-python',
+        },
+        'config': {
+            'contexts': args.contexts,
+            'commands_per_aggregate': args.commands,
+            'queries_per_aggregate': args.queries,
+            'value_objects_per_aggregate': args.value_objects,
+            'repeat': args.repeat,
+        },
+        'results': results,
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+    print(f"  {'aggregates':>10} {'endpoints':>9} {'schemas':>8} {'load':>8} {'generate':>9} "
+          f"{'dump':>8} {'ep/s':>9} {'peak gen MB':>11}")
+    for r in results:
+        s = r['seconds']
+        print(f"  {r['aggregates_per_context']:>10} {r['endpoints']:>9} {r['schemas']:>8} "
+              f"{s['load']:8.3f} {s['generate']:9.3f} {s['dump']:8.3f} "
+              f"{r['throughput']['endpoints_per_sec']:9.0f} "
+              f"{r['peak_traced_bytes']['generate'] / 2**20:11.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"\n  Results written to {args.output}")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+synthetic_model.py — Deterministic synthetic DESIGN output for benchmarks.
+
+Builds aggregate-definitions.yaml content shaped like Phase 2 output
+(root entity, value objects, commands, queries, invariants) at any size,
+so the bridge tooling can be measured without a real domain model.
+
+Usage:
+  python3 synthetic_model.py <design-output-dir> [--contexts N] [--aggregates N]
+                             [--commands N] [--queries N] [--value-objects N]
+"""
+
+import argparse
+import os
+import sys
+
+ATTRIBUTE_TYPES = ['String', 'UUID', 'Integer', 'Long', 'Boolean', 'LocalDate',
+                   'DateTime', 'Money', 'BigDecimal', 'List<String>']
+# Commands: CRUD first, then state changes (each maps to a distinct endpoint)
+COMMAND_VERBS = ['create', 'update', 'block', 'unblock', 'cancel', 'delete',
+                 'reactivate', 'pause', 'resume', 'activate', 'deactivate', 'suspend',
+                 'approve', 'reject', 'close', 'archive', 'restore', 'enable', 'disable',
+                 'lock', 'unlock']
+# Queries: one per routing shape (by id, list, sub-resource, field)
+QUERY_TEMPLATES = ['get-{id}-by-id', 'list-{id}s', 'list-{id}-transactions', 'get-{id}-status',
+                   'list-{id}-movements', 'get-{id}-history', 'get-{id}-balance', 'get-{id}-summary',
+                   'get-{id}-detail', 'retrieve-{id}-pin']
+
+DEFAULT_COMMANDS = 6
+DEFAULT_QUERIES = 4
+DEFAULT_VALUE_OBJECTS = 2
+
+
+def to_camel(kebab):
+    return ''.join(w.capitalize() for w in kebab.split('-'))
+
+
+def synthetic_aggregate(index, commands=DEFAULT_COMMANDS, queries=DEFAULT_QUERIES,
+                        value_objects=DEFAULT_VALUE_OBJECTS):
+    """
+    One aggregate; attribute counts vary slightly with the index but are
+    deterministic. Commands/queries beyond the built-in tables get numbered
+    ids (extra commands reuse verbs, extra queries become search endpoints).
+    """
+    agg_id = f'resource-{index}'
+    name = to_camel(agg_id)
+    id_field = f'resource{index}Id'
+
+    attributes = [
+        {'name': f'field{i}', 'type': ATTRIBUTE_TYPES[(index + i) % len(ATTRIBUTE_TYPES)],
+         'required': i % 2 == 0, 'description': f'Attribute {i} of {name}'}
+        for i in range(6 + index % 4)
+    ]
+    vos = []
+    for i in range(value_objects):
+        if i == 0:
+            vos.append({'id': f'{agg_id}-status', 'name': f'{name}Status',
+                        'attributes': [{'name': 'value', 'type': 'Enum',
+                                        'constraints': 'ACTIVE, BLOCKED, CLOSED'}],
+                        'used_by': [f'{agg_id}-entity']})
+        else:
+            vos.append({'id': f'{agg_id}-detail-{i}', 'name': f'{name}Detail{i}',
+                        'attributes': [{'name': 'label', 'type': 'String'},
+                                       {'name': 'amount', 'type': 'Money'}],
+                        'used_by': [f'{agg_id}-entity']})
+    cmds = []
+    for i in range(commands):
+        verb = COMMAND_VERBS[i % len(COMMAND_VERBS)]
+        cmd_id = f'{verb}-{agg_id}' if i < len(COMMAND_VERBS) else f'{verb}-{agg_id}-{i}'
+        inputs = [] if verb == 'create' else [{'name': id_field, 'type': 'String'}]
+        inputs.append({'name': 'reason', 'type': 'String', 'required': verb != 'create',
+                       'description': f'Why {name} is {verb}d'})
+        cmds.append({
+            'id': cmd_id, 'name': to_camel(cmd_id), 'description': f'{verb.title()} a {name}',
+            'input': inputs,
+            'error_cases': [{'invariant': f'{agg_id}-must-be-active'}],
+        })
+    qrys = []
+    for i in range(queries):
+        if i < len(QUERY_TEMPLATES):
+            q_id = QUERY_TEMPLATES[i].format(id=agg_id)
+        else:
+            q_id = f'search-{agg_id}-by-field{i}'
+        qrys.append({'id': q_id, 'description': f'Query {q_id}',
+                     'input': [{'name': 'from', 'type': 'Date'}] if not q_id.startswith('get') else []})
+    invariants = [
+        {'id': f'{agg_id}-must-be-active', 'rule': f'{name} must be ACTIVE', 'enforced_by': 'command'},
+        {'id': f'{agg_id}-visible-to-owner', 'rule': 'Owner only', 'enforced_by': 'query-validation'},
+    ]
+    return {
+        'id': agg_id,
+        'name': name,
+        'root_entity': f'{agg_id}-entity',
+        'entities': [{
+            'id': f'{agg_id}-entity', 'name': name, 'is_root': True,
+            'identity': {'field': id_field, 'type': 'UUID', 'generation': 'auto'},
+            'attributes': attributes,
+        }],
+        'value_objects': vos,
+        'commands': cmds,
+        'queries': qrys,
+        'invariants': invariants,
+    }
+
+
+def synthetic_context(ctx_id, aggregates, **sizes):
+    """
+    aggregate-definitions.yaml content for one bounded context.
+    sizes: commands / queries / value_objects per aggregate.
+    """
+    return {
+        'version': '1.0',
+        'bounded_context': ctx_id,
+        'context_name': to_camel(ctx_id),
+        'analysis_date': '2026-01-01',
+        'aggregates': [synthetic_aggregate(i, **sizes) for i in range(aggregates)],
+    }
+
+
+def synthetic_context_map(ctx_ids):
+    return {
+        'version': '1.0',
+        'subdomains': [{
+            'id': 'synthetic',
+            'bounded_contexts': [{'id': c, 'description': f'Synthetic context {c}'} for c in ctx_ids],
+        }],
+    }
+
+
+def write_design_tree(design_dir, contexts, aggregates, **sizes):
+    """Write <design_dir>/{ctx}/aggregate-definitions.yaml + bounded-context-map.yaml."""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    '..', '..', '..', '..', 'runtime', 'tools'))
+    import yaml_io
+
+    ctx_ids = [f'context-{i:03d}' for i in range(contexts)]
+    os.makedirs(design_dir, exist_ok=True)
+    for ctx_id in ctx_ids:
+        os.makedirs(os.path.join(design_dir, ctx_id), exist_ok=True)
+        yaml_io.dump_file(synthetic_context(ctx_id, aggregates, **sizes),
+                          os.path.join(design_dir, ctx_id, 'aggregate-definitions.yaml'))
+    yaml_io.dump_file(synthetic_context_map(ctx_ids),
+                      os.path.join(design_dir, 'bounded-context-map.yaml'))
+    return ctx_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic DESIGN output tree.')
+    parser.add_argument('design_dir', metavar='design-output-dir')
+    parser.add_argument('--contexts', type=int, default=1)
+    parser.add_argument('--aggregates', type=int, default=500, help='aggregates per context')
+    parser.add_argument('--commands', type=int, default=DEFAULT_COMMANDS, help='commands per aggregate')
+    parser.add_argument('--queries', type=int, default=DEFAULT_QUERIES, help='queries per aggregate')
+    parser.add_argument('--value-objects', type=int, default=DEFAULT_VALUE_OBJECTS,
+                        help='value objects per aggregate')
+    args = parser.parse_args()
+    ctx_ids = write_design_tree(args.design_dir, args.contexts, args.aggregates,
+                                commands=args.commands, queries=args.queries,
+                                value_objects=args.value_objects)
+    print(f"Wrote {len(ctx_ids)} contexts x {args.aggregates} aggregates to {args.design_dir}")
+
+
+if __name__ == '__main__':
+    main()
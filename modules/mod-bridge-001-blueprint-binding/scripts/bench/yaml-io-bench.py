@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+yaml-io-bench.py — Pure-Python PyYAML vs runtime/tools/yaml_io (libyaml).
+
+Times the parse and emit work of the bridge tooling on a synthetic
+500-aggregate context, its generated OpenAPI spec and the real
+runtime/discovery/capability-index.yaml, and checks that yaml_io emits
+exactly the same bytes as the pure-Python dumper.
+
+Usage:
+  python3 yaml-io-bench.py [--aggregates N] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from benchlib import KB_ROOT, best_of, load_contract_gen
+from synthetic_model import synthetic_context
+
+import yaml
+import yaml_io
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pure-Python YAML vs yaml_io.')
+    parser.add_argument('--aggregates', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    model = synthetic_context('benchmark', args.aggregates)
+    model_text = yaml.dump(model, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    openapi, _ = load_contract_gen().generate_openapi('benchmark', model)
+    # Unshare the interned fragments so both dumpers see a plain tree (no aliases)
+    openapi = json.loads(json.dumps(openapi))
+    with open(os.path.join(KB_ROOT, 'runtime', 'discovery', 'capability-index.yaml')) as f:
+        index_text = f.read()
+
+    def pure_dump(data):
+        return yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+
+    if yaml_io.dump(openapi) != pure_dump(openapi) or yaml_io.dump(model) != model_text:
+        print("ERROR: yaml_io.dump output differs from pure-Python yaml.dump")
+        sys.exit(1)
+
+    cases = [
+        (f'load aggregate-definitions ({args.aggregates} aggregates)',
+         lambda: yaml.safe_load(model_text), lambda: yaml_io.load(model_text)),
+        ('load capability-index.yaml',
+         lambda: yaml.safe_load(index_text), lambda: yaml_io.load(index_text)),
+        (f'dump openapi-spec ({len(openapi["paths"])} paths)',
+         lambda: pure_dump(openapi), lambda: yaml_io.dump(openapi)),
+    ]
+
+    print(f"yaml_io backend: {'libyaml' if yaml_io.LIBYAML else 'pure-Python (libyaml not available)'}")
+    print()
+    print(f"  {'case':52} {'pure (s)':>9} {'yaml_io (s)':>12} {'speedup':>8}")
+    for name, pure, fast in cases:
+        t_pure = best_of(args.repeat, pure)
+        t_fast = best_of(args.repeat, fast)
+        print(f"  {name:52} {t_pure:9.3f} {t_fast:12.3f} {t_pure / t_fast:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,492 +4,669 @@ contract-gen.py — Generate OpenAPI 3.0 specs from DDD aggregate definitions.
 
 Part of mod-bridge-001-blueprint-binding.
 Follows policies: contract-generation.md + fusion-api-rest.ddd-bdd binding.
+Command-line front end (files, cache, workers, watch) for contract_gen.py,
+which holds the generator itself and its in-process API.
 
 Usage:
   python3 contract-gen.py <design-output-dir> <bridge-output-dir> [<context-map.yaml>]
+                          [--format yaml|json|compact-json] [--jobs N] [--stream]
+                          [--shared-components] [--no-cache] [--trace FILE]
+                          [--watch [--interval S]]
 """
 
-import yaml, os, sys, re, copy
+import os, sys, io, argparse, contextlib, hashlib, json, pickle, signal, tempfile, time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import contract_gen
+from contract_gen import COMMON_FILES, FORMATS, KB_ROOT, dump_contract, generate_openapi, stream_openapi
+
+# Shared YAML I/O (libyaml when available): <kb-root>/runtime/tools/yaml_io.py
+sys.path.insert(0, os.path.join(KB_ROOT, 'runtime', 'tools'))
+import yaml_io
+
 
 # ═══════════════════════════════════════════════════════════
-# CONFIGURATION (from binding: fusion-api-rest.ddd-bdd)
+# INCREMENTAL CACHE
 # ═══════════════════════════════════════════════════════════
 
-STATE_CHANGE_VERBS = {
-    'block', 'unblock', 'reactivate', 'pause', 'resume', 'cancel',
-    'activate', 'deactivate', 'suspend', 'approve', 'reject', 'close',
-    'archive', 'restore', 'enable', 'disable', 'lock', 'unlock'
-}
-CREATE_VERBS = {'create', 'execute', 'submit', 'register', 'initiate', 'open'}
-DELETE_VERBS = {'delete', 'remove'}
-UPDATE_VERBS = {'update', 'modify', 'edit', 'change'}
-
-# Queries that target a specific sub-resource (not the main entity)
-SUB_RESOURCE_PATTERNS = {
-    'transaction': 'transactions',
-    'movement': 'movements',
-    'history': 'history',
-    'detail': 'details',
-}
-
-# Queries that access a specific field/aspect of an entity
-FIELD_QUERY_PATTERNS = {
-    'pin': 'pin',
-    'balance': 'balance',
-    'status': 'status',
-    'summary': 'summary',
-}
-
-TYPE_MAP = {
-    'String': {'type': 'string'},
-    'string': {'type': 'string'},
-    'UUID': {'type': 'string', 'format': 'uuid'},
-    'Integer': {'type': 'integer'},
-    'int': {'type': 'integer'},
-    'Long': {'type': 'integer', 'format': 'int64'},
-    'Boolean': {'type': 'boolean'},
-    'boolean': {'type': 'boolean'},
-    'Date': {'type': 'string', 'format': 'date'},
-    'LocalDate': {'type': 'string', 'format': 'date'},
-    'DateTime': {'type': 'string', 'format': 'date-time'},
-    'Money': {'$ref': '#/components/schemas/Money'},
-    'BigDecimal': {'type': 'number'},
-    'Decimal': {'type': 'number'},
-    'Double': {'type': 'number', 'format': 'double'},
-}
-
-
-def pluralize(word):
-    """Simple English pluralization."""
-    if word.endswith('s') or word.endswith('x') or word.endswith('z'):
-        return word + 'es'
-    elif word.endswith('y') and word[-2] not in 'aeiou':
-        return word[:-1] + 'ies'
-    elif word.endswith('s'):
-        return word
-    else:
-        return word + 's'
+CACHE_FILE = '.contract-gen-cache.json'
+CACHE_VERSION = 1
 
 
-def to_camel(kebab):
-    """kebab-case to CamelCase."""
-    return ''.join(w.capitalize() for w in kebab.split('-'))
+def generator_fingerprint(fmt='yaml', shared=False):
+    """
+    Hash of everything that shapes the output besides the context inputs:
+    the output format and mode, the configuration tables, the generator
+    source (library and CLI) and the YAML emitter (yaml_io, PyYAML version,
+    libyaml or pure Python), which all shape the written bytes.
+    """
+    h = hashlib.sha256(fmt.encode())
+    if shared:
+        h.update(b'shared-components')
+    tables = {
+        'STATE_CHANGE_VERBS': sorted(contract_gen.STATE_CHANGE_VERBS),
+        'CREATE_VERBS': sorted(contract_gen.CREATE_VERBS),
+        'DELETE_VERBS': sorted(contract_gen.DELETE_VERBS),
+        'UPDATE_VERBS': sorted(contract_gen.UPDATE_VERBS),
+        'QUERY_GET_VERBS': sorted(contract_gen.QUERY_GET_VERBS),
+        'QUERY_LIST_VERBS': sorted(contract_gen.QUERY_LIST_VERBS),
+        'SUB_RESOURCE_PATTERNS': contract_gen.SUB_RESOURCE_PATTERNS,
+        'FIELD_QUERY_PATTERNS': contract_gen.FIELD_QUERY_PATTERNS,
+        'TYPE_MAP': contract_gen.TYPE_MAP,
+    }
+    h.update(json.dumps(tables, sort_keys=True).encode())
+    h.update(f"{yaml_io.yaml.__version__}:{yaml_io.LIBYAML}".encode())
+    for source in (contract_gen.__file__, yaml_io.__file__, __file__):
+        with open(os.path.abspath(source), 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def context_digest(agg_file, ctx_entry, fingerprint):
+    """Hash of one context's inputs: aggregate file + context-map entry + generator."""
+    h = hashlib.sha256(fingerprint.encode())
+    with open(agg_file, 'rb') as f:
+        h.update(f.read())
+    h.update(json.dumps(ctx_entry, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+def load_cache(output_dir, fingerprint):
+    """Return cached context entries, or {} if missing, unreadable or stale."""
+    try:
+        with open(os.path.join(output_dir, CACHE_FILE)) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != CACHE_VERSION or cache.get('generator') != fingerprint:
+        return {}
+    return cache.get('contexts', {})
+
+
+def save_cache(output_dir, fingerprint, entries):
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, CACHE_FILE)
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({'version': CACHE_VERSION, 'generator': fingerprint, 'contexts': entries},
+                  f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def cache_hit(entry, digest, out_file):
+    """A context is reusable if its inputs are unchanged and its spec is untouched."""
+    if not entry or entry.get('input') != digest:
+        return False
+    try:
+        return file_digest(out_file) == entry.get('output')
+    except OSError:
+        return False
+
+
+def count_aggregates(aggregates, counts):
+    """Pass aggregates through, tallying aggregates/commands/queries into counts."""
+    for agg in aggregates:
+        counts['aggregates'] += 1
+        counts['commands'] += len(agg.get('commands', []))
+        counts['queries'] += len(agg.get('queries', []))
+        yield agg
+
+
+def elapsed_ms(start, end=None):
+    return round(((end or time.perf_counter()) - start) * 1000, 3)
+
+
+def process_context(job):
+    """
+    Load, generate and write one bounded context.
 
+    Runs in a worker process when --jobs > 1, so everything it would print
+    (path-collision warnings and the endpoint table) is captured and returned
+    for the parent to emit in context order.
+    Returns: dict with report text, counts, per-phase timings (for --trace)
+    and the spec's digest.
+    """
+    ctx_id, agg_file, ctx_out, desc, stream, fmt = job
+    diagnostics = []
+    counts = dict.fromkeys(('aggregates', 'commands', 'queries'), 0)
+    timings = {}
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        os.makedirs(ctx_out, exist_ok=True)
+        out_file = os.path.join(ctx_out, FORMATS[fmt])
+        
+        start = time.perf_counter()
+        if stream:
+            aggregates = count_aggregates(yaml_io.iter_items(agg_file, 'aggregates'), counts)
+            with open(out_file, 'w') as f:
+                operations, n_schemas, error_codes = stream_openapi(ctx_id, aggregates, f, desc,
+                                                                    diagnostics, fmt)
+            timings['generate'] = elapsed_ms(start)
+        else:
+            agg_data = yaml_io.load_file(agg_file)
+            loaded = time.perf_counter()
+            aggregates = count_aggregates(agg_data.get('aggregates', []), counts)
+            openapi, error_codes = generate_openapi(ctx_id, {'aggregates': aggregates}, desc, diagnostics)
+            generated = time.perf_counter()
+            with open(out_file, 'w') as f:
+                dump_contract(openapi, f, fmt)
+            timings.update(load=elapsed_ms(start, loaded), generate=elapsed_ms(loaded, generated),
+                           dump=elapsed_ms(generated))
+            operations = {path: {m: endpoint.get('operationId', '') for m, endpoint in methods.items()}
+                          for path, methods in openapi['paths'].items()}
+            n_schemas = len(openapi['components']['schemas'])
+        timings['total'] = elapsed_ms(start)
+        remove_other_specs(ctx_out, out_file)
+        n_endpoints = print_report(ctx_id, operations, n_schemas, error_codes, diagnostics)
+    
+    counts.update(endpoints=n_endpoints, schemas=n_schemas, error_codes=len(error_codes),
+                  collisions=sum(d['code'] == 'GET_PATH_COLLISION' for d in diagnostics))
+    return {
+        'report': report.getvalue(),
+        'endpoints': n_endpoints,
+        'schemas': n_schemas,
+        'counts': counts,
+        'warnings': [d['message'] for d in diagnostics],
+        'timings_ms': timings,
+        'output': file_digest(out_file),
+    }
 
-def map_type(type_name):
-    """Map DDD type to OpenAPI schema."""
-    if type_name in TYPE_MAP:
-        return copy.deepcopy(TYPE_MAP[type_name])
-    if type_name.startswith('List<') or type_name.startswith('Set<'):
-        inner = type_name[type_name.index('<')+1:-1]
-        return {'type': 'array', 'items': map_type(inner)}
-    if type_name.startswith('Enum'):
-        return {'type': 'string'}
-    # Assume it's a reference to another schema
-    return {'$ref': f'#/components/schemas/{type_name}'}
 
+def print_report(ctx_id, operations, n_schemas, error_codes, diagnostics, n_shared=None):
+    """Print a context's diagnostics and endpoint table. Returns its endpoint count."""
+    for diag in diagnostics:
+        print(f"    {diag['level'].upper()}: {diag['message']}")
+    
+    n_endpoints = sum(
+        len([m for m in methods if m in ('get','post','put','delete','patch')])
+        for methods in operations.values()
+    )
+    
+    # Print endpoint details
+    shared = f" (+{n_shared} shared)" if n_shared is not None else ''
+    print(f"  {ctx_id}: {n_endpoints} endpoints, {n_schemas} schemas{shared}, {len(error_codes)} error codes")
+    for path, methods in sorted(operations.items()):
+        for m in ('get', 'post', 'put', 'delete'):
+            if m in methods:
+                print(f"    {m.upper():6} {path:50} {methods[m]}")
+    return n_endpoints
+
+
+def remove_other_specs(ctx_out, out_file, names=FORMATS.values()):
+    """Drop a spec left by a run in another --format, so consumers find one contract."""
+    for name in set(names):
+        path = os.path.join(ctx_out, name)
+        if path != out_file and os.path.exists(path):
+            os.remove(path)
+
+
+def load_context_entries(ctxmap_file):
+    """{context id: bounded-context-map.yaml entry} (descriptions etc.)."""
+    ctx_entries = {}
+    if os.path.exists(ctxmap_file):
+        ctxmap = yaml_io.load_file(ctxmap_file)
+        for sd in ctxmap.get('subdomains', []):
+            for bc in sd.get('bounded_contexts', []):
+                ctx_entries[bc['id']] = bc
+    return ctx_entries
 
-def extract_verb(command_id):
-    """Extract the verb from a command ID like 'block-card' → 'block'."""
-    return command_id.split('-')[0]
+
+def find_contexts(design_dir):
+    """Build contexts: directories with an aggregate-definitions.yaml."""
+    contexts = []
+    for entry in sorted(os.listdir(design_dir)):
+        agg_path = os.path.join(design_dir, entry, 'aggregate-definitions.yaml')
+        if os.path.isdir(os.path.join(design_dir, entry)) and os.path.exists(agg_path):
+            contexts.append(entry)
+    return contexts
 
 
-def detect_query_type(query_id, query_data, aggregate_id, id_field_name):
+def plan_contexts(contexts, design_dir, output_dir, ctx_entries, fingerprint, cache, stream, fmt):
     """
-    Classify a query and determine its path.
-    Returns: (path_suffix, params, is_paginated)
+    Split contexts into cache hits and work.
+    Returns: (entries, work) — entries holds the cache entry of every context
+    (just the input digest for those still to generate), work the
+    process_context() jobs.
     """
-    q_id = query_id.lower()
-    q_parts = q_id.split('-')
-    verb = q_parts[0]
-    
-    # Check for sub-resource patterns (e.g., list-card-transactions → /cards/{id}/transactions)
-    for pattern, sub_path in SUB_RESOURCE_PATTERNS.items():
-        if pattern in q_id:
-            return (f'/{{{id_field_name}}}/{sub_path}', 
-                    [path_param(id_field_name)], True)
-    
-    # Check for field-specific queries (e.g., retrieve-card-pin → /cards/{id}/pin)
-    for pattern, sub_path in FIELD_QUERY_PATTERNS.items():
-        if pattern in q_id and verb in ('get', 'retrieve', 'fetch', 'read'):
-            return (f'/{{{id_field_name}}}/{sub_path}',
-                    [path_param(id_field_name)], False)
-    
-    # List queries → resource root with pagination
-    if verb in ('list', 'search', 'find'):
-        return ('', [], True)
-    
-    # Get single entity → /{id}
-    if verb in ('get', 'retrieve', 'fetch', 'read'):
-        # Check if there's an ID in inputs
-        inputs = query_data.get('input', [])
-        has_id = any('id' in inp.get('name', '').lower() for inp in inputs)
-        if has_id or 'by-id' in q_id:
-            return (f'/{{{id_field_name}}}', [path_param(id_field_name)], False)
+    entries = {}
+    work = []
+    for ctx_id in contexts:
+        agg_file = os.path.join(design_dir, ctx_id, 'aggregate-definitions.yaml')
+        ctx_out = os.path.join(output_dir, ctx_id)
+        ctx_entry = ctx_entries.get(ctx_id, {})
+        digest = context_digest(agg_file, ctx_entry, fingerprint)
+        entry = cache.get(ctx_id)
+        if cache_hit(entry, digest, os.path.join(ctx_out, FORMATS[fmt])):
+            entries[ctx_id] = entry
         else:
-            # Singleton query (e.g., get-global-position) — no ID needed
-            return ('', [], False)
-    
-    # Default: treat as list
-    return ('', [], True)
+            entries[ctx_id] = {'input': digest}
+            work.append((ctx_id, agg_file, ctx_out, ctx_entry.get('description', ''), stream, fmt))
+    return entries, work
 
 
-def path_param(name):
-    return {'name': name, 'in': 'path', 'required': True, 'schema': {'type': 'string'}}
+def run_jobs(work, jobs, task=process_context):
+    """task (process_context) over work, in a process pool when jobs > 1. Returns {ctx_id: result}."""
+    work_ids = [job[0] for job in work]
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+            return dict(zip(work_ids, pool.map(task, work)))
+    return dict(zip(work_ids, map(task, work)))
 
 
-def query_param(name, required=False, type_name='string'):
-    schema = map_type(type_name) if type_name != 'string' else {'type': 'string'}
-    return {'name': name, 'in': 'query', 'required': required, 'schema': schema}
+# ═══════════════════════════════════════════════════════════
+# SHARED COMPONENTS (--shared-components)
+# ═══════════════════════════════════════════════════════════
+#
+# Two passes, because which schemas are shared depends on every context:
+# collect_context() generates a context and keeps its document in the run's
+# spool directory; once the common schemas are chosen (contract_gen.py,
+# SHARED COMPONENTS), write_shared_context() writes the context spec against
+# them. A context whose inputs and shared schemas are unchanged is not
+# loaded at all: its schema index comes from the cache.
+
+def collect_context(job):
+    """Pass 1: load and generate one context into the spool. Returns its schema index and schemas."""
+    ctx_id, agg_file, desc, spool = job
+    diagnostics = []
+    counts = dict.fromkeys(('aggregates', 'commands', 'queries'), 0)
+    start = time.perf_counter()
+    agg_data = yaml_io.load_file(agg_file)
+    loaded = time.perf_counter()
+    aggregates = count_aggregates(agg_data.get('aggregates', []), counts)
+    openapi, error_codes = generate_openapi(ctx_id, {'aggregates': aggregates}, desc, diagnostics)
+    openapi = contract_gen.shared_form(openapi, error_codes)
+    timings = {'load': elapsed_ms(start, loaded), 'generate': elapsed_ms(loaded)}
+    with open(os.path.join(spool, f'{ctx_id}.pickle'), 'wb') as f:
+        pickle.dump((openapi, error_codes, diagnostics, counts, timings), f, pickle.HIGHEST_PROTOCOL)
+    schemas = openapi['components']['schemas']
+    return {'index': contract_gen.schema_index(schemas), 'schemas': schemas}
+
+
+def write_shared_context(job):
+    """
+    Pass 2: write one context spec with its shared schemas referenced from
+    the common spec (whose schema names are `common`), checking that every
+    $ref resolves. Returns the same result as process_context().
+    """
+    ctx_id, ctx_out, fmt, spool, used, common = job
+    with open(os.path.join(spool, f'{ctx_id}.pickle'), 'rb') as f:
+        openapi, error_codes, diagnostics, counts, timings = pickle.load(f)
+    common_file = '../' + COMMON_FILES[fmt]
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        os.makedirs(ctx_out, exist_ok=True)
+        out_file = os.path.join(ctx_out, FORMATS[fmt])
+        
+        start = time.perf_counter()
+        document = contract_gen.share_components(openapi, used, common_file)
+        for ref in contract_gen.unresolved_refs(document, common_file, common):
+            # A dangling local $ref is the model's (an undefined type); a
+            # dangling shared one would be the generator's
+            diagnostics.append({
+                'level': 'warning' if ref.startswith(contract_gen.LOCAL_REF) else 'error',
+                'code': 'UNRESOLVED_REF',
+                'ref': ref,
+                'message': f"$ref '{ref}' does not resolve",
+            })
+        with open(out_file, 'w') as f:
+            dump_contract(document, f, fmt)
+        timings['dump'] = elapsed_ms(start)
+        timings['total'] = round(sum(timings.values()), 3)
+        remove_other_specs(ctx_out, out_file)
+        
+        operations = {path: {m: endpoint.get('operationId', '') for m, endpoint in methods.items()}
+                      for path, methods in document['paths'].items()}
+        n_schemas = len(document['components']['schemas'])
+        n_endpoints = print_report(ctx_id, operations, n_schemas, error_codes, diagnostics, len(used))
+    
+    counts.update(endpoints=n_endpoints, schemas=n_schemas, shared_schemas=len(used),
+                  error_codes=len(error_codes),
+                  collisions=sum(d['code'] == 'GET_PATH_COLLISION' for d in diagnostics))
+    errors = [d['message'] for d in diagnostics if d['level'] == 'error']
+    result = {
+        'report': report.getvalue(),
+        'endpoints': n_endpoints,
+        'schemas': n_schemas,
+        'counts': counts,
+        'warnings': [d['message'] for d in diagnostics],
+        'timings_ms': timings,
+    }
+    if errors:
+        result['errors'] = errors  # and no output digest: never a cache hit
+    else:
+        result['output'] = file_digest(out_file)
+    return result
+
 
+def shared_digest(used, common):
+    """Digest of the shared schemas one context references (names and definitions)."""
+    return hashlib.sha256(json.dumps(sorted((name, common[name]) for name in used)).encode()).hexdigest()
 
-def pagination_params():
-    return [
-        {'name': 'page', 'in': 'query', 'required': False, 'schema': {'type': 'integer', 'default': 0}},
-        {'name': 'size', 'in': 'query', 'required': False, 'schema': {'type': 'integer', 'default': 20}},
-    ]
+
+def load_common(path):
+    """Schemas of the common spec a previous run left, or {} (best effort)."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        if path.endswith('.json'):
+            with open(path) as f:
+                document = json.load(f)
+        else:
+            document = yaml_io.load_file(path)
+        return document['components']['schemas']
+    except Exception:
+        return {}
 
 
-def build_entity_schema(entities, value_objects):
-    """Build OpenAPI schemas from entities and value objects."""
-    schemas = {}
+def run_shared(contexts, design_dir, output_dir, ctx_entries, fingerprint, cache, fmt, jobs):
+    """
+    Generate every context in `contexts` against one common spec, reusing the
+    cache entries of unchanged contexts.
+    Returns: (entries, results, common, problems) — the cache entry of every
+    context, the process_context()-style results of the contexts written in
+    this run, the schema names in the common spec and its unresolved $refs.
+    """
+    entries = {}
+    indexes = {}
+    inputs = {}
+    load = []
+    for ctx_id in contexts:
+        agg_file = os.path.join(design_dir, ctx_id, 'aggregate-definitions.yaml')
+        ctx_entry = ctx_entries.get(ctx_id, {})
+        digest = context_digest(agg_file, ctx_entry, fingerprint)
+        inputs[ctx_id] = (agg_file, ctx_entry.get('description', ''))
+        entry = cache.get(ctx_id)
+        if entry and entry.get('input') == digest and 'index' in entry:
+            entries[ctx_id] = entry
+            indexes[ctx_id] = entry['index']
+        else:
+            entries[ctx_id] = {'input': digest}
+            load.append(ctx_id)
     
-    for entity in entities:
-        name = entity.get('name', to_camel(entity.get('id', 'Unknown')))
-        props = {}
-        required = []
+    common_path = os.path.join(output_dir, COMMON_FILES[fmt])
+    with tempfile.TemporaryDirectory(prefix='contract-gen-') as spool:
+        def collect(ids):
+            loaded = run_jobs([(ctx_id,) + inputs[ctx_id] + (spool,) for ctx_id in ids], jobs,
+                              collect_context)
+            for ctx_id, result in loaded.items():
+                indexes[ctx_id] = result['index']
+            return loaded
         
-        # Identity field
-        identity = entity.get('identity', {})
-        if identity:
-            id_name = identity.get('field', 'id')
-            props[id_name] = map_type(identity.get('type', 'String'))
-            if identity.get('description'):
-                props[id_name]['description'] = identity['description']
+        loaded = collect(load)
+        common = contract_gen.select_common(indexes)
+        used = {ctx_id: contract_gen.shared_names(indexes[ctx_id], common) for ctx_id in contexts}
+        names = set().union(*used.values())
         
-        # Attributes
-        for attr in entity.get('attributes', []):
-            attr_name = attr['name']
-            prop = map_type(attr.get('type', 'String'))
-            if attr.get('description'):
-                prop['description'] = attr['description']
-            props[attr_name] = prop
-            if attr.get('required', False):
-                required.append(attr_name)
+        # Unchanged contexts whose shared schemas changed (or whose spec was
+        # touched) are written again
+        stale = [ctx_id for ctx_id in contexts if ctx_id not in loaded and not (
+            entries[ctx_id].get('shared') == shared_digest(used[ctx_id], common)
+            and cache_hit(entries[ctx_id], entries[ctx_id]['input'],
+                          os.path.join(output_dir, ctx_id, FORMATS[fmt])))]
+        loaded.update(collect(stale))
+        write = [ctx_id for ctx_id in contexts if ctx_id in loaded]
         
-        schema = {'type': 'object', 'properties': props}
-        if required:
-            schema['required'] = required
-        schemas[name] = schema
-    
-    for vo in value_objects:
-        name = vo.get('name', to_camel(vo.get('id', 'Unknown')))
-        props = {}
-        for attr in vo.get('attributes', vo.get('fields', [])):
-            attr_name = attr['name']
-            type_name = attr.get('type', 'String')
-            prop = map_type(type_name)
-            if attr.get('description'):
-                prop['description'] = attr['description']
-            if attr.get('constraints'):
-                # Enum constraints
-                values = [v.strip() for v in attr['constraints'].split(',')]
-                prop = {'type': 'string', 'enum': values}
-            props[attr_name] = prop
+        # Definitions for the common spec: from the contexts loaded in this
+        # run, then from the previous common spec, then by loading a context
+        # that defines each schema still missing
+        content = {}
+        for ctx_id, result in loaded.items():
+            for name in used[ctx_id]:
+                content.setdefault(name, result['schemas'][name])
+        missing = names - content.keys()
+        if missing:
+            previous = load_common(common_path)
+            for name in sorted(missing):
+                if name in previous and contract_gen.schema_digest(previous[name]) == common[name]:
+                    content[name] = previous[name]
+            missing = names - content.keys()
+        extra = []
+        for ctx_id in contexts:
+            if missing & used[ctx_id] and ctx_id not in loaded:
+                extra.append(ctx_id)
+                missing -= used[ctx_id]
+        for ctx_id, result in collect(extra).items():
+            for name in used[ctx_id]:
+                content.setdefault(name, result['schemas'][name])
         
-        if props:
-            schemas[name] = {'type': 'object', 'properties': props}
+        results = run_jobs([(ctx_id, os.path.join(output_dir, ctx_id), fmt, spool, used[ctx_id], names)
+                            for ctx_id in write], jobs, write_shared_context)
     
-    return schemas
+    for ctx_id, result in results.items():
+        result.update(index=indexes[ctx_id], shared=shared_digest(used[ctx_id], common))
+    
+    document = contract_gen.common_document(content)
+    text = dump_contract(document, fmt=fmt)
+    try:
+        with open(common_path) as f:
+            unchanged = f.read() == text
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(common_path, 'w') as f:
+            f.write(text)
+    remove_other_specs(output_dir, common_path, COMMON_FILES.values())
+    return entries, results, names, contract_gen.unresolved_refs(document)
 
 
-def generate_openapi(ctx_id, agg_data, ctx_description=''):
-    """Generate OpenAPI spec for one bounded context."""
-    
-    paths = {}
-    schemas = {}
-    error_codes = []
+# ═══════════════════════════════════════════════════════════
+# TRACE (runtime/schemas/trace/contract-gen-trace.schema.json)
+# ═══════════════════════════════════════════════════════════
+
+def build_trace(contexts, entries, timings, started, duration_ms, config, common=None):
+    """
+    Trace document for one run. timings holds the per-phase timings of the
+    contexts regenerated in this run; every other context was a cache hit.
+    common: the schema names in the common spec (--shared-components only).
+    """
+    trace_contexts = []
+    for ctx_id in contexts:
+        entry = entries[ctx_id]
+        item = {
+            'context': ctx_id,
+            'cache': 'DISABLED' if not config['cache'] else 'MISS' if ctx_id in timings else 'HIT',
+            'output': f"{ctx_id}/{FORMATS[config['format']]}",
+        }
+        if ctx_id in timings:
+            item['timings_ms'] = timings[ctx_id]
+        item['counts'] = entry.get('counts', {'endpoints': entry['endpoints'], 'schemas': entry['schemas']})
+        item['warnings'] = entry.get('warnings', [])
+        trace_contexts.append(item)
     
-    for agg in agg_data.get('aggregates', []):
-        agg_id = agg['id']
-        agg_name = agg.get('name', to_camel(agg_id))
-        
-        # Determine resource path
-        resource_word = agg_id  # e.g., "card", "periodic-transfer"
-        resource_plural = pluralize(resource_word)
-        base_path = f'/{resource_plural}'
-        
-        # Find root entity and its ID field
-        root_entity_id = agg.get('root_entity', None)
-        entities = agg.get('entities', [])
-        root_entity = None
-        for e in entities:
-            if e.get('is_root') or e.get('id') == root_entity_id:
-                root_entity = e
-                break
-        if not root_entity and entities:
-            root_entity = entities[0]
-        
-        # Determine ID field name
-        id_field_name = f'{agg_id}Id'
-        if root_entity:
-            identity = root_entity.get('identity', {})
-            if identity.get('field'):
-                id_field_name = identity['field']
-        
-        entity_schema_name = root_entity.get('name', agg_name) if root_entity else agg_name
-        
-        # Build schemas from entities and VOs
-        entity_schemas = build_entity_schema(entities, agg.get('value_objects', []))
-        schemas.update(entity_schemas)
-        
-        # ─── COMMANDS → ENDPOINTS ───
-        for cmd in agg.get('commands', []):
-            cmd_id = cmd['id']
-            cmd_name = cmd.get('name', to_camel(cmd_id))
-            verb = extract_verb(cmd_id)
-            description = cmd.get('description', '')[:120]
-            
-            # Build request schema from inputs
-            req_props = {}
-            req_required = []
-            for inp in cmd.get('input', []):
-                inp_name = inp['name']
-                # Skip the entity ID for state-change commands (it goes in path)
-                if verb in STATE_CHANGE_VERBS and inp_name == id_field_name:
-                    continue
-                prop = map_type(inp.get('type', 'String'))
-                if inp.get('description'):
-                    prop['description'] = inp['description']
-                req_props[inp_name] = prop
-                if inp.get('required', True):
-                    req_required.append(inp_name)
-            
-            if verb in CREATE_VERBS:
-                path = base_path
-                method = 'post'
-                responses = {
-                    '201': {
-                        'description': f'{entity_schema_name} created',
-                        'content': {'application/json': {'schema': {'$ref': f'#/components/schemas/{entity_schema_name}'}}}
-                    },
-                    '400': {
-                        'description': 'Validation or business rule error',
-                        'content': {'application/json': {'schema': {'$ref': '#/components/schemas/ErrorResponse'}}}
-                    }
-                }
-                endpoint = {
-                    'operationId': cmd_id,
-                    'summary': description or f'Create {entity_schema_name}',
-                    'tags': [agg_name],
-                    'responses': responses
-                }
-                if req_props:
-                    req_schema_name = f'{cmd_name}Request'
-                    schemas[req_schema_name] = {'type': 'object', 'properties': req_props}
-                    if req_required:
-                        schemas[req_schema_name]['required'] = req_required
-                    endpoint['requestBody'] = {
-                        'required': True,
-                        'content': {'application/json': {'schema': {'$ref': f'#/components/schemas/{req_schema_name}'}}}
-                    }
-                paths.setdefault(path, {})[method] = endpoint
-                
-            elif verb in STATE_CHANGE_VERBS:
-                action = verb
-                path = f'{base_path}/{{{id_field_name}}}/{action}'
-                method = 'post'
-                endpoint = {
-                    'operationId': cmd_id,
-                    'summary': description or f'{verb.title()} {entity_schema_name}',
-                    'tags': [agg_name],
-                    'parameters': [path_param(id_field_name)],
-                    'responses': {
-                        '200': {
-                            'description': f'{entity_schema_name} {action}ed',
-                            'content': {'application/json': {'schema': {'$ref': f'#/components/schemas/{entity_schema_name}'}}}
-                        },
-                        '400': {
-                            'description': 'Business rule violation',
-                            'content': {'application/json': {'schema': {'$ref': '#/components/schemas/ErrorResponse'}}}
-                        },
-                        '404': {
-                            'description': f'{entity_schema_name} not found',
-                            'content': {'application/json': {'schema': {'$ref': '#/components/schemas/ErrorResponse'}}}
-                        }
-                    }
-                }
-                if req_props:
-                    req_schema_name = f'{cmd_name}Request'
-                    schemas[req_schema_name] = {'type': 'object', 'properties': req_props}
-                    endpoint['requestBody'] = {
-                        'required': True,
-                        'content': {'application/json': {'schema': {'$ref': f'#/components/schemas/{req_schema_name}'}}}
-                    }
-                paths.setdefault(path, {})[method] = endpoint
-                
-            elif verb in DELETE_VERBS:
-                path = f'{base_path}/{{{id_field_name}}}'
-                method = 'delete'
-                endpoint = {
-                    'operationId': cmd_id,
-                    'summary': description or f'Delete {entity_schema_name}',
-                    'tags': [agg_name],
-                    'parameters': [path_param(id_field_name)],
-                    'responses': {
-                        '204': {'description': 'Deleted'},
-                        '404': {
-                            'description': 'Not found',
-                            'content': {'application/json': {'schema': {'$ref': '#/components/schemas/ErrorResponse'}}}
-                        }
-                    }
-                }
-                paths.setdefault(path, {})[method] = endpoint
-        
-        # ─── QUERIES → ENDPOINTS ───
-        for q in agg.get('queries', []):
-            q_id = q['id']
-            q_name = q.get('name', to_camel(q_id))
-            description = q.get('description', '')[:120]
-            
-            suffix, params, is_paginated = detect_query_type(
-                q_id, q, agg_id, id_field_name
-            )
-            
-            path = base_path + suffix
-            
-            # Add query input params (excluding IDs already in path)
-            path_param_names = {p['name'] for p in params}
-            for inp in q.get('input', []):
-                if inp['name'] not in path_param_names:
-                    params.append(query_param(
-                        inp['name'], 
-                        required=inp.get('required', False),
-                        type_name=inp.get('type', 'string')
-                    ))
-            
-            if is_paginated:
-                params.extend(pagination_params())
-            
-            # Response schema
-            if is_paginated:
-                response_schema = {'$ref': '#/components/schemas/PagedResponse'}
-            else:
-                response_schema = {'$ref': f'#/components/schemas/{entity_schema_name}'}
-            
-            endpoint = {
-                'operationId': q_id,
-                'summary': description or q_name,
-                'tags': [agg_name],
-                'responses': {
-                    '200': {
-                        'description': description or 'Success',
-                        'content': {'application/json': {'schema': response_schema}}
-                    }
-                }
-            }
-            if params:
-                endpoint['parameters'] = params
-            
-            # Add 404 for single-entity queries (not lists)
-            if not is_paginated and suffix and '{' in suffix:
-                endpoint['responses']['404'] = {
-                    'description': 'Not found',
-                    'content': {'application/json': {'schema': {'$ref': '#/components/schemas/ErrorResponse'}}}
-                }
-            
-            # Handle path collision: if GET already exists on this path
-            if path in paths and 'get' in paths[path]:
-                existing = paths[path]['get']
-                # Keep the one that's more specific (has path params or is a list)
-                # If both are different queries on same path, need disambiguation
-                print(f"    WARNING: GET path collision on {path}: "
-                      f"{existing['operationId']} vs {q_id}. Keeping both as separate paths.")
-                # Add distinguishing suffix
-                if suffix == '':
-                    # This is the base path — make it unique by appending query purpose
-                    alt_suffix = '/' + q_id.split('-')[-1]  # e.g., /summary, /total
-                    path = base_path + alt_suffix
-            
-            paths.setdefault(path, {})['get'] = endpoint
-        
-        # ─── ERROR CODES from invariants ───
-        for inv in agg.get('invariants', []):
-            if inv.get('enforced_by') == 'query-validation':
-                continue
-            code = inv['id'].upper().replace('-', '_')
-            error_codes.append(code)
+    def total(key):
+        return sum(c['counts'].get(key, 0) for c in trace_contexts)
     
-    # ─── STANDARD SCHEMAS ───
-    schemas['Money'] = {
-        'type': 'object',
-        'properties': {
-            'amount': {'type': 'number', 'description': 'Monetary amount'},
-            'currency': {'type': 'string', 'description': 'ISO 4217 currency code'}
-        },
-        'required': ['amount', 'currency']
+    slowest = sorted(timings, key=lambda c: timings[c]['total'], reverse=True)[:10]
+    summary = {
+        'total_contexts': len(contexts),
+        'regenerated': len(timings),
+        'cache_hits': len(contexts) - len(timings),
+        'total_endpoints': total('endpoints'),
+        'total_schemas': total('schemas'),
+        'total_commands': total('commands'),
+        'total_queries': total('queries'),
+        'total_collisions': total('collisions'),
+        'total_duration_ms': round(duration_ms),
+        'slowest_contexts': slowest,
     }
-    schemas['ErrorResponse'] = {
-        'type': 'object',
-        'required': ['code', 'message'],
-        'properties': {
-            'code': {
-                'type': 'string',
-                'description': 'Error code. Possible values: ' + ', '.join(sorted(error_codes)) if error_codes else 'Error code'
-            },
-            'message': {'type': 'string', 'description': 'Human-readable error description'}
-        }
-    }
-    schemas['PagedResponse'] = {
-        'type': 'object',
-        'properties': {
-            'content': {'type': 'array', 'items': {'type': 'object'}},
-            'page': {'type': 'integer'},
-            'size': {'type': 'integer'},
-            'totalElements': {'type': 'integer'},
-            'totalPages': {'type': 'integer'}
-        }
-    }
-    
-    # ─── ASSEMBLE ───
-    openapi = {
-        'openapi': '3.0.3',
-        'info': {
-            'title': f'{ctx_id.replace("-", " ").title()} API',
-            'description': ctx_description,
-            'version': '1.0.0'
-        },
-        'paths': dict(sorted(paths.items())),
-        'components': {'schemas': dict(sorted(schemas.items()))}
+    if common is not None:
+        summary['common_schemas'] = len(common)
+    return {
+        'version': '1.0',
+        'run_id': started.strftime('%Y%m%d_%H%M%S'),
+        'started_at': started.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'completed_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'config': config,
+        'contexts': trace_contexts,
+        'summary': summary,
     }
-    
-    return openapi, error_codes
+
+
+def write_trace(path, trace):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(trace, f, indent=2)
+        f.write('\n')
+
+
+# ═══════════════════════════════════════════════════════════
+# WATCH MODE
+# ═══════════════════════════════════════════════════════════
+
+def input_stamps(design_dir, ctxmap_file):
+    """
+    (mtime, size) of every generator input, keyed by context id
+    (None for the context map). Cheap enough to take on every poll.
+    """
+    stamps = {}
+    for ctx_id in find_contexts(design_dir):
+        st = os.stat(os.path.join(design_dir, ctx_id, 'aggregate-definitions.yaml'))
+        stamps[ctx_id] = (st.st_mtime_ns, st.st_size)
+    try:
+        st = os.stat(ctxmap_file)
+        stamps[None] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass
+    return stamps
+
+
+def watch(design_dir, output_dir, ctxmap_file, fingerprint, ctx_entries, entries, stream, fmt,
+          interval, stamps, shared=False):
+    """
+    Poll the design output dir and regenerate only the contexts whose inputs
+    changed, until interrupted. The context map, the per-context digests and
+    reports stay in memory between changes; a context-map edit re-plans every
+    context, but only those whose entry actually changed are regenerated.
+    With shared, every change re-plans all contexts against the common spec
+    (run_shared() still loads only the changed ones and those whose shared
+    schemas moved).
+
+    stamps are the input_stamps() taken before the initial generation, so an
+    edit saved while it ran is picked up by the first poll. A pass that fails
+    on I/O is retried on the next poll; the contexts of a pass that fails on
+    their content are regenerated again with the next change.
+    """
+    print(f"\n  WATCH: {design_dir} (every {interval:g}s, Ctrl-C to stop)")
+    sys.stdout.flush()
+    # Stop cleanly under a supervisor too
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    pending = set()
+    try:
+        while True:
+            time.sleep(interval)
+            try:
+                current = input_stamps(design_dir, ctxmap_file)
+            except OSError:
+                continue  # a file vanished mid-scan (editor save); retry next poll
+            if current == stamps:
+                continue
+            changed = {k for k in current.keys() | stamps.keys() if current.get(k) != stamps.get(k)}
+            changed |= pending
+            
+            start = time.perf_counter()
+            for ctx_id in set(entries) - set(current):
+                del entries[ctx_id]
+            problems = []
+            try:
+                if None in changed:
+                    ctx_entries = load_context_entries(ctxmap_file)
+                    changed = set(current)
+                contexts = sorted(k for k in changed if k in current and k is not None)
+                if shared:
+                    planned, results, _, problems = run_shared(
+                        sorted(k for k in current if k is not None), design_dir, output_dir,
+                        ctx_entries, fingerprint, entries, fmt, 1)
+                    entries.clear()
+                else:
+                    planned, work = plan_contexts(contexts, design_dir, output_dir, ctx_entries,
+                                                  fingerprint, entries, stream, fmt)
+                    results = run_jobs(work, 1)
+            except OSError as e:
+                # stamps stay put, so the next poll retries the same change
+                print(f"  [{time.strftime('%H:%M:%S')}] skipped: {e}")
+                continue
+            except Exception as e:
+                # Half-edited YAML and the like: report and keep watching
+                print(f"  [{time.strftime('%H:%M:%S')}] ERROR: {type(e).__name__}: {e}")
+                stamps, pending = current, changed
+                continue
+            finally:
+                sys.stdout.flush()
+            stamps, pending = current, set()
+            for ctx_id, result in results.items():
+                del result['timings_ms']
+                planned[ctx_id].update(result)
+            entries.update(planned)
+            save_cache(output_dir, fingerprint, entries)
+            
+            elapsed = (time.perf_counter() - start) * 1000
+            if results:
+                print(f"  [{time.strftime('%H:%M:%S')}] regenerated {', '.join(results)} ({elapsed:.0f} ms)")
+                for result in results.values():
+                    sys.stdout.write(result['report'])
+            for ref in problems:
+                print(f"  ERROR: {COMMON_FILES[fmt]}: $ref '{ref}' does not resolve")
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        print("\n  WATCH: stopped")
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: contract-gen.py <design-output-dir> <bridge-output-dir> [context-map.yaml]")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description='Generate OpenAPI 3.0 specs from DDD aggregate definitions.')
+    parser.add_argument('design_dir', metavar='design-output-dir')
+    parser.add_argument('output_dir', metavar='bridge-output-dir')
+    parser.add_argument('ctxmap_file', metavar='context-map.yaml', nargs='?',
+                        help='default: <design-output-dir>/bounded-context-map.yaml')
+    parser.add_argument('--format', choices=list(FORMATS), default='yaml',
+                        help='spec format: yaml (openapi-spec.yaml, default), json or '
+                             'compact-json (canonical: sorted keys, no whitespace; '
+                             'both openapi-spec.json)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='worker processes for per-context generation '
+                             '(0 = one per CPU, default: 1 = serial)')
+    parser.add_argument('--stream', action='store_true',
+                        help='write each spec entry by entry through a disk spool '
+                             '(bounded memory for very large contexts)')
+    parser.add_argument('--shared-components', action='store_true',
+                        help='move the schemas several contexts define identically '
+                             '(and ErrorResponse, Money, PagedResponse) into one '
+                             'common-components spec referenced from each context spec')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'regenerate every context, ignoring {CACHE_FILE}')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='write per-context timings and counters as JSON '
+                             '(runtime/schemas/trace/contract-gen-trace.schema.json)')
+    parser.add_argument('--watch', action='store_true',
+                        help='after generating, stay running and regenerate each context '
+                             'as its inputs change')
+    parser.add_argument('--interval', type=float, default=0.25,
+                        help='--watch polling interval in seconds (default: 0.25)')
+    args = parser.parse_args()
+    if args.stream and args.shared_components:
+        parser.error('--stream and --shared-components cannot be combined')
     
-    design_dir = sys.argv[1]
-    output_dir = sys.argv[2]
-    ctxmap_file = sys.argv[3] if len(sys.argv) > 3 else os.path.join(design_dir, 'bounded-context-map.yaml')
+    design_dir = args.design_dir
+    output_dir = args.output_dir
+    ctxmap_file = args.ctxmap_file or os.path.join(design_dir, 'bounded-context-map.yaml')
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    started = datetime.now(timezone.utc)
+    run_start = time.perf_counter()
     
-    # Load context map for descriptions
-    ctx_descriptions = {}
-    if os.path.exists(ctxmap_file):
-        with open(ctxmap_file) as f:
-            ctxmap = yaml.safe_load(f)
-        for sd in ctxmap.get('subdomains', []):
-            for bc in sd.get('bounded_contexts', []):
-                ctx_descriptions[bc['id']] = bc.get('description', '')
+    # Taken before any input is read, so --watch sees edits saved during this run
+    stamps = input_stamps(design_dir, ctxmap_file) if args.watch else None
     
-    # Find all build contexts (directories with aggregate-definitions.yaml)
-    contexts = []
-    for entry in sorted(os.listdir(design_dir)):
-        agg_path = os.path.join(design_dir, entry, 'aggregate-definitions.yaml')
-        if os.path.isdir(os.path.join(design_dir, entry)) and os.path.exists(agg_path):
-            contexts.append(entry)
+    # Load context map for descriptions
+    ctx_entries = load_context_entries(ctxmap_file)
+    contexts = find_contexts(design_dir)
     
     print(f"Contract generation for {len(contexts)} contexts")
     print()
@@ -497,37 +674,53 @@ def main():
     total_endpoints = 0
     total_schemas = 0
     
+    fingerprint = generator_fingerprint(args.format, args.shared_components)
+    cache = {} if args.no_cache else load_cache(output_dir, fingerprint)
+    common = None
+    problems = []
+    if args.shared_components:
+        entries, results, common, problems = run_shared(contexts, design_dir, output_dir, ctx_entries,
+                                                        fingerprint, cache, args.format, jobs)
+    else:
+        entries, work = plan_contexts(contexts, design_dir, output_dir, ctx_entries,
+                                      fingerprint, cache, args.stream, args.format)
+        # Results are consumed in context order regardless of completion order,
+        # so the summary is identical to a serial run.
+        results = run_jobs(work, jobs)
+        remove_other_specs(output_dir, None, COMMON_FILES.values())
+    timings = {ctx_id: result.pop('timings_ms') for ctx_id, result in results.items()}
+    
     for ctx_id in contexts:
-        agg_file = os.path.join(design_dir, ctx_id, 'aggregate-definitions.yaml')
-        with open(agg_file) as f:
-            agg_data = yaml.safe_load(f)
-        
-        ctx_out = os.path.join(output_dir, ctx_id)
-        os.makedirs(ctx_out, exist_ok=True)
-        
-        desc = ctx_descriptions.get(ctx_id, '')
-        openapi, error_codes = generate_openapi(ctx_id, agg_data, desc)
-        
-        out_file = os.path.join(ctx_out, 'openapi-spec.yaml')
-        with open(out_file, 'w') as f:
-            yaml.dump(openapi, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
-        
-        n_endpoints = sum(
-            len([m for m in methods if m in ('get','post','put','delete','patch')])
-            for methods in openapi['paths'].values()
-        )
-        n_schemas = len(openapi['components']['schemas'])
-        total_endpoints += n_endpoints
-        total_schemas += n_schemas
-        
-        # Print endpoint details
-        print(f"  {ctx_id}: {n_endpoints} endpoints, {n_schemas} schemas, {len(error_codes)} error codes")
-        for path, methods in sorted(openapi['paths'].items()):
-            for m in ('get', 'post', 'put', 'delete'):
-                if m in methods:
-                    print(f"    {m.upper():6} {path:50} {methods[m].get('operationId','')}")
+        if ctx_id in results:
+            entries[ctx_id].update(results[ctx_id])
+        entry = entries[ctx_id]
+        sys.stdout.write(entry['report'])
+        total_endpoints += entry['endpoints']
+        total_schemas += entry['schemas']
+    
+    save_cache(output_dir, fingerprint, entries)
     
     print(f"\n  TOTAL: {total_endpoints} endpoints, {total_schemas} schemas across {len(contexts)} contexts")
+    if common is not None:
+        print(f"  SHARED: {len(common)} schemas in {COMMON_FILES[args.format]}")
+        for ref in problems:
+            print(f"  ERROR: {COMMON_FILES[args.format]}: $ref '{ref}' does not resolve")
+    if not args.no_cache:
+        print(f"  CACHE: {len(results)} regenerated, {len(contexts) - len(results)} unchanged")
+    
+    if args.trace:
+        config = {'design_dir': design_dir, 'output_dir': output_dir, 'format': args.format,
+                  'jobs': jobs, 'stream': args.stream, 'cache': not args.no_cache,
+                  'shared_components': args.shared_components}
+        write_trace(args.trace, build_trace(contexts, entries, timings, started,
+                                            elapsed_ms(run_start), config, common))
+    
+    failed = problems or any(entries[ctx_id].get('errors') for ctx_id in contexts)
+    if args.watch:
+        watch(design_dir, output_dir, ctxmap_file, fingerprint, ctx_entries, entries,
+              args.stream, args.format, args.interval, stamps, args.shared_components)
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == '__main__':
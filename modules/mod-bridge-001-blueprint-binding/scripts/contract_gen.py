@@ -0,0 +1,1085 @@
+#!/usr/bin/env python3
+"""
+contract_gen.py — OpenAPI 3.0 contract generation from DDD aggregate definitions.
+
+Part of mod-bridge-001-blueprint-binding.
+Follows policies: contract-generation.md + fusion-api-rest.ddd-bdd binding.
+
+Importable core of contract-gen.py, for pipelines that already hold the
+parsed aggregate definitions and want the contract in-process:
+
+  sys.path.insert(0, '<kb-root>/modules/mod-bridge-001-blueprint-binding/scripts')
+  import contract_gen
+  result = contract_gen.generate_contract('customer-core', agg_data)
+  result.openapi, result.error_codes, result.diagnostics
+
+Importing it loads no YAML library and does no I/O; yaml_io is only imported
+by the functions that emit YAML (dump_contract, stream_openapi).
+
+Specs can be written as YAML (the default), indented JSON, or compact
+canonical JSON (sorted keys, no whitespace) for machine-to-machine handoff;
+see FORMATS.
+
+For multi-context runs the schemas every context would repeat (Money,
+ErrorResponse, PagedResponse, value objects defined identically by several
+contexts) can be moved to one shared spec that the context specs reference
+externally; see SHARED COMPONENTS.
+"""
+
+import os, sys, re, json, hashlib, collections
+
+KB_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+# Shared YAML I/O (libyaml when available): <kb-root>/runtime/tools/yaml_io.py
+YAML_IO_DIR = os.path.join(KB_ROOT, 'runtime', 'tools')
+
+
+def _yaml_io():
+    if YAML_IO_DIR not in sys.path:
+        sys.path.insert(0, YAML_IO_DIR)
+    import yaml_io
+    return yaml_io
+
+
+# Output format -> spec file name
+FORMATS = {
+    'yaml': 'openapi-spec.yaml',
+    'json': 'openapi-spec.json',
+    'compact-json': 'openapi-spec.json',
+}
+
+# json.dump() options per JSON format (C encoder; UTF-8 text, not \u escapes)
+JSON_OPTIONS = {
+    'json': {'indent': 2, 'ensure_ascii': False},
+    'compact-json': {'separators': (',', ':'), 'sort_keys': True, 'ensure_ascii': False},
+}
+
+
+# ═══════════════════════════════════════════════════════════
+# CONFIGURATION (from binding: fusion-api-rest.ddd-bdd)
+# ═══════════════════════════════════════════════════════════
+
+STATE_CHANGE_VERBS = {
+    'block', 'unblock', 'reactivate', 'pause', 'resume', 'cancel',
+    'activate', 'deactivate', 'suspend', 'approve', 'reject', 'close',
+    'archive', 'restore', 'enable', 'disable', 'lock', 'unlock'
+}
+CREATE_VERBS = {'create', 'execute', 'submit', 'register', 'initiate', 'open'}
+DELETE_VERBS = {'delete', 'remove'}
+UPDATE_VERBS = {'update', 'modify', 'edit', 'change'}
+
+# Query verbs: single-entity reads vs collection reads
+QUERY_GET_VERBS = {'get', 'retrieve', 'fetch', 'read'}
+QUERY_LIST_VERBS = {'list', 'search', 'find'}
+
+# Queries that target a specific sub-resource (not the main entity)
+SUB_RESOURCE_PATTERNS = {
+    'transaction': 'transactions',
+    'movement': 'movements',
+    'history': 'history',
+    'detail': 'details',
+}
+
+# Queries that access a specific field/aspect of an entity
+FIELD_QUERY_PATTERNS = {
+    'pin': 'pin',
+    'balance': 'balance',
+    'status': 'status',
+    'summary': 'summary',
+}
+
+TYPE_MAP = {
+    'String': {'type': 'string'},
+    'string': {'type': 'string'},
+    'UUID': {'type': 'string', 'format': 'uuid'},
+    'Integer': {'type': 'integer'},
+    'int': {'type': 'integer'},
+    'Long': {'type': 'integer', 'format': 'int64'},
+    'Boolean': {'type': 'boolean'},
+    'boolean': {'type': 'boolean'},
+    'Date': {'type': 'string', 'format': 'date'},
+    'LocalDate': {'type': 'string', 'format': 'date'},
+    'DateTime': {'type': 'string', 'format': 'date-time'},
+    'Money': {'$ref': '#/components/schemas/Money'},
+    'BigDecimal': {'type': 'number'},
+    'Decimal': {'type': 'number'},
+    'Double': {'type': 'number', 'format': 'double'},
+}
+
+
+# ═══════════════════════════════════════════════════════════
+# COMPILED ROUTING TABLES
+# ═══════════════════════════════════════════════════════════
+
+class PatternIndex:
+    """
+    Substring lookup over an ordered sequence of (pattern, value) entries.
+
+    first_match(text) returns the same entry as scanning the entries in order
+    with `pattern in text`, in a single pass over text: the patterns are
+    compiled into one trie-shaped regex that reports the longest pattern
+    starting at each position. Every other pattern starting there is a
+    prefix of that one, so a rank lookup on those prefixes finds the
+    earliest table entry without visiting the rest of the table.
+
+    Tables with fewer than SCAN_LIMIT entries (the shipped ones) are scanned
+    in order instead: below that size the plain `in` loop is faster than
+    the regex pass.
+    """
+
+    SCAN_LIMIT = 48
+    
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self.scan = self.probe = None
+        if len(self.entries) < self.SCAN_LIMIT:
+            return
+        self.rank = {}
+        for i, (pattern, _) in enumerate(self.entries):
+            self.rank.setdefault(pattern, i)
+        self.lengths = sorted({len(pattern) for pattern in self.rank})
+        trie = {}
+        for pattern in self.rank:
+            node = trie
+            for ch in pattern:
+                node = node.setdefault(ch, {})
+            node[None] = True
+        trie_pattern = self._trie_pattern(trie)
+        # probe: cheap "any pattern at all?" test; scan: longest pattern at every position
+        self.probe = re.compile(trie_pattern)
+        self.scan = re.compile(f'(?=({trie_pattern}))')
+    
+    @classmethod
+    def _trie_pattern(cls, node):
+        branches = [re.escape(ch) + cls._trie_pattern(child)
+                    for ch, child in sorted((k, v) for k, v in node.items() if k is not None)]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional: prefer the longer pattern when this node also ends one
+        return f'(?:{body})?' if None in node else body
+    
+    def first_match(self, text):
+        """Return (pattern, value) of the earliest table entry found in text, or None."""
+        if self.probe is None:
+            for entry in self.entries:
+                if entry[0] in text:
+                    return entry
+            return None
+        first = self.probe.search(text)
+        if first is None:
+            return None
+        rank = self.rank
+        best = len(self.entries)
+        for m in self.scan.finditer(text, first.start()):
+            longest = m.group(1)
+            for length in self.lengths:
+                if length > len(longest):
+                    break
+                r = rank.get(longest[:length])
+                if r is not None and r < best:
+                    if r == 0:
+                        return self.entries[0]
+                    best = r
+        return self.entries[best] if best < len(self.entries) else None
+
+
+def compile_routing_tables():
+    """
+    Build the lookup structures derived from the configuration tables.
+    Runs at import; call again after modifying the tables at runtime.
+    """
+    global COMMAND_ROUTES, QUERY_ROUTES, QUERY_PATTERN_INDEX
+    # Later assignments win, so apply in reverse precedence order
+    COMMAND_ROUTES = {}
+    for route, verbs in (('delete', DELETE_VERBS), ('state-change', STATE_CHANGE_VERBS),
+                         ('create', CREATE_VERBS)):
+        COMMAND_ROUTES.update(dict.fromkeys(verbs, route))
+    QUERY_ROUTES = {}
+    for route, verbs in (('get', QUERY_GET_VERBS), ('list', QUERY_LIST_VERBS)):
+        QUERY_ROUTES.update(dict.fromkeys(verbs, route))
+    # One index for both tables; sub-resource entries rank first, so a field
+    # entry is only returned when no sub-resource pattern occurs in the id
+    QUERY_PATTERN_INDEX = PatternIndex(
+        [(p, ('sub-resource', sub_path)) for p, sub_path in SUB_RESOURCE_PATTERNS.items()] +
+        [(p, ('field', sub_path)) for p, sub_path in FIELD_QUERY_PATTERNS.items()])
+
+
+compile_routing_tables()
+
+
+def pluralize(word):
+    """Simple English pluralization."""
+    if word.endswith('s') or word.endswith('x') or word.endswith('z'):
+        return word + 'es'
+    elif word.endswith('y') and word[-2] not in 'aeiou':
+        return word[:-1] + 'ies'
+    elif word.endswith('s'):
+        return word
+    else:
+        return word + 's'
+
+
+def to_camel(kebab):
+    """kebab-case to CamelCase."""
+    return ''.join(w.capitalize() for w in kebab.split('-'))
+
+
+# ─── Shared schema fragments ───
+# map_type(), schema_ref(), json_content(), path_param() and the constants
+# below hand out the same object on every call instead of a fresh copy.
+# Treat them as read-only: copy before changing (with_description()).
+# Contracts are dumped with aliases=False, so sharing never shows in the YAML.
+
+STRING_SCHEMA = {'type': 'string'}
+_SCHEMA_REFS = {}
+_JSON_CONTENT = {}
+_PATH_PARAMS = {}
+
+
+def schema_ref(name):
+    """Interned {'$ref': '#/components/schemas/<name>'}."""
+    ref = _SCHEMA_REFS.get(name)
+    if ref is None:
+        ref = _SCHEMA_REFS[name] = {'$ref': f'#/components/schemas/{name}'}
+    return ref
+
+
+def json_content(schema_name):
+    """Interned application/json content block referencing a component schema."""
+    content = _JSON_CONTENT.get(schema_name)
+    if content is None:
+        content = _JSON_CONTENT[schema_name] = {'application/json': {'schema': schema_ref(schema_name)}}
+    return content
+
+
+def with_description(schema, description):
+    """Copy of a shared schema with its description set."""
+    return dict(schema, description=description)
+
+
+def map_type(type_name):
+    """Map DDD type to OpenAPI schema (shared; see with_description())."""
+    if type_name in TYPE_MAP:
+        return TYPE_MAP[type_name]
+    if type_name.startswith('List<') or type_name.startswith('Set<'):
+        inner = type_name[type_name.index('<')+1:-1]
+        return {'type': 'array', 'items': map_type(inner)}
+    if type_name.startswith('Enum'):
+        return STRING_SCHEMA
+    # Assume it's a reference to another schema
+    return schema_ref(type_name)
+
+
+def extract_verb(command_id):
+    """Extract the verb from a command ID like 'block-card' → 'block'."""
+    return command_id.split('-')[0]
+
+
+def detect_query_type(query_id, query_data, aggregate_id, id_field_name):
+    """
+    Classify a query and determine its path.
+    Returns: (path_suffix, params, is_paginated)
+    """
+    q_id = query_id.lower()
+    verb = q_id.split('-', 1)[0]
+    route = QUERY_ROUTES.get(verb)
+    
+    match = QUERY_PATTERN_INDEX.first_match(q_id)
+    kind, sub_path = match[1] if match else (None, None)
+    
+    # Check for sub-resource patterns (e.g., list-card-transactions → /cards/{id}/transactions)
+    if kind == 'sub-resource':
+        return (f'/{{{id_field_name}}}/{sub_path}', 
+                [path_param(id_field_name)], True)
+    
+    # Check for field-specific queries (e.g., retrieve-card-pin → /cards/{id}/pin)
+    if kind == 'field' and route == 'get':
+        return (f'/{{{id_field_name}}}/{sub_path}',
+                [path_param(id_field_name)], False)
+    
+    # List queries → resource root with pagination
+    if route == 'list':
+        return ('', [], True)
+    
+    # Get single entity → /{id}
+    if route == 'get':
+        # Check if there's an ID in inputs
+        inputs = query_data.get('input', [])
+        has_id = any('id' in inp.get('name', '').lower() for inp in inputs)
+        if has_id or 'by-id' in q_id:
+            return (f'/{{{id_field_name}}}', [path_param(id_field_name)], False)
+        else:
+            # Singleton query (e.g., get-global-position) — no ID needed
+            return ('', [], False)
+    
+    # Default: treat as list
+    return ('', [], True)
+
+
+def path_param(name):
+    param = _PATH_PARAMS.get(name)
+    if param is None:
+        param = _PATH_PARAMS[name] = {'name': name, 'in': 'path', 'required': True, 'schema': STRING_SCHEMA}
+    return param
+
+
+def query_param(name, required=False, type_name='string'):
+    schema = map_type(type_name) if type_name != 'string' else STRING_SCHEMA
+    return {'name': name, 'in': 'query', 'required': required, 'schema': schema}
+
+
+PAGINATION_PARAMS = (
+    {'name': 'page', 'in': 'query', 'required': False, 'schema': {'type': 'integer', 'default': 0}},
+    {'name': 'size', 'in': 'query', 'required': False, 'schema': {'type': 'integer', 'default': 20}},
+)
+
+
+def pagination_params():
+    return PAGINATION_PARAMS
+
+
+def build_entity_schema(entities, value_objects):
+    """Build OpenAPI schemas from entities and value objects."""
+    schemas = {}
+    
+    for entity in entities:
+        name = entity.get('name', to_camel(entity.get('id', 'Unknown')))
+        props = {}
+        required = []
+        
+        # Identity field
+        identity = entity.get('identity', {})
+        if identity:
+            id_name = identity.get('field', 'id')
+            props[id_name] = map_type(identity.get('type', 'String'))
+            if identity.get('description'):
+                props[id_name] = with_description(props[id_name], identity['description'])
+        
+        # Attributes
+        for attr in entity.get('attributes', []):
+            attr_name = attr['name']
+            prop = map_type(attr.get('type', 'String'))
+            if attr.get('description'):
+                prop = with_description(prop, attr['description'])
+            props[attr_name] = prop
+            if attr.get('required', False):
+                required.append(attr_name)
+        
+        schema = {'type': 'object', 'properties': props}
+        if required:
+            schema['required'] = required
+        schemas[name] = schema
+    
+    for vo in value_objects:
+        name = vo.get('name', to_camel(vo.get('id', 'Unknown')))
+        props = {}
+        for attr in vo.get('attributes', vo.get('fields', [])):
+            attr_name = attr['name']
+            type_name = attr.get('type', 'String')
+            prop = map_type(type_name)
+            if attr.get('description'):
+                prop = with_description(prop, attr['description'])
+            if attr.get('constraints'):
+                # Enum constraints
+                values = [v.strip() for v in attr['constraints'].split(',')]
+                prop = {'type': 'string', 'enum': values}
+            props[attr_name] = prop
+        
+        if props:
+            schemas[name] = {'type': 'object', 'properties': props}
+    
+    return schemas
+
+
+def build_contract(aggregates, contract, diagnostics=None):
+    """
+    Translate one bounded context's aggregates (any iterable) into operations
+    and schemas, adding them to contract (a ContractBuilder or ContractSpool).
+    Warnings are appended to diagnostics (a list) when one is given.
+    Returns the error codes derived from invariants.
+    """
+    
+    error_codes = []
+    if diagnostics is None:
+        diagnostics = []
+    
+    for agg in aggregates:
+        agg_id = agg['id']
+        agg_name = agg.get('name', to_camel(agg_id))
+        
+        # Determine resource path
+        resource_word = agg_id  # e.g., "card", "periodic-transfer"
+        resource_plural = pluralize(resource_word)
+        base_path = f'/{resource_plural}'
+        
+        # Find root entity and its ID field
+        root_entity_id = agg.get('root_entity', None)
+        entities = agg.get('entities', [])
+        root_entity = None
+        for e in entities:
+            if e.get('is_root') or e.get('id') == root_entity_id:
+                root_entity = e
+                break
+        if not root_entity and entities:
+            root_entity = entities[0]
+        
+        # Determine ID field name
+        id_field_name = f'{agg_id}Id'
+        if root_entity:
+            identity = root_entity.get('identity', {})
+            if identity.get('field'):
+                id_field_name = identity['field']
+        
+        entity_schema_name = root_entity.get('name', agg_name) if root_entity else agg_name
+        
+        # Build schemas from entities and VOs
+        entity_schemas = build_entity_schema(entities, agg.get('value_objects', []))
+        for name, schema in entity_schemas.items():
+            contract.add_schema(name, schema)
+        
+        # ─── COMMANDS → ENDPOINTS ───
+        for cmd in agg.get('commands', []):
+            cmd_id = cmd['id']
+            cmd_name = cmd.get('name', to_camel(cmd_id))
+            verb = extract_verb(cmd_id)
+            route = COMMAND_ROUTES.get(verb)
+            description = cmd.get('description', '')[:120]
+            
+            # Build request schema from inputs
+            req_props = {}
+            req_required = []
+            for inp in cmd.get('input', []):
+                inp_name = inp['name']
+                # Skip the entity ID for state-change commands (it goes in path)
+                if verb in STATE_CHANGE_VERBS and inp_name == id_field_name:
+                    continue
+                prop = map_type(inp.get('type', 'String'))
+                if inp.get('description'):
+                    prop = with_description(prop, inp['description'])
+                req_props[inp_name] = prop
+                if inp.get('required', True):
+                    req_required.append(inp_name)
+            
+            if route == 'create':
+                path = base_path
+                method = 'post'
+                responses = {
+                    '201': {
+                        'description': f'{entity_schema_name} created',
+                        'content': json_content(entity_schema_name)
+                    },
+                    '400': {
+                        'description': 'Validation or business rule error',
+                        'content': json_content('ErrorResponse')
+                    }
+                }
+                endpoint = {
+                    'operationId': cmd_id,
+                    'summary': description or f'Create {entity_schema_name}',
+                    'tags': [agg_name],
+                    'responses': responses
+                }
+                if req_props:
+                    req_schema_name = f'{cmd_name}Request'
+                    req_schema = {'type': 'object', 'properties': req_props}
+                    if req_required:
+                        req_schema['required'] = req_required
+                    contract.add_schema(req_schema_name, req_schema)
+                    endpoint['requestBody'] = {
+                        'required': True,
+                        'content': json_content(req_schema_name)
+                    }
+                contract.add_operation(path, method, endpoint)
+                
+            elif route == 'state-change':
+                action = verb
+                path = f'{base_path}/{{{id_field_name}}}/{action}'
+                method = 'post'
+                endpoint = {
+                    'operationId': cmd_id,
+                    'summary': description or f'{verb.title()} {entity_schema_name}',
+                    'tags': [agg_name],
+                    'parameters': [path_param(id_field_name)],
+                    'responses': {
+                        '200': {
+                            'description': f'{entity_schema_name} {action}ed',
+                            'content': json_content(entity_schema_name)
+                        },
+                        '400': {
+                            'description': 'Business rule violation',
+                            'content': json_content('ErrorResponse')
+                        },
+                        '404': {
+                            'description': f'{entity_schema_name} not found',
+                            'content': json_content('ErrorResponse')
+                        }
+                    }
+                }
+                if req_props:
+                    req_schema_name = f'{cmd_name}Request'
+                    contract.add_schema(req_schema_name, {'type': 'object', 'properties': req_props})
+                    endpoint['requestBody'] = {
+                        'required': True,
+                        'content': json_content(req_schema_name)
+                    }
+                contract.add_operation(path, method, endpoint)
+                
+            elif route == 'delete':
+                path = f'{base_path}/{{{id_field_name}}}'
+                method = 'delete'
+                endpoint = {
+                    'operationId': cmd_id,
+                    'summary': description or f'Delete {entity_schema_name}',
+                    'tags': [agg_name],
+                    'parameters': [path_param(id_field_name)],
+                    'responses': {
+                        '204': {'description': 'Deleted'},
+                        '404': {
+                            'description': 'Not found',
+                            'content': json_content('ErrorResponse')
+                        }
+                    }
+                }
+                contract.add_operation(path, method, endpoint)
+        
+        # ─── QUERIES → ENDPOINTS ───
+        for q in agg.get('queries', []):
+            q_id = q['id']
+            q_name = q.get('name', to_camel(q_id))
+            description = q.get('description', '')[:120]
+            
+            suffix, params, is_paginated = detect_query_type(
+                q_id, q, agg_id, id_field_name
+            )
+            
+            path = base_path + suffix
+            
+            # Add query input params (excluding IDs already in path)
+            path_param_names = {p['name'] for p in params}
+            for inp in q.get('input', []):
+                if inp['name'] not in path_param_names:
+                    params.append(query_param(
+                        inp['name'], 
+                        required=inp.get('required', False),
+                        type_name=inp.get('type', 'string')
+                    ))
+            
+            if is_paginated:
+                params.extend(pagination_params())
+            
+            endpoint = {
+                'operationId': q_id,
+                'summary': description or q_name,
+                'tags': [agg_name],
+                'responses': {
+                    '200': {
+                        'description': description or 'Success',
+                        'content': json_content('PagedResponse' if is_paginated else entity_schema_name)
+                    }
+                }
+            }
+            if params:
+                endpoint['parameters'] = params
+            
+            # Add 404 for single-entity queries (not lists)
+            if not is_paginated and suffix and '{' in suffix:
+                endpoint['responses']['404'] = {
+                    'description': 'Not found',
+                    'content': json_content('ErrorResponse')
+                }
+            
+            # Handle path collision: if GET already exists on this path
+            if contract.has_operation(path, 'get'):
+                existing_id = contract.operation_id(path, 'get')
+                # Keep the one that's more specific (has path params or is a list)
+                # If both are different queries on same path, need disambiguation
+                diagnostics.append({
+                    'level': 'warning',
+                    'code': 'GET_PATH_COLLISION',
+                    'aggregate': agg_id,
+                    'path': path,
+                    'operationId': q_id,
+                    'existingOperationId': existing_id,
+                    'message': f"GET path collision on {path}: "
+                               f"{existing_id} vs {q_id}. Keeping both as separate paths.",
+                })
+                # Add distinguishing suffix
+                if suffix == '':
+                    # This is the base path — make it unique by appending query purpose
+                    alt_suffix = '/' + q_id.split('-')[-1]  # e.g., /summary, /total
+                    path = base_path + alt_suffix
+            
+            contract.add_operation(path, 'get', endpoint)
+        
+        # ─── ERROR CODES from invariants ───
+        for inv in agg.get('invariants', []):
+            if inv.get('enforced_by') == 'query-validation':
+                continue
+            code = inv['id'].upper().replace('-', '_')
+            error_codes.append(code)
+    
+    # ─── STANDARD SCHEMAS ───
+    for name, schema in standard_schemas(error_codes).items():
+        contract.add_schema(name, schema)
+    
+    return error_codes
+
+
+MONEY_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'amount': {'type': 'number', 'description': 'Monetary amount'},
+        'currency': {'type': 'string', 'description': 'ISO 4217 currency code'}
+    },
+    'required': ['amount', 'currency']
+}
+PAGED_RESPONSE_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'content': {'type': 'array', 'items': {'type': 'object'}},
+        'page': {'type': 'integer'},
+        'size': {'type': 'integer'},
+        'totalElements': {'type': 'integer'},
+        'totalPages': {'type': 'integer'}
+    }
+}
+
+
+def standard_schemas(error_codes):
+    """Money, ErrorResponse and PagedResponse, added to every contract."""
+    schemas = {}
+    schemas['Money'] = MONEY_SCHEMA
+    schemas['ErrorResponse'] = {
+        'type': 'object',
+        'required': ['code', 'message'],
+        'properties': {
+            'code': {
+                'type': 'string',
+                'description': 'Error code. Possible values: ' + ', '.join(sorted(error_codes)) if error_codes else 'Error code'
+            },
+            'message': {'type': 'string', 'description': 'Human-readable error description'}
+        }
+    }
+    schemas['PagedResponse'] = PAGED_RESPONSE_SCHEMA
+    return schemas
+
+
+def contract_info(ctx_id, ctx_description=''):
+    return {
+        'title': f'{ctx_id.replace("-", " ").title()} API',
+        'description': ctx_description,
+        'version': '1.0.0'
+    }
+
+
+class ContractBuilder:
+    """In-memory contract: the OpenAPI document is assembled as one dict."""
+    
+    def __init__(self):
+        self.paths = {}
+        self.schemas = {}
+    
+    def add_operation(self, path, method, endpoint):
+        self.paths.setdefault(path, {})[method] = endpoint
+    
+    def has_operation(self, path, method):
+        return method in self.paths.get(path, {})
+    
+    def operation_id(self, path, method):
+        return self.paths[path][method]['operationId']
+    
+    def add_schema(self, name, schema):
+        self.schemas[name] = schema
+    
+    def openapi(self, ctx_id, ctx_description=''):
+        return {
+            'openapi': '3.0.3',
+            'info': contract_info(ctx_id, ctx_description),
+            'paths': dict(sorted(self.paths.items())),
+            'components': {'schemas': dict(sorted(self.schemas.items()))}
+        }
+
+
+class ContractSpool:
+    """
+    Streaming contract for large contexts.
+
+    Each operation and schema is pickled to a temporary file as soon as it is
+    built; only an index of names, offsets and operationIds stays in memory.
+    write_yaml() / write_json() then emit the document entry by entry in
+    sorted order, so neither the full document tree nor its serialised form
+    is ever held at once. Output is byte-identical to dumping
+    ContractBuilder.openapi() with dump_contract().
+    (pickle and tempfile are imported here, not at module level, to keep
+    importing contract_gen cheap.)
+    """
+    
+    def __init__(self):
+        import tempfile
+        self.spool = tempfile.TemporaryFile()
+        self.paths = {}      # path -> {method: (offset, size, operationId)}
+        self.schemas = {}    # name -> (offset, size)
+    
+    def close(self):
+        self.spool.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _spill(self, obj):
+        import pickle
+        data = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+        self.spool.seek(0, os.SEEK_END)
+        offset = self.spool.tell()
+        self.spool.write(data)
+        return offset, len(data)
+    
+    def _load(self, offset, size):
+        import pickle
+        self.spool.seek(offset)
+        return pickle.loads(self.spool.read(size))
+    
+    def add_operation(self, path, method, endpoint):
+        self.paths.setdefault(path, {})[method] = self._spill(endpoint) + (endpoint['operationId'],)
+    
+    def has_operation(self, path, method):
+        return method in self.paths.get(path, {})
+    
+    def operation_id(self, path, method):
+        return self.paths[path][method][2]
+    
+    def add_schema(self, name, schema):
+        self.schemas[name] = self._spill(schema)
+    
+    def operation_ids(self):
+        """{path: {method: operationId}}, sorted by path."""
+        return {path: {m: ref[2] for m, ref in methods.items()}
+                for path, methods in sorted(self.paths.items())}
+    
+    def write(self, stream, ctx_id, ctx_description='', fmt='yaml'):
+        if fmt == 'yaml':
+            self.write_yaml(stream, ctx_id, ctx_description)
+        else:
+            self.write_json(stream, ctx_id, ctx_description, JSON_OPTIONS[fmt])
+    
+    def write_json(self, stream, ctx_id, ctx_description='', options=JSON_OPTIONS['json']):
+        paths = _Members((path, {m: self._load(offset, size) for m, (offset, size, _) in self.paths[path].items()})
+                         for path in sorted(self.paths))
+        schemas = _Members((name, self._load(*self.schemas[name])) for name in sorted(self.schemas))
+        document = {
+            'openapi': '3.0.3',
+            'info': contract_info(ctx_id, ctx_description),
+            'paths': paths,
+            'components': {'schemas': schemas},
+        }
+        _write_json(stream, document, options)
+        stream.write('\n')
+    
+    def write_yaml(self, stream, ctx_id, ctx_description=''):
+        yaml_io = _yaml_io()
+        yaml_io.dump({'openapi': '3.0.3', 'info': contract_info(ctx_id, ctx_description)}, stream)
+        # Each entry is dumped inside its real parent keys so that indentation
+        # and line folding match a whole-document dump; the parent lines are
+        # then dropped.
+        if not self.paths:
+            yaml_io.dump({'paths': {}}, stream)
+        else:
+            stream.write('paths:\n')
+            for path in sorted(self.paths):
+                item = {m: self._load(offset, size)
+                        for m, (offset, size, _) in self.paths[path].items()}
+                stream.write(yaml_io.dump({'paths': {path: item}}, aliases=False).split('\n', 1)[1])
+        if not self.schemas:
+            yaml_io.dump({'components': {'schemas': {}}}, stream)
+        else:
+            stream.write('components:\n  schemas:\n')
+            for name in sorted(self.schemas):
+                text = yaml_io.dump({'components': {'schemas': {name: self._load(*self.schemas[name])}}}, aliases=False)
+                stream.write(text.split('\n', 2)[2])
+
+
+class _Members:
+    """Mapping entries produced lazily as (key, value) pairs, in output order."""
+    
+    def __init__(self, items):
+        self.items = items
+
+
+def _write_json(stream, value, options, depth=0):
+    """
+    json.dump(value, stream, **options), except that _Members are written
+    one entry at a time. Output is byte-identical to dumping the whole tree.
+    """
+    indent = options.get('indent')
+    if isinstance(value, _Members):
+        items = value.items
+    elif isinstance(value, dict) and any(isinstance(v, (_Members, dict)) for v in value.values()):
+        items = sorted(value.items()) if options.get('sort_keys') else value.items()
+    else:
+        text = json.dumps(value, **options)
+        stream.write(text.replace('\n', '\n' + ' ' * (indent * depth)) if indent and depth else text)
+        return
+    empty = True
+    stream.write('{')
+    for key, item in items:
+        if not empty:
+            stream.write(',')
+        if indent:
+            stream.write('\n' + ' ' * (indent * (depth + 1)))
+        stream.write(json.dumps(key, ensure_ascii=False) + (': ' if indent else ':'))
+        _write_json(stream, item, options, depth + 1)
+        empty = False
+    if indent and not empty:
+        stream.write('\n' + ' ' * (indent * depth))
+    stream.write('}')
+
+
+def generate_openapi(ctx_id, agg_data, ctx_description='', diagnostics=None):
+    """Generate OpenAPI spec for one bounded context."""
+    contract = ContractBuilder()
+    error_codes = build_contract(agg_data.get('aggregates', []), contract, diagnostics)
+    return contract.openapi(ctx_id, ctx_description), error_codes
+
+
+def stream_openapi(ctx_id, aggregates, stream, ctx_description='', diagnostics=None, fmt='yaml'):
+    """
+    Generate OpenAPI spec for one bounded context straight to a text stream,
+    in output format `fmt` (see FORMATS).
+    With aggregates read lazily (yaml_io.iter_items), memory is bounded by
+    the largest aggregate plus a small per-path/schema index, not by the
+    size of the context.
+    Returns: (operation_ids, n_schemas, error_codes)
+    """
+    with ContractSpool() as contract:
+        error_codes = build_contract(aggregates, contract, diagnostics)
+        contract.write(stream, ctx_id, ctx_description, fmt)
+        return contract.operation_ids(), len(contract.schemas), error_codes
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED COMPONENTS (contract-gen.py --shared-components)
+# ═══════════════════════════════════════════════════════════
+#
+# A run writes one common spec next to the context directories; each context
+# spec references the schemas it shares as
+# '../common-components.yaml#/components/schemas/<Name>'. The standard
+# schemas are always shared, any other schema when two or more contexts
+# define it identically. A context only takes a schema from the common spec
+# when its own definition matches and everything it references is shared
+# too, so the common spec resolves on its own.
+
+# Output format -> common spec file name (in the bridge output dir)
+COMMON_FILES = {
+    'yaml': 'common-components.yaml',
+    'json': 'common-components.json',
+    'compact-json': 'common-components.json',
+}
+STANDARD_SCHEMAS = ('ErrorResponse', 'Money', 'PagedResponse')
+LOCAL_REF = '#/components/schemas/'
+
+# ErrorResponse as shared: the context's codes move to info.x-error-codes
+SHARED_ERROR_RESPONSE = {
+    'type': 'object',
+    'required': ['code', 'message'],
+    'properties': {
+        'code': {'type': 'string', 'description': 'Error code. Possible values: info.x-error-codes of the context spec'},
+        'message': {'type': 'string', 'description': 'Human-readable error description'}
+    }
+}
+
+
+def shared_form(openapi, error_codes):
+    """
+    A context document with ErrorResponse in its shared (context-independent)
+    form and the context's error codes under info.x-error-codes.
+    """
+    info = dict(openapi['info'])
+    if error_codes:
+        info['x-error-codes'] = sorted(error_codes)
+    schemas = dict(openapi['components']['schemas'], ErrorResponse=SHARED_ERROR_RESPONSE)
+    return dict(openapi, info=info, components=dict(openapi['components'], schemas=schemas))
+
+
+def schema_digest(schema):
+    return hashlib.sha256(json.dumps(schema, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+
+def schema_refs(value, refs=None):
+    """Names of the component schemas a fragment references locally."""
+    if refs is None:
+        refs = set()
+    if isinstance(value, dict):
+        ref = value.get('$ref')
+        if isinstance(ref, str) and ref.startswith(LOCAL_REF):
+            refs.add(ref[len(LOCAL_REF):])
+        for item in value.values():
+            schema_refs(item, refs)
+    elif isinstance(value, list):
+        for item in value:
+            schema_refs(item, refs)
+    return refs
+
+
+def schema_index(schemas):
+    """{name: [digest, sorted local refs]} of one context's component schemas."""
+    return {name: [schema_digest(schema), sorted(schema_refs(schema))] for name, schema in schemas.items()}
+
+
+def select_common(indexes):
+    """
+    Shared definition of each schema, from every context's schema_index():
+    {name: digest} for the standard schemas and for schemas two or more
+    contexts define identically (the most frequent definition when contexts
+    disagree; ties go to the smallest digest).
+    """
+    counts = collections.Counter()
+    for index in indexes.values():
+        for name, (digest, _) in index.items():
+            counts[name, digest] += 1
+    best = {}
+    for (name, digest), n in counts.items():
+        if n >= 2 or name in STANDARD_SCHEMAS:
+            if name not in best or (-n, digest) < best[name]:
+                best[name] = (-n, digest)
+    return {name: digest for name, (_, digest) in best.items()}
+
+
+def shared_names(index, common):
+    """
+    Schemas one context takes from the common spec: its definition matches
+    the shared one and every schema it references is taken from there too.
+    """
+    used = {name for name, (digest, _) in index.items() if common.get(name) == digest}
+    changed = True
+    while changed:
+        changed = False
+        for name in sorted(used):
+            if any(ref not in used for ref in index[name][1]):
+                used.discard(name)
+                changed = True
+    return used
+
+
+def share_components(openapi, used, common_file):
+    """
+    A context document (in shared_form()) with the `used` schemas removed and
+    every reference to them pointing into common_file instead. Unchanged
+    fragments are kept, not copied.
+    """
+    refs = {name: {'$ref': f'{common_file}{LOCAL_REF}{name}'} for name in used}
+    
+    def rewrite(value):
+        if isinstance(value, dict):
+            ref = value.get('$ref')
+            if isinstance(ref, str) and ref.startswith(LOCAL_REF) and ref[len(LOCAL_REF):] in refs:
+                return refs[ref[len(LOCAL_REF):]]
+            out = None
+            for key, item in value.items():
+                new = rewrite(item)
+                if new is not item:
+                    if out is None:
+                        out = dict(value)
+                    out[key] = new
+            return value if out is None else out
+        if isinstance(value, list):
+            new = [rewrite(item) for item in value]
+            return value if all(a is b for a, b in zip(new, value)) else new
+        return value
+    
+    schemas = {name: rewrite(schema) for name, schema in openapi['components']['schemas'].items()
+               if name not in used}
+    document = {'openapi': openapi['openapi'], 'info': openapi['info']}
+    if used:
+        document['x-shared-components'] = common_file
+    document['paths'] = rewrite(openapi['paths'])
+    document['components'] = dict(openapi['components'], schemas=schemas)
+    return document
+
+
+def common_document(schemas):
+    """The common spec: the shared schemas and no paths."""
+    return {
+        'openapi': '3.0.3',
+        'info': {
+            'title': 'Common Components',
+            'description': 'Schemas shared by the context specs of this contract generation run',
+            'version': '1.0.0'
+        },
+        'paths': {},
+        'components': {'schemas': dict(sorted(schemas.items()))}
+    }
+
+
+def unresolved_refs(document, common_file=None, common=()):
+    """
+    Sorted $ref targets of a spec that do not resolve: local ones against its
+    own component schemas, references into common_file against `common`
+    (the schema names of the common spec), and any other external reference.
+    """
+    local = document.get('components', {}).get('schemas', {})
+    external = f'{common_file}{LOCAL_REF}' if common_file else None
+    bad = set()
+    stack = [document]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            ref = value.get('$ref')
+            if isinstance(ref, str):
+                if ref.startswith(LOCAL_REF):
+                    if ref[len(LOCAL_REF):] not in local:
+                        bad.add(ref)
+                elif not (external and ref.startswith(external) and ref[len(external):] in common):
+                    bad.add(ref)
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return sorted(bad)
+
+
+# ═══════════════════════════════════════════════════════════
+# PUBLIC API
+# ═══════════════════════════════════════════════════════════
+
+ContractResult = collections.namedtuple('ContractResult', 'openapi error_codes diagnostics')
+
+
+def generate_contract(ctx_id, aggregates, ctx_description='', log=None):
+    """
+    Generate one bounded context's contract in-process.
+
+    aggregates: parsed aggregate-definitions.yaml (a dict with 'aggregates')
+                or the aggregate list itself.
+    log:        optional callable (e.g. print) given one line per warning;
+                nothing is printed otherwise.
+    Returns: ContractResult(openapi, error_codes, diagnostics), where
+    diagnostics is a list of dicts with level, code and message keys.
+
+    The returned document shares read-only fragments with the generator
+    (see map_type()): copy.deepcopy() it before modifying it in place, and
+    serialise it with dump_contract() or yaml_io.dump(..., aliases=False).
+    """
+    if isinstance(aggregates, dict):
+        aggregates = aggregates.get('aggregates', [])
+    diagnostics = []
+    contract = ContractBuilder()
+    error_codes = build_contract(aggregates, contract, diagnostics)
+    if log:
+        for diag in diagnostics:
+            log(f"{diag['level'].upper()}: {diag['message']}")
+    return ContractResult(contract.openapi(ctx_id, ctx_description), error_codes, diagnostics)
+
+
+def dump_contract(openapi, stream=None, fmt='yaml'):
+    """
+    Serialise a generated contract exactly as contract-gen.py --format fmt
+    writes it. Returns the text when stream is None.
+    """
+    if fmt == 'yaml':
+        return _yaml_io().dump(openapi, stream, aliases=False)
+    text = json.dumps(openapi, **JSON_OPTIONS[fmt]) + '\n'
+    if stream is None:
+        return text
+    stream.write(text)
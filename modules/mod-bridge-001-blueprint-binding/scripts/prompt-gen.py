@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+prompt-gen.py — Assemble the CODE prompt (prompt.md) of every build context.
+
+Part of mod-bridge-001-blueprint-binding.
+Follows policy: prompt-assembly.md; template: templates/prompt.md.tpl.
+Command-line front end (files, cache, workers) for prompt_gen.py, which holds
+the template engine and the prompt data derivation.
+
+Runs after contract-gen.py (step 4b) and capability inference (step 4c):
+reads aggregate-definitions.yaml, *.feature and scenario-tracing.yaml from
+the design output and openapi-spec.* and manifest.yaml from the bridge
+output, and writes <bridge-output-dir>/<context>/prompt.md.
+
+Usage:
+  python3 prompt-gen.py <design-output-dir> <bridge-output-dir> [<context-map.yaml>]
+                        [--template FILE] [--jobs N] [--no-cache]
+"""
+
+import os, sys, io, argparse, contextlib, glob, hashlib, json
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import contract_gen
+import prompt_gen
+from contract_gen import FORMATS, KB_ROOT
+
+# Shared YAML I/O (libyaml when available): <kb-root>/runtime/tools/yaml_io.py
+sys.path.insert(0, os.path.join(KB_ROOT, 'runtime', 'tools'))
+import yaml_io
+
+
+# ═══════════════════════════════════════════════════════════
+# INCREMENTAL CACHE
+# ═══════════════════════════════════════════════════════════
+
+CACHE_FILE = '.prompt-gen-cache.json'
+CACHE_VERSION = 1
+PROMPT_FILE = 'prompt.md'
+
+
+def generator_fingerprint(template_text):
+    """
+    Hash of everything that shapes a prompt besides the context inputs: the
+    template and the assembler source (the endpoint summary also depends on
+    contract_gen).
+    """
+    h = hashlib.sha256(template_text.encode())
+    for source in (prompt_gen.__file__, contract_gen.__file__, __file__):
+        with open(os.path.abspath(source), 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def context_digest(inputs, ctx_entry, relationships, fingerprint):
+    """Hash of one context's inputs: every input file (name and bytes) + its context-map data."""
+    h = hashlib.sha256(fingerprint.encode())
+    for path in inputs:
+        h.update(os.path.basename(path).encode() + b'\0')
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    h.update(json.dumps([ctx_entry, relationships], sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+def load_cache(output_dir, fingerprint):
+    """Return cached context entries, or {} if missing, unreadable or stale."""
+    try:
+        with open(os.path.join(output_dir, CACHE_FILE)) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != CACHE_VERSION or cache.get('generator') != fingerprint:
+        return {}
+    return cache.get('contexts', {})
+
+
+def save_cache(output_dir, fingerprint, entries):
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, CACHE_FILE)
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({'version': CACHE_VERSION, 'generator': fingerprint, 'contexts': entries},
+                  f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def cache_hit(entry, digest, out_file):
+    """A context is reusable if its inputs are unchanged and its prompt is untouched."""
+    if not entry or entry.get('input') != digest:
+        return False
+    try:
+        return file_digest(out_file) == entry.get('output')
+    except OSError:
+        return False
+
+
+# ═══════════════════════════════════════════════════════════
+# PER-CONTEXT ASSEMBLY
+# ═══════════════════════════════════════════════════════════
+
+def context_inputs(design_dir, output_dir, ctx_id):
+    """
+    Input files of one context, in digest order.
+    Returns: (files, missing) — files is a dict of role -> path (features a
+    list), missing the required bridge inputs not found.
+    """
+    ctx_design = os.path.join(design_dir, ctx_id)
+    ctx_out = os.path.join(output_dir, ctx_id)
+    files = {
+        'aggregates': os.path.join(ctx_design, 'aggregate-definitions.yaml'),
+        'features': sorted(glob.glob(os.path.join(ctx_design, '*.feature'))),
+        'tracing': os.path.join(ctx_design, 'scenario-tracing.yaml'),
+        'contract': next((os.path.join(ctx_out, name) for name in dict.fromkeys(FORMATS.values())
+                          if os.path.exists(os.path.join(ctx_out, name))), None),
+        'manifest': os.path.join(ctx_out, 'manifest.yaml'),
+    }
+    if not os.path.exists(files['tracing']):
+        files['tracing'] = None
+    missing = []
+    if files['contract'] is None:
+        missing.append('openapi-spec.yaml (run contract-gen.py first)')
+    if not os.path.exists(files['manifest']):
+        missing.append('manifest.yaml (step 4c)')
+    if not files['features']:
+        missing.append('*.feature')
+    return files, missing
+
+
+def input_paths(files):
+    paths = [files['aggregates']] + files['features']
+    paths += [files[role] for role in ('tracing', 'contract', 'manifest') if files[role]]
+    return paths
+
+
+def render_context(job):
+    """
+    Load one context's inputs (each parsed once) and write its prompt.md.
+
+    Runs in a worker process when --jobs > 1, so the report is captured and
+    returned for the parent to emit in context order.
+    Returns: dict with report text, counts and the prompt's digest.
+    """
+    ctx_id, files, ctx_entry, relationships, template, ctx_out = job
+    agg_data = yaml_io.load_file(files['aggregates'])
+    manifest = yaml_io.load_file(files['manifest'])
+    features = []
+    for path in files['features']:
+        with open(path) as f:
+            features.append(f.read())
+    tracing = None
+    if files['tracing']:
+        with open(files['tracing']) as f:
+            tracing = f.read()
+
+    data = prompt_gen.prompt_data(ctx_id, agg_data, features, manifest, ctx_entry, relationships,
+                                  contract_file=os.path.basename(files['contract']))
+    text = prompt_gen.assemble_prompt(template, data, tracing)
+    out_file = os.path.join(ctx_out, PROMPT_FILE)
+    with open(out_file, 'w') as f:
+        f.write(text)
+
+    tokens = prompt_gen.estimate_tokens(text)
+    counts = {
+        'endpoints': len(data['endpoints']),
+        'scenarios': prompt_gen.count_scenarios(features),
+        'capabilities': len(data['capabilities']),
+        'tokens': tokens,
+    }
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        tracing_note = ' + scenario tracing' if tracing and '## Scenario Tracing' in text else ''
+        print(f"  {ctx_id}: {counts['endpoints']} endpoints, {counts['scenarios']} scenarios, "
+              f"{counts['capabilities']} capabilities, ~{tokens} tokens{tracing_note}")
+        if tokens > prompt_gen.PROMPT_TOKEN_BUDGET:
+            print(f"    WARNING: ~{tokens} tokens, above the {prompt_gen.PROMPT_TOKEN_BUDGET}-token prompt target")
+    return {'report': report.getvalue(), 'counts': counts, 'output': file_digest(out_file)}
+
+
+def load_context_map(ctxmap_file):
+    """(context entries by id, relationships by context id) of bounded-context-map.yaml."""
+    ctx_entries = {}
+    ctxmap = yaml_io.load_file(ctxmap_file) if os.path.exists(ctxmap_file) else {}
+    for sd in (ctxmap or {}).get('subdomains', []):
+        for bc in sd.get('bounded_contexts', []):
+            ctx_entries[bc['id']] = bc
+    return ctx_entries, prompt_gen.context_relationships(ctxmap)
+
+
+def find_contexts(design_dir):
+    """Build contexts: directories with an aggregate-definitions.yaml."""
+    contexts = []
+    for entry in sorted(os.listdir(design_dir)):
+        agg_path = os.path.join(design_dir, entry, 'aggregate-definitions.yaml')
+        if os.path.isdir(os.path.join(design_dir, entry)) and os.path.exists(agg_path):
+            contexts.append(entry)
+    return contexts
+
+
+def run_jobs(work, jobs):
+    """render_context() over work, in a process pool when jobs > 1. Returns {ctx_id: result}."""
+    work_ids = [job[0] for job in work]
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+            return dict(zip(work_ids, pool.map(render_context, work)))
+    return dict(zip(work_ids, map(render_context, work)))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Assemble prompt.md for every build context from the design and bridge output.')
+    parser.add_argument('design_dir', metavar='design-output-dir')
+    parser.add_argument('output_dir', metavar='bridge-output-dir')
+    parser.add_argument('ctxmap_file', metavar='context-map.yaml', nargs='?',
+                        help='default: <design-output-dir>/bounded-context-map.yaml')
+    parser.add_argument('--template', default=prompt_gen.TEMPLATE_FILE,
+                        help='prompt template (default: templates/prompt.md.tpl)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='worker processes for per-context assembly '
+                             '(0 = one per CPU, default: 1 = serial)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'reassemble every prompt, ignoring {CACHE_FILE}')
+    args = parser.parse_args()
+
+    design_dir = args.design_dir
+    output_dir = args.output_dir
+    ctxmap_file = args.ctxmap_file or os.path.join(design_dir, 'bounded-context-map.yaml')
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    # Template and context map are read once for the whole batch
+    with open(args.template) as f:
+        template_text = f.read()
+    try:
+        template = prompt_gen.compile_template(template_text)
+    except prompt_gen.TemplateError as e:
+        print(f"ERROR: {args.template}: {e}")
+        sys.exit(1)
+    ctx_entries, relationships = load_context_map(ctxmap_file)
+    contexts = find_contexts(design_dir)
+
+    print(f"Prompt assembly for {len(contexts)} contexts")
+    print()
+
+    fingerprint = generator_fingerprint(template_text)
+    cache = {} if args.no_cache else load_cache(output_dir, fingerprint)
+    entries = {}
+    work = []
+    errors = {}
+    for ctx_id in contexts:
+        files, missing = context_inputs(design_dir, output_dir, ctx_id)
+        if missing:
+            errors[ctx_id] = f"  {ctx_id}: ERROR: missing {', '.join(missing)}\n"
+            continue
+        ctx_out = os.path.join(output_dir, ctx_id)
+        ctx_entry = ctx_entries.get(ctx_id, {})
+        ctx_relationships = relationships.get(ctx_id, [])
+        digest = context_digest(input_paths(files), ctx_entry, ctx_relationships, fingerprint)
+        entry = cache.get(ctx_id)
+        if cache_hit(entry, digest, os.path.join(ctx_out, PROMPT_FILE)):
+            entries[ctx_id] = entry
+        else:
+            entries[ctx_id] = {'input': digest}
+            work.append((ctx_id, files, ctx_entry, ctx_relationships, template, ctx_out))
+
+    # Results are consumed in context order regardless of completion order
+    results = run_jobs(work, jobs)
+
+    total_tokens = 0
+    for ctx_id in contexts:
+        if ctx_id in errors:
+            sys.stdout.write(errors[ctx_id])
+            continue
+        if ctx_id in results:
+            entries[ctx_id].update(results[ctx_id])
+        entry = entries[ctx_id]
+        sys.stdout.write(entry['report'])
+        total_tokens += entry['counts']['tokens']
+
+    save_cache(output_dir, fingerprint, entries)
+
+    print(f"\n  TOTAL: {len(entries)} prompts, ~{total_tokens} tokens across {len(contexts)} contexts")
+    if not args.no_cache:
+        print(f"  CACHE: {len(work)} assembled, {len(entries) - len(work)} unchanged")
+    if errors:
+        print(f"  ERRORS: {len(errors)} contexts skipped")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
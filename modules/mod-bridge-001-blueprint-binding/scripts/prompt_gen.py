@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+prompt_gen.py — CODE prompt (prompt.md) assembly from DESIGN and bridge artifacts.
+
+Part of mod-bridge-001-blueprint-binding.
+Follows policy: prompt-assembly.md; template: templates/prompt.md.tpl.
+
+Importable core of prompt-gen.py, for pipelines that already hold a
+context's parsed inputs:
+
+  sys.path.insert(0, '<kb-root>/modules/mod-bridge-001-blueprint-binding/scripts')
+  import prompt_gen
+  template = prompt_gen.load_template()        # parsed and compiled once
+  data = prompt_gen.prompt_data('customer-core', agg_data, features, manifest,
+                                ctx_entry, relationships, openapi=result.openapi)
+  text = prompt_gen.assemble_prompt(template, data, tracing_text)
+
+The endpoint summary comes from the contract. When no OpenAPI document is
+passed, it is regenerated in memory from the aggregate definitions already
+loaded (contract_gen), which is much cheaper than parsing the spec file.
+
+Like contract_gen, importing it loads no YAML library and does no I/O
+(apart from load_template()).
+"""
+
+import os, re, collections
+
+import contract_gen
+
+TEMPLATE_FILE = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                              '..', 'templates', 'prompt.md.tpl'))
+
+# prompt-assembly.md: "Total prompt target: 4K-8K tokens"; section 7
+# (scenario tracing) is only included while the prompt stays under it
+PROMPT_TOKEN_BUDGET = 8000
+
+
+# ═══════════════════════════════════════════════════════════
+# TEMPLATE ENGINE
+# ═══════════════════════════════════════════════════════════
+#
+# The Handlebars subset prompt.md.tpl uses: {{name}}, {{a.b}}, {{this}},
+# {{@key}}, {{#each x}}...{{/each}} and {{#if x}}...{{/if}}. Names resolve
+# against the innermost {{#each}} item first, then the enclosing ones, then
+# the top-level data. A block tag alone on its line takes the line with it,
+# as in Handlebars. Nothing is HTML-escaped: the output is Markdown.
+#
+# compile_template() turns the text into a tree of nodes once; a Template is
+# plain data, so it can be sent to worker processes as is.
+
+TAG = re.compile(r'\{\{\s*([#/]?)\s*([^{}]*?)\s*\}\}')
+STANDALONE_TAG = re.compile(r'^[ \t]*(\{\{\s*[#/][^{}]*\}\})[ \t]*\n', re.M)
+BLOCKS = ('each', 'if')
+
+
+class TemplateError(ValueError):
+    pass
+
+
+def _path(expr):
+    """'a.b' -> ('a', 'b'); 'this' -> () (the current item)."""
+    if not expr:
+        raise TemplateError('empty {{ }} tag')
+    return () if expr == 'this' else tuple(expr.split('.'))
+
+
+class Template:
+    """A compiled template. Nodes: literal str, ('var', path), ('each'|'if', path, nodes)."""
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    def render(self, data):
+        out = []
+        _render(self.nodes, [(data, None)], out)
+        return ''.join(out)
+
+
+def compile_template(text):
+    """Parse template text. Raises TemplateError on unknown or unbalanced blocks."""
+    text = STANDALONE_TAG.sub(r'\1', text)
+    root = []
+    stack = [(None, root)]
+    pos = 0
+    for m in TAG.finditer(text):
+        if m.start() > pos:
+            stack[-1][1].append(text[pos:m.start()])
+        pos = m.end()
+        sigil, expr = m.groups()
+        if sigil == '#':
+            kind, _, arg = expr.partition(' ')
+            if kind not in BLOCKS:
+                raise TemplateError(f"unknown block '{{{{#{kind}}}}}'")
+            body = []
+            stack[-1][1].append((kind, _path(arg.strip()), body))
+            stack.append((kind, body))
+        elif sigil == '/':
+            if stack[-1][0] != expr:
+                raise TemplateError(f"unexpected '{{{{/{expr}}}}}'")
+            stack.pop()
+        else:
+            stack[-1][1].append(('var', _path(expr)))
+    if pos < len(text):
+        root.append(text[pos:])
+    if len(stack) > 1:
+        raise TemplateError(f"unclosed '{{{{#{stack[-1][0]}}}}}'")
+    return Template(root)
+
+
+def load_template(path=TEMPLATE_FILE):
+    with open(path) as f:
+        return compile_template(f.read())
+
+
+def _lookup(path, frames):
+    if not path:
+        return frames[-1][0]
+    if path == ('@key',):
+        return frames[-1][1]
+    for value, _ in reversed(frames):
+        if isinstance(value, dict) and path[0] in value:
+            value = value[path[0]]
+            for name in path[1:]:
+                value = value.get(name) if isinstance(value, dict) else None
+            return value
+    return None
+
+
+def _text(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (list, tuple)):
+        return ', '.join(_text(item) for item in value)
+    return str(value)
+
+
+def _render(nodes, frames, out):
+    for node in nodes:
+        if isinstance(node, str):
+            out.append(node)
+            continue
+        value = _lookup(node[1], frames)
+        if node[0] == 'var':
+            out.append(_text(value))
+        elif node[0] == 'if':
+            if value:
+                _render(node[2], frames, out)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                frames.append((item, key))
+                _render(node[2], frames, out)
+                frames.pop()
+        elif value:
+            for index, item in enumerate(value):
+                frames.append((item, index))
+                _render(node[2], frames, out)
+                frames.pop()
+
+
+# ═══════════════════════════════════════════════════════════
+# PROMPT DATA (prompt-assembly.md sections 1-7)
+# ═══════════════════════════════════════════════════════════
+
+STATE_ATTRIBUTES = ('status', 'state')
+TERMINAL_WORDS = re.compile(r'\b(terminal|irreversible|final)\b', re.I)
+SCENARIO_LINE = re.compile(r'^[ \t]*Scenario( Outline)?:', re.M)
+HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete')
+
+
+def entity_fields(entity):
+    """Identity field, then attributes; enumerated constraints shown with the type."""
+    fields = []
+    identity = entity.get('identity') or {}
+    if identity.get('field'):
+        fields.append({'name': identity['field'], 'type': identity.get('type', 'UUID'),
+                       'description': f"Unique {entity.get('name', 'entity')} identifier"})
+    for attr in entity.get('attributes', []):
+        type_name = attr.get('type', 'String')
+        if attr.get('constraints'):
+            type_name = f"{type_name} ({attr['constraints']})"
+        fields.append({'name': attr['name'], 'type': type_name,
+                       'description': attr.get('description', '')})
+    return fields
+
+
+def status_values(aggregate, root):
+    """
+    Lifecycle states: the constraints of the root entity's status attribute,
+    or of a *Status / *State value object's attribute. [] if there is none.
+    """
+    candidates = [attr for attr in root.get('attributes', [])
+                  if attr.get('name', '').lower() in STATE_ATTRIBUTES
+                  or str(attr.get('type', '')).endswith(('Status', 'State'))]
+    for vo in aggregate.get('value_objects', []):
+        if str(vo.get('name', '')).endswith(('Status', 'State')):
+            candidates.extend(vo.get('attributes', vo.get('fields', [])))
+    for attr in candidates:
+        if attr.get('constraints'):
+            return [s.strip() for s in str(attr['constraints']).split(',') if s.strip()]
+    return []
+
+
+def state_machine(aggregate, root):
+    """
+    States from status_values(), transitions from the state-change commands,
+    terminal states from the invariants that call a state terminal or
+    irreversible. None without lifecycle states.
+    """
+    states = status_values(aggregate, root)
+    if not states:
+        return None
+    transitions = [cmd.get('name', cmd.get('id', '')) for cmd in aggregate.get('commands', [])
+                   if contract_gen.extract_verb(cmd.get('id', '')) in contract_gen.STATE_CHANGE_VERBS]
+    terminal = []
+    for inv in aggregate.get('invariants', []):
+        text = f"{inv.get('rule', '')} {inv.get('error', '')}"
+        if TERMINAL_WORDS.search(text):
+            terminal.extend(s for s in states if s not in terminal and re.search(rf'\b{re.escape(s)}\b', text))
+    return {'states': states, 'transitions': transitions, 'terminal_states': terminal}
+
+
+def aggregate_data(aggregate):
+    entities = aggregate.get('entities', [])
+    root = next((e for e in entities if e.get('id') == aggregate.get('root_entity')),
+                next((e for e in entities if e.get('is_root')), entities[0] if entities else {}))
+    return {
+        'aggregate_name': aggregate.get('name', aggregate.get('id', '')),
+        'aggregate_description': aggregate.get('description', ''),
+        'entity_name': root.get('name', ''),
+        'entity_fields': entity_fields(root),
+        'value_objects': [
+            {'name': vo.get('name', vo.get('id', '')),
+             'fields_summary': ', '.join(f"{a['name']} ({a.get('type', 'String')})"
+                                         for a in vo.get('attributes', vo.get('fields', [])))}
+            for vo in aggregate.get('value_objects', [])
+        ],
+        'state_machine': state_machine(aggregate, root),
+    }
+
+
+def endpoint_summary(openapi):
+    """[{method, path, description}] of a contract, by path then method."""
+    endpoints = []
+    for path in sorted(openapi.get('paths', {})):
+        methods = openapi['paths'][path]
+        for method in HTTP_METHODS:
+            if method in methods:
+                op = methods[method]
+                endpoints.append({'method': method.upper(), 'path': path,
+                                  'description': op.get('summary') or op.get('operationId', '')})
+    return endpoints
+
+
+def context_relationships(ctxmap):
+    """{context id: [relationship, ...]} from a parsed bounded-context-map.yaml."""
+    relationships = collections.defaultdict(list)
+    for rel in (ctxmap or {}).get('context_relationships', None) or []:
+        for end in ('upstream', 'downstream'):
+            if rel.get(end):
+                relationships[rel[end]].append(rel)
+    return dict(relationships)
+
+
+def count_scenarios(features):
+    return sum(len(SCENARIO_LINE.findall(text)) for text in features)
+
+
+def prompt_data(ctx_id, aggregates, features, manifest, ctx_entry=None, relationships=(),
+                openapi=None, contract_file='openapi-spec.yaml'):
+    """
+    Template data for one context.
+
+    aggregates:    parsed aggregate-definitions.yaml (or its aggregate list)
+    features:      text of each .feature file, in order
+    manifest:      parsed manifest.yaml
+    ctx_entry:     the context's bounded-context-map.yaml entry
+    relationships: the context's context_relationships (context_relationships())
+    openapi:       the context's contract; regenerated from aggregates if None
+    """
+    agg_data = aggregates if isinstance(aggregates, dict) else {'aggregates': aggregates}
+    aggregates = agg_data.get('aggregates', [])
+    ctx_entry = ctx_entry or {}
+    manifest = manifest or {}
+    if openapi is None:
+        openapi = contract_gen.generate_contract(ctx_id, aggregates).openapi
+    data = {
+        'context_name': ctx_entry.get('name') or agg_data.get('context_name') or ctx_id,
+        'context_description': ctx_entry.get('description', ''),
+        'blueprint_id': manifest.get('blueprint', ''),
+        'building_block_id': manifest.get('building_block', ''),
+        'tech_stack_id': manifest.get('tech_stack', ''),
+        'aggregates': [aggregate_data(agg) for agg in aggregates],
+        'contract_file': contract_file,
+        'endpoints': endpoint_summary(openapi),
+        'bdd_scenarios_full_content': '\n\n'.join(text.strip('\n') for text in features),
+        'capabilities': manifest.get('capabilities', []),
+        'tech_defaults': manifest.get('tech_defaults', {}),
+        'upstream_dependencies': [
+            {'name': rel['upstream'], 'relationship_type': rel.get('type', ''),
+             'description': rel.get('description', '')}
+            for rel in relationships if rel.get('downstream') == ctx_id
+        ],
+        'downstream_dependents': [
+            {'name': rel['downstream'], 'description': rel.get('description', '')}
+            for rel in relationships if rel.get('upstream') == ctx_id
+        ],
+        'domain_events': [
+            {'name': ev.get('name', ev.get('id', '')), 'description': ev.get('description', '')}
+            for agg in aggregates for ev in agg.get('domain_events', [])
+        ],
+        'scenario_tracing': None,
+    }
+    data['integration'] = bool(data['upstream_dependencies'] or data['downstream_dependents']
+                               or data['domain_events'])
+    return data
+
+
+def estimate_tokens(text):
+    """Rough token count (4 characters per token), as used for the prompt budget."""
+    return len(text) // 4
+
+
+def assemble_prompt(template, data, scenario_tracing=None):
+    """
+    Render prompt.md. scenario_tracing (the scenario-tracing.yaml text) is
+    included as section 7 only if the prompt stays within PROMPT_TOKEN_BUDGET.
+    """
+    text = template.render(data)
+    if scenario_tracing and (estimate_tokens(text) + estimate_tokens(scenario_tracing)
+                             <= PROMPT_TOKEN_BUDGET):
+        text = template.render(dict(data, scenario_tracing=scenario_tracing.strip('\n')))
+    return text
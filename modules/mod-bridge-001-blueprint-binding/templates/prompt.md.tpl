@@ -9,35 +9,41 @@
 ---
 
 ## Domain Model
+{{#each aggregates}}
 
 ### Aggregate: {{aggregate_name}}
+{{#if aggregate_description}}
 {{aggregate_description}}
+{{/if}}
 
 **Entity:** {{entity_name}}
 Fields:
 {{#each entity_fields}}
 - {{name}}: {{type}}{{#if description}} — {{description}}{{/if}}
 {{/each}}
-
 {{#if value_objects}}
+
 **Value Objects:**
 {{#each value_objects}}
 - {{name}}: {{fields_summary}}
 {{/each}}
 {{/if}}
-
 {{#if state_machine}}
+
 **State Machine:**
 States: {{state_machine.states}}
 Transitions: {{state_machine.transitions}}
+{{#if state_machine.terminal_states}}
 Terminal: {{state_machine.terminal_states}}
 {{/if}}
+{{/if}}
+{{/each}}
 
 ---
 
 ## API Contract
 
-See attached: `openapi-spec.yaml`
+See attached: `{{contract_file}}`
 
 Summary of endpoints:
 {{#each endpoints}}
@@ -66,8 +72,8 @@ The following capabilities are pre-resolved and MUST be applied:
 {{#each capabilities}}
 | {{id}} | {{source}} | {{reason}} |
 {{/each}}
-
 {{#if tech_defaults.patterns}}
+
 ### Implementation Variants
 {{#each tech_defaults.patterns}}
 - {{@key}}: {{this}}
@@ -75,28 +81,40 @@ The following capabilities are pre-resolved and MUST be applied:
 {{/if}}
 
 Additional capabilities may be discovered from this prompt by CODE discovery.
+{{#if integration}}
 
 ---
 
 ## Integration Context
-
 {{#if upstream_dependencies}}
+
 ### Upstream dependencies (this service calls):
 {{#each upstream_dependencies}}
 - **{{name}}** ({{relationship_type}}): {{description}}
 {{/each}}
 {{/if}}
-
 {{#if downstream_dependents}}
+
 ### Downstream dependents (call this service):
 {{#each downstream_dependents}}
 - **{{name}}**: {{description}}
 {{/each}}
 {{/if}}
-
 {{#if domain_events}}
+
 ### Domain Events:
 {{#each domain_events}}
 - **{{name}}** — {{description}}
 {{/each}}
 {{/if}}
+{{/if}}
+{{#if scenario_tracing}}
+
+---
+
+## Scenario Tracing
+
+```yaml
+{{scenario_tracing}}
+```
+{{/if}}
@@ -3,9 +3,83 @@
 # manifest-check.sh — Validates capability manifest
 # Module: mod-bridge-001-blueprint-binding
 # Usage: manifest-check.sh <manifest.yaml> <capability-index.yaml>
+#        manifest-check.sh --batch [-j N] [--json report.json] <capability-index.yaml> <dir-or-manifest>...
+#
+# --batch loads the capability index once and validates every given manifest,
+# and every *manifest.yaml under each given directory, in one process (N worker
+# processes with -j N). It can write one aggregated JSON report, and exits 1
+# if any manifest fails.
 # ═══════════════════════════════════════════════════════════
 set -euo pipefail
 
+# Validation rules: validation/manifest_check.py (runtime/tools/validation_engine.py)
+KB_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../../.." && pwd)"
+
+# ─── Batch mode ───
+if [ "${1:-}" = "--batch" ]; then
+  shift
+  ARGS=()
+  CAP_INDEX=""
+  while [ $# -gt 0 ]; do
+    case "$1" in
+      -j|--json)
+        if [ "$1" = "--json" ] && [ "${2:-}" = "-" ]; then
+          # The report below is parsed from stdout, so the JSON report needs a file
+          echo "ERROR: --json - is not supported here; give a report file"
+          exit 1
+        fi
+        ARGS+=("$1" "${2:-}"); shift $(( $# > 1 ? 2 : 1 )) ;;
+      *) if [ -z "$CAP_INDEX" ]; then CAP_INDEX="$1"; else ARGS+=("$1"); fi; shift ;;
+    esac
+  done
+  if [ -z "$CAP_INDEX" ]; then
+    echo "Usage: manifest-check.sh --batch [-j N] [--json report.json] <capability-index.yaml> <dir-or-manifest>..."
+    exit 1
+  fi
+  if [ ! -f "$CAP_INDEX" ]; then echo "ERROR: $CAP_INDEX not found"; exit 1; fi
+
+  echo "═══════════════════════════════════════════════════════════"
+  echo "  Manifest Check (batch): $(basename "$CAP_INDEX")"
+  echo "═══════════════════════════════════════════════════════════"
+  STATUS=0
+  BATCH=$(python3 "$KB_ROOT/runtime/tools/validation_engine.py" --files manifest ${ARGS[@]+"${ARGS[@]}"} --with "$CAP_INDEX") || STATUS=$?
+  FILES=0
+  FAILED=0
+  while IFS= read -r line; do
+    case "$line" in
+      FILE:*)    echo ""; echo "── ${line#FILE:}"; FILES=$((FILES + 1)) ;;
+      INVALID:*) echo "ERROR: ${line#INVALID:} is not valid YAML"; FAILED=$((FAILED + 1)) ;;
+      SUMMARY:*)
+        echo "$line"
+        E=$(echo "$line" | cut -d: -f2)
+        W=$(echo "$line" | cut -d: -f3)
+        if [ "$E" -gt 0 ]; then
+          echo "  RESULT: FAIL ($E errors, $W warnings)"
+          FAILED=$((FAILED + 1))
+        else
+          echo "  RESULT: PASS ($W warnings)"
+        fi
+        ;;
+      *) echo "$line" ;;
+    esac
+  done <<< "$BATCH"
+  # A usage error or crash of the engine itself leaves no (or no failing) manifest results
+  if [ "$FILES" -eq 0 ] || { [ "$STATUS" -ne 0 ] && [ "$FAILED" -eq 0 ]; }; then
+    echo ""
+    if [ "$STATUS" -ne 0 ]; then
+      echo "  ERROR: validation engine failed (exit code $STATUS, $FILES manifests reported)"
+    else
+      echo "  ERROR: no manifests found"
+    fi
+    exit 1
+  fi
+  echo ""
+  echo "═══════════════════════════════════════════════════════════"
+  echo "  BATCH: $FILES manifests, $((FILES - FAILED)) passed, $FAILED failed"
+  echo "═══════════════════════════════════════════════════════════"
+  [ "$FAILED" -eq 0 ] && exit 0 || exit 1
+fi
+
 if [ $# -lt 2 ]; then
   echo "Usage: manifest-check.sh <manifest.yaml> <capability-index.yaml>"
   exit 1
@@ -21,77 +95,15 @@ echo "════════════════════════
 echo "  Manifest Check: $(basename "$MANIFEST")"
 echo "═══════════════════════════════════════════════════════════"
 
-python3 - "$MANIFEST" "$CAP_INDEX" << 'PYEOF'
-import yaml, sys
-
-manifest_file = sys.argv[1]
-index_file = sys.argv[2]
-
-errors = []
-warnings = []
-
-with open(manifest_file) as f:
-    manifest = yaml.safe_load(f)
-
-with open(index_file) as f:
-    index = yaml.safe_load(f)
-
-# Required fields
-for field in ['context_id', 'building_block', 'tech_stack', 'blueprint', 'capabilities']:
-    if not manifest.get(field):
-        errors.append(f"Missing required field: {field}")
-
-# Build capability lookup from index
-available = set()
-caps = index.get('capabilities', {})
-for cap_id, cap in caps.items():
-    for feat_id in cap.get('features', {}).keys():
-        available.add(f"{cap_id}.{feat_id}")
-
-print(f"  OK: CODE index has {len(available)} available capability.features")
-
-# Check each capability is resolvable
-capabilities = manifest.get('capabilities', [])
-seen = set()
-for cap in capabilities:
-    cap_id = cap.get('id', '')
-    if not cap_id:
-        errors.append("Capability entry missing 'id'")
-        continue
-    if not cap.get('source'):
-        warnings.append(f"Capability '{cap_id}' missing 'source' annotation")
-    if cap_id in seen:
-        warnings.append(f"Duplicate capability: '{cap_id}'")
-    seen.add(cap_id)
-    
-    if cap_id not in available:
-        errors.append(f"Capability '{cap_id}' not found in CODE capability-index")
-
-print(f"  OK: {len(capabilities)} capabilities in manifest, {len(seen)} unique")
-
-# Output
-for e in errors:
-    print(f"ERROR:{e}")
-for w in warnings:
-    print(f"WARNING:{w}")
-
-e_count = len(errors)
-w_count = len(warnings)
-print(f"SUMMARY:{e_count}:{w_count}")
-PYEOF
+RESULT=$(python3 "$KB_ROOT/runtime/tools/validation_engine.py" manifest "$MANIFEST" "$CAP_INDEX")
+if [[ "$RESULT" == INVALID:* ]]; then
+  echo "ERROR: ${RESULT#INVALID:} is not valid YAML"
+  exit 1
+fi
+echo "$RESULT"
 
 # Parse result
-LAST=$(python3 - "$MANIFEST" "$CAP_INDEX" << 'PYEOF2' 2>/dev/null | tail -1)
-import yaml, sys
-with open(sys.argv[1]) as f: m = yaml.safe_load(f)
-with open(sys.argv[2]) as f: idx = yaml.safe_load(f)
-avail = set()
-for cid, c in idx.get('capabilities',{}).items():
-    for fid in c.get('features',{}).keys(): avail.add(f"{cid}.{fid}")
-errs = sum(1 for c in m.get('capabilities',[]) if c.get('id','') not in avail)
-print(f"SUMMARY:{errs}:0")
-PYEOF2
-
+LAST=$(echo "$RESULT" | tail -1)
 ERRORS=$(echo "$LAST" | cut -d: -f2)
 WARNINGS=$(echo "$LAST" | cut -d: -f3)
 
@@ -0,0 +1,44 @@
+"""
+manifest_check.py — Rules behind manifest-check.sh (capability manifest + CODE capability-index.yaml).
+Module: mod-bridge-001-blueprint-binding
+
+Loaded by runtime/tools/validation_engine.py, which parses the input once
+and passes the tree in; manifest-check.sh is the command-line wrapper.
+"""
+
+INPUTS = ('yaml', 'capability-index')
+BATCH_PATTERN = '*manifest.yaml'
+
+
+def run(report, manifest, index):
+    errors = report.errors
+    warnings = report.warnings
+
+    # Required fields
+    for field in ['context_id', 'building_block', 'tech_stack', 'blueprint', 'capabilities']:
+        if not manifest.get(field):
+            errors.append(f"Missing required field: {field}")
+
+    # Compiled capability index: "capability.feature" -> feature
+    available = index.features
+
+    report.info.append(f"  OK: CODE index has {len(available)} available capability.features")
+
+    # Check each capability is resolvable
+    capabilities = manifest.get('capabilities', [])
+    seen = set()
+    for cap in capabilities:
+        cap_id = cap.get('id', '')
+        if not cap_id:
+            errors.append("Capability entry missing 'id'")
+            continue
+        if not cap.get('source'):
+            warnings.append(f"Capability '{cap_id}' missing 'source' annotation")
+        if cap_id in seen:
+            warnings.append(f"Duplicate capability: '{cap_id}'")
+        seen.add(cap_id)
+
+        if cap_id not in available:
+            errors.append(f"Capability '{cap_id}' not found in CODE capability-index")
+
+    report.info.append(f"  OK: {len(capabilities)} capabilities in manifest, {len(seen)} unique")
@@ -1,6 +1,7 @@
 #!/bin/bash
 # circuit-breaker-check.sh
 # Validates Circuit Breaker implementation (Resilience4j pattern)
+# CACHE_INPUTS: pom.xml src/main/java src/main/resources/application.yml
 
 SERVICE_DIR=${1:-.}
 
@@ -7,6 +7,7 @@
 # Updated: 2026-01-23
 # Changes: Accept @Retry in output adapters (infrastructure/adapter/out/)
 #          in addition to application layer
+# CACHE_INPUTS: pom.xml build.gradle src/main/java src/test/java src/main/resources/application*.yml
 # =============================================================================
 
 # Note: Not using 'set -e' because we handle errors manually
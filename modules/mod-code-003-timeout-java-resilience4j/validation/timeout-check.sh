@@ -6,6 +6,7 @@
 # Supports two timeout strategies:
 # 1. @TimeLimiter annotation (async methods with CompletableFuture)
 # 2. Client-level timeout (RestClient/WebClient with timeout config)
+# CACHE_INPUTS: pom.xml src/main/java src/main/resources/application.yml
 # =============================================================================
 
 # Colors for output
@@ -2,6 +2,7 @@
 # =============================================================================
 # MOD-004: Rate Limiter Pattern Validation Script
 # Tier 3 validation for Resilience4j RateLimiter implementation
+# CACHE_INPUTS: pom.xml build.gradle src/main/java src/test/java src/main/resources/application.yml
 # =============================================================================
 
 set -e
@@ -5,6 +5,7 @@
 # Version: 1.1.0
 # Updated: 2025-12-03
 # Fix: Exclude comments from annotation detection (false positives)
+# CACHE_INPUTS: src/main/java src/test/java
 
 SERVICE_DIR=${1:-.}
 BASE_PACKAGE_PATH=${2:-""}
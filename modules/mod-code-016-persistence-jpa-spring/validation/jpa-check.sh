@@ -2,6 +2,7 @@
 # =============================================================================
 # MOD-016: JPA Persistence Validation Script
 # Tier 3 validation for JPA persistence implementation
+# CACHE_INPUTS: pom.xml src/main/java src/test/java src/main/resources/application.yml
 # =============================================================================
 
 set -e
@@ -6,6 +6,7 @@
 # Version: 1.1
 # Updated: 2026-01-23
 # Changes: Support multiple valid path variants for repository and adapter
+# CACHE_INPUTS: pom.xml src/main/java src/test/java src/main/resources
 # =============================================================================
 
 # Note: Not using 'set -e' because we handle errors manually with ERRORS counter
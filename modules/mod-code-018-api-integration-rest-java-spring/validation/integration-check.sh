@@ -4,6 +4,7 @@
 # Version: 1.1
 # Updated: 2026-01-23
 # Changes: Also searches in */systemapi/* path for client files
+# CACHE_INPUTS: *.java
 
 # Note: Not using set -e to handle errors manually
 
@@ -2,6 +2,7 @@
 # config-check.sh
 # Tier 3 validation for mod-code-019-api-public-exposure
 # Validates ERI constraint: default-page-size, max-page-size, zero-indexed-pagination
+# CACHE_INPUTS: *application*.yml *application*.yaml *PageableConfig.java
 
 SERVICE_DIR="${1:-.}"
 
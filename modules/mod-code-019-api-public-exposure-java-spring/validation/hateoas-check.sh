@@ -9,6 +9,7 @@
 #   - CRITICAL: correct import path for RepresentationModelAssemblerSupport
 #
 # Updated: 2026-01-26 - Added import validation (DEC-025 compliance)
+# CACHE_INPUTS: *.java
 # ═══════════════════════════════════════════════════════════════════════════════
 
 SERVICE_DIR="${1:-.}"
@@ -6,6 +6,7 @@
 # Version: 1.1
 # Updated: 2026-01-23
 # Changes: Make pagination check conditional - only required if API has list operations
+# CACHE_INPUTS: *.java
 # =============================================================================
 
 SERVICE_DIR="${1:-.}"
@@ -2,6 +2,7 @@
 # compensation-endpoint-check.sh
 # Tier 3 validation for mod-code-020-compensation
 # Validates ERI constraints: compensation-endpoint-exists, correlation-id-header-required
+# CACHE_INPUTS: *.java
 
 SERVICE_DIR="${1:-.}"
 
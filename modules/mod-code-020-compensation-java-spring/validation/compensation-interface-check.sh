@@ -2,6 +2,7 @@
 # compensation-interface-check.sh
 # Tier 3 validation for mod-code-020-compensation
 # Validates ERI constraints: compensable-interface-implemented, compensate-method-exists
+# CACHE_INPUTS: *.java
 
 SERVICE_DIR="${1:-.}"
 
@@ -2,6 +2,7 @@
 # transaction-log-check.sh
 # Tier 3 validation for mod-code-020-compensation
 # Validates ERI constraint: transaction-log-entity-exists
+# CACHE_INPUTS: *.java
 
 SERVICE_DIR="${1:-.}"
 
@@ -0,0 +1,47 @@
+"""
+api_mapping_check.py — Rules behind api-mapping-check.sh (api-mapping.yaml).
+Module: mod-design-003-api-mapping
+
+Loaded by runtime/tools/validation_engine.py, which parses the input once
+and passes the tree in; api-mapping-check.sh is the command-line wrapper.
+"""
+
+INPUTS = ('document',)  # YAML or JSON, by file extension
+
+
+def run(report, data):
+    errors = report.errors
+
+    valid_tiers = {'domain', 'system', 'composable', 'experience'}
+    valid_types = {'rest', 'grpc', 'async', 'graphql'}
+    valid_methods = {'GET', 'POST', 'PUT', 'PATCH', 'DELETE'}
+
+    for field in ['version', 'source_context', 'source_aggregate', 'api_tier', 'api_name', 'api_type']:
+        if field not in data:
+            errors.append(f"Missing required field: {field}")
+
+    if data.get('api_tier', '') not in valid_tiers:
+        errors.append(f"Invalid api_tier: '{data.get('api_tier')}'")
+    if data.get('api_type', '') not in valid_types:
+        errors.append(f"Invalid api_type: '{data.get('api_type')}'")
+
+    resources = data.get('resources', [])
+    if not resources:
+        errors.append("No resources defined")
+
+    for res in resources:
+        if not res.get('aggregate'):
+            errors.append(f"Resource '{res.get('name', '???')}' has no aggregate ref")
+        ops = res.get('operations', [])
+        if not ops:
+            errors.append(f"Resource '{res.get('name', '???')}' has no operations")
+        for op in ops:
+            method = op.get('method', '')
+            if method not in valid_methods:
+                errors.append(f"Invalid HTTP method: '{method}'")
+            if not op.get('command_or_query'):
+                errors.append(f"Operation {method} {op.get('path', '???')} has no command_or_query ref")
+
+    for dep in data.get('system_api_dependencies', []):
+        if not dep.get('field_mapping_ref'):
+            errors.append(f"System API dep '{dep.get('system_api', '???')}' missing field_mapping_ref")
@@ -0,0 +1,37 @@
+"""
+field_mapping_check.py — Rules behind field-mapping-check.sh (field-mapping.json).
+Module: mod-design-003-api-mapping
+
+Loaded by runtime/tools/validation_engine.py, which parses the input once
+and passes the tree in; field-mapping-check.sh is the command-line wrapper.
+"""
+
+INPUTS = ('document',)  # YAML or JSON, by file extension
+
+
+def run(report, data):
+    errors = report.errors
+
+    valid_transforms = {'direct', 'uuid-to-string', 'enum-to-code', 'date-format', 'composite', 'lookup', 'constant'}
+    valid_directions = {'bidirectional', 'domain-to-system', 'system-to-domain'}
+
+    for field in ['version', 'domain_api', 'system_api']:
+        if field not in data:
+            errors.append(f"Missing required field: {field}")
+
+    mappings = data.get('entity_mappings', [])
+    if not mappings:
+        errors.append("No entity_mappings defined")
+
+    for em in mappings:
+        entity = em.get('domain_entity', '???')
+        fields = em.get('field_mappings', [])
+        if not fields:
+            errors.append(f"Entity '{entity}' has no field_mappings")
+        for fm in fields:
+            t = fm.get('transformation', '')
+            if t not in valid_transforms:
+                errors.append(f"Entity '{entity}', field '{fm.get('domain_field', '???')}': invalid transformation '{t}'")
+            d = fm.get('direction', '')
+            if d not in valid_directions:
+                errors.append(f"Entity '{entity}', field '{fm.get('domain_field', '???')}': invalid direction '{d}'")
@@ -7,59 +7,26 @@
 
 set -euo pipefail
 
-FILE="${1:?Usage: openapi-lint.sh <openapi-spec.yaml>}"
+FILE="${1:?Usage: openapi-lint.sh <openapi-spec.yaml|openapi-spec.json>}"
+
+# Validation rules: validation/openapi_lint.py (runtime/tools/validation_engine.py)
+KB_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../../.." && pwd)"
+case "$FILE" in
+    *.json) FORMAT=JSON ;;
+    *) FORMAT=YAML ;;
+esac
 
 echo "═══════════════════════════════════════════════════════════"
 echo "  OpenAPI Lint"
 echo "  File: $FILE"
 echo "═══════════════════════════════════════════════════════════"
 
-if ! python3 -c "import yaml; yaml.safe_load(open('$FILE'))" 2>/dev/null; then
-    echo "  ERROR: File is not valid YAML"
+RESULT=$(python3 "$KB_ROOT/runtime/tools/validation_engine.py" openapi-lint "$FILE")
+if [[ "$RESULT" == INVALID:* ]]; then
+    echo "  ERROR: File is not valid $FORMAT"
     exit 1
 fi
-echo "  OK: Valid YAML"
-
-RESULT=$(FILE_PATH="$FILE" python3 << 'PYEOF'
-import yaml, os
-
-with open(os.environ['FILE_PATH']) as f:
-    data = yaml.safe_load(f)
-
-errors = []
-
-if 'openapi' not in data:
-    errors.append("Missing 'openapi' version field")
-elif not str(data['openapi']).startswith('3.'):
-    errors.append(f"OpenAPI version should be 3.x, got: {data['openapi']}")
-
-info = data.get('info', {})
-if not info.get('title'):
-    errors.append("Missing info.title")
-if not info.get('version'):
-    errors.append("Missing info.version")
-
-paths = data.get('paths', {})
-if not paths:
-    errors.append("No paths defined")
-
-schemas = data.get('components', {}).get('schemas', {})
-if not schemas:
-    errors.append("No component schemas defined")
-
-# Check that paths have at least one operation
-for path, methods in paths.items():
-    if not isinstance(methods, dict):
-        continue
-    valid_ops = [m for m in methods if m in ('get', 'post', 'put', 'patch', 'delete')]
-    if not valid_ops:
-        errors.append(f"Path '{path}' has no valid HTTP operations")
-
-for e in errors:
-    print(f"ERROR:{e}")
-print(f"SUMMARY:{len(errors)}:0")
-PYEOF
-2>&1)
+echo "  OK: Valid $FORMAT"
 
 ERRORS=0
 while IFS= read -r line; do
@@ -0,0 +1,42 @@
+"""
+openapi_lint.py — Rules behind openapi-lint.sh (an OpenAPI spec).
+Module: mod-design-003-api-mapping
+
+Loaded by runtime/tools/validation_engine.py, which parses the input once
+and passes the tree in; openapi-lint.sh is the command-line wrapper.
+"""
+
+INPUTS = ('document',)  # YAML or JSON, by file extension
+
+
+def run(report, data):
+    errors = report.errors
+
+    if 'openapi' not in data:
+        errors.append("Missing 'openapi' version field")
+    elif not str(data['openapi']).startswith('3.'):
+        errors.append(f"OpenAPI version should be 3.x, got: {data['openapi']}")
+
+    info = data.get('info', {})
+    if not info.get('title'):
+        errors.append("Missing info.title")
+    if not info.get('version'):
+        errors.append("Missing info.version")
+
+    paths = data.get('paths', {})
+    if not paths:
+        errors.append("No paths defined")
+
+    # A context spec written with contract-gen.py --shared-components may keep
+    # all its schemas in the common spec it names
+    schemas = data.get('components', {}).get('schemas', {})
+    if not schemas and not data.get('x-shared-components'):
+        errors.append("No component schemas defined")
+
+    # Check that paths have at least one operation
+    for path, methods in paths.items():
+        if not isinstance(methods, dict):
+            continue
+        valid_ops = [m for m in methods if m in ('get', 'post', 'put', 'patch', 'delete')]
+        if not valid_ops:
+            errors.append(f"Path '{path}' has no valid HTTP operations")
@@ -0,0 +1,125 @@
+#!/usr/bin/env bash
+# ═══════════════════════════════════════════════════════════════
+# bdd-check.sh — Runs the Phase 3 checks of one or more DESIGN contexts
+# Module: mod-design-004-bdd-scenarios
+# Version: 1.0
+# ═══════════════════════════════════════════════════════════════
+#
+# Usage: ./bdd-check.sh <context-dir>...
+#
+# For each context directory (aggregate-definitions.yaml, *.feature,
+# scenario-tracing.yaml) runs the checks of gherkin-syntax-check.sh (every
+# .feature), tracing-check.sh and coverage-check.sh as one engine batch:
+# every file is read and indexed once (runtime/tools/bdd_index.py) and the
+# index is shared by all checks that read it.
+#
+# tracing-check.sh pairs scenario-tracing.yaml with one .feature file: the
+# one named by its feature_file field, or the only .feature of the context.
+#
+# Exit codes:
+#   0 — All checks passed (may have warnings)
+#   1 — ERROR-level validation failure in any context
+
+set -euo pipefail
+
+: "${1:?Usage: bdd-check.sh <context-dir>...}"
+
+# Validation rules: validation/*_check.py (runtime/tools/validation_engine.py)
+KB_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../../.." && pwd)"
+
+quote() { printf "'%s'" "${1//\'/\'\\\'\'}"; }
+
+echo "═══════════════════════════════════════════════════════════"
+echo "  BDD Scenarios Validation"
+echo "  Contexts: $#"
+echo "═══════════════════════════════════════════════════════════"
+
+# Checks that cannot be paired with their inputs are reported after the batch
+JOBS=""
+PROBLEMS=""
+for CTX in "$@"; do
+    CTX="${CTX%/}"
+    AGG_FILE="$CTX/aggregate-definitions.yaml"
+    TRACE_FILE="$CTX/scenario-tracing.yaml"
+    FEATURES=()
+    for f in "$CTX"/*.feature; do
+        [ -f "$f" ] && FEATURES+=("$f")
+    done
+
+    if [ "${#FEATURES[@]}" -eq 0 ]; then
+        PROBLEMS+="$CTX: no .feature files"$'\n'
+    fi
+    for f in ${FEATURES[@]+"${FEATURES[@]}"}; do
+        JOBS+="gherkin $(quote "$f")"$'\n'
+    done
+
+    PAIRED=""
+    if [ -f "$TRACE_FILE" ]; then
+        NAMED=$(sed -n 's/^feature_file:[[:space:]]*//p' "$TRACE_FILE" | head -1 \
+            | sed 's/[[:space:]]*#.*$//; s/^["'\'']//; s/["'\'']$//')
+        if [ -n "$NAMED" ] && [ -f "$CTX/$NAMED" ]; then
+            PAIRED="$CTX/$NAMED"
+        elif [ "${#FEATURES[@]}" -eq 1 ]; then
+            PAIRED="${FEATURES[0]}"
+        elif [ "${#FEATURES[@]}" -gt 1 ]; then
+            PROBLEMS+="$TRACE_FILE: feature_file does not name one of the ${#FEATURES[@]} .feature files"$'\n'
+        fi
+        [ -n "$PAIRED" ] && JOBS+="tracing $(quote "$TRACE_FILE") $(quote "$PAIRED")"$'\n'
+    fi
+    # Missing inputs are reported by the engine as INVALID
+    JOBS+="coverage $(quote "$AGG_FILE") $(quote "$TRACE_FILE")"$'\n'
+done
+
+STATUS=0
+RESULT=$(printf '%s' "$JOBS" | python3 "$KB_ROOT/runtime/tools/validation_engine.py" --batch -) || STATUS=$?
+
+CHECKS=0
+FAILED=0
+WARNINGS=0
+UNPAIRED=0
+while IFS= read -r line; do
+    case "$line" in
+        JOB:*)     echo ""; echo "── ${line#JOB:}"; CHECKS=$((CHECKS + 1)) ;;
+        INVALID:*) echo "  ERROR: Cannot read ${line#INVALID:}"; FAILED=$((FAILED + 1)) ;;
+        ERROR:*)   echo "  ERROR: ${line#ERROR:}" ;;
+        WARNING:*) echo "  WARNING: ${line#WARNING:}" ;;
+        SUMMARY:*)
+            E=$(echo "$line" | cut -d: -f2)
+            W=$(echo "$line" | cut -d: -f3)
+            WARNINGS=$((WARNINGS + W))
+            if [ "$E" -gt 0 ]; then
+                echo "  RESULT: FAIL ($E errors, $W warnings)"
+                FAILED=$((FAILED + 1))
+            else
+                echo "  RESULT: PASS ($W warnings)"
+            fi
+            ;;
+    esac
+done <<< "$RESULT"
+
+# A crash of the engine itself leaves no (or no failing) check results
+if [ "$CHECKS" -eq 0 ] || { [ "$STATUS" -ne 0 ] && [ "$FAILED" -eq 0 ]; }; then
+    echo ""
+    echo "  ERROR: validation engine failed (exit code $STATUS, $CHECKS checks reported)"
+    exit 1
+fi
+
+if [ -n "$PROBLEMS" ]; then
+    echo ""
+    while IFS= read -r line; do
+        if [ -n "$line" ]; then
+            echo "  ERROR: $line"
+            UNPAIRED=$((UNPAIRED + 1))
+        fi
+    done <<< "$PROBLEMS"
+fi
+
+echo ""
+echo "═══════════════════════════════════════════════════════════"
+if [ "$FAILED" -gt 0 ] || [ "$UNPAIRED" -gt 0 ]; then
+    echo "  RESULT: FAIL ($CHECKS checks, $FAILED failed, $UNPAIRED not run, $WARNINGS warnings)"
+    exit 1
+else
+    echo "  RESULT: PASS ($CHECKS checks, $WARNINGS warnings)"
+    exit 0
+fi
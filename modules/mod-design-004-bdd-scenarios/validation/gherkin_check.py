@@ -0,0 +1,61 @@
+"""
+gherkin_check.py — Rules behind gherkin-syntax-check.sh (.feature file).
+Module: mod-design-004-bdd-scenarios
+
+Loaded by runtime/tools/validation_engine.py, which indexes the file once
+(runtime/tools/bdd_index.py) and passes the index in; gherkin-syntax-check.sh
+is the command-line wrapper. report.info carries the per-check transcript the
+wrapper prints; errors are also reported on their own for batch runs.
+"""
+
+import re
+
+INPUTS = ('feature',)
+BATCH_PATTERN = '*.feature'
+
+HTTP_RE = re.compile(r'\bHTTP\b|status code [0-9]{3}|responds with [0-9]{3}|returns [0-9]{3}|HTTP [0-9]{3}')
+JSON_RE = re.compile(r'"json"|\.json|application/json|JSON body|JSON response', re.IGNORECASE)
+
+
+def run(report, feature):
+    out = report.info
+
+    def error(message):
+        out.append(f"  ERROR: {message}")
+        report.errors.append(message)
+
+    def ok(message):
+        out.append(f"  OK: {message}")
+
+    def technology(pattern, clean):
+        found = [f"{n}:{line}" for n, line in enumerate(feature.lines, 1) if pattern.search(line)]
+        for hit in found:
+            error(f"Technology detail found: {hit}")
+        if not found:
+            ok(clean)
+
+    out.append("")
+    out.append("── Check 1: Feature keyword")
+    if feature.has_feature:
+        ok("Feature keyword present")
+    else:
+        error("No Feature: keyword found")
+
+    out.append("── Check 2: Scenarios present")
+    if feature.scenarios:
+        ok(f"{len(feature.scenarios)} scenarios found")
+    else:
+        error("No scenarios found")
+
+    out.append("── Check 3: No HTTP codes")
+    technology(HTTP_RE, "No HTTP codes found")
+
+    out.append("── Check 4: No JSON references")
+    technology(JSON_RE, "No JSON references found")
+
+    out.append("── Check 5: Single When per scenario")
+    issues = [(name, whens) for name, _, whens in feature.scenarios if whens > 1]
+    for name, whens in issues:
+        error(f"Scenario '{name}' has {whens} When steps (must be 1)")
+    if not issues:
+        ok("Single When per scenario")
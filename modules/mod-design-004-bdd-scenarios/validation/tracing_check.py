@@ -0,0 +1,61 @@
+"""
+tracing_check.py — Rules behind tracing-check.sh (scenario-tracing.yaml + .feature file).
+Module: mod-design-004-bdd-scenarios
+
+Loaded by runtime/tools/validation_engine.py, which parses the inputs once
+and passes their indexes in (runtime/tools/bdd_index.py); tracing-check.sh is
+the command-line wrapper.
+"""
+
+import re
+
+INPUTS = ('tracing', 'feature')
+
+
+def run(report, tracing, feature):
+    errors = report.errors
+
+    kebab_re = re.compile(r'^[a-z][a-z0-9-]*$')
+    valid_categories = {'happy-path', 'validation', 'invariant', 'not-found', 'integration', 'pagination'}
+    error_categories = {'validation', 'invariant', 'not-found'}
+
+    if not tracing.data:
+        errors.append("Tracing file is empty")
+    else:
+        for i, sc in enumerate(tracing.scenarios, 1):
+            # Left out of the index tables (bdd_index.py), reported here
+            if not isinstance(sc, dict):
+                errors.append(f"Scenario entry #{i} is not a mapping")
+                continue
+            sc_id = sc.get('id', '???')
+            sc_cat = sc.get('category', '')
+
+            # ID format
+            if not isinstance(sc_id, str) or not kebab_re.match(sc_id):
+                errors.append(f"Scenario ID '{sc_id}' is not valid kebab-case")
+
+            # Duplicate IDs: every entry after the first with this ID
+            if isinstance(sc_id, str) and tracing.by_id[sc_id][0] is not sc:
+                errors.append(f"Duplicate scenario ID: '{sc_id}'")
+
+            # Category valid; the rules below only apply to valid categories
+            if not isinstance(sc_cat, str) or sc_cat not in valid_categories:
+                errors.append(f"Scenario '{sc_id}' has invalid category: '{sc_cat}'")
+                continue
+
+            # Invariant category requires tests_invariant
+            if sc_cat == 'invariant' and not sc.get('tests_invariant'):
+                errors.append(f"Scenario '{sc_id}' is category=invariant but missing tests_invariant")
+
+            # Error categories require expected_error
+            if sc_cat in error_categories and not sc.get('expected_error'):
+                errors.append(f"Scenario '{sc_id}' is category={sc_cat} but missing expected_error")
+
+        # Check 1:1 mapping: .feature scenario name -> line(s) <-> tracing entries by name
+        for name, lines in feature.locations.items():
+            if name not in tracing.by_name:
+                errors.append(f"Feature scenario '{name}' (line {lines[0]}) has no tracing entry")
+
+        for name in tracing.by_name:
+            if name not in feature.locations:
+                errors.append(f"Tracing entry '{name}' does not match any scenario in .feature")
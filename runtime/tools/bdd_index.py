@@ -0,0 +1,107 @@
+"""
+bdd_index.py — Lookup tables for the BDD artifacts of one DESIGN context.
+
+Used by: validation_engine.py (mod-design-004 gherkin-syntax-check.sh,
+         tracing-check.sh, coverage-check.sh, bdd-check.sh)
+
+The .feature file and scenario-tracing.yaml are read once per context and
+indexed the way the checks ask, so each rule is a dictionary lookup instead
+of a rescan of the file or of the scenario list:
+
+  FeatureIndex   <aggregate>.feature
+    lines          raw lines
+    has_feature    a line starts with "Feature:"
+    scenarios      (name, line, when_count) per "Scenario:" line, in file order
+    locations      scenario name -> line numbers (1-based) where it is declared
+
+  TracingIndex   scenario-tracing.yaml
+    data           parsed document (None for an empty file)
+    scenarios      tracing entries, in file order
+    by_element     exercises (command/query id) -> entries
+    categories     exercises (command/query id) -> set of categories
+    by_invariant   tests_invariant -> entries
+    by_name        scenario name   -> entries
+    by_id          scenario id     -> entries
+
+Entries that are not mappings, and values that cannot be keys (lists,
+mappings), are left out of the tables; the rules still see them in
+`scenarios` and report them (tracing_check.py). A document that is not a
+mapping, or whose `scenarios` is not a list, is a ValueError (the engine
+reports the file as INVALID).
+"""
+
+import yaml_io
+
+
+def _key(value):
+    return not isinstance(value, (list, dict))
+
+
+def _add(table, key, entry):
+    if _key(key):
+        table.setdefault(key, []).append(entry)
+
+
+class FeatureIndex:
+    """One pass over a .feature file (see module docstring)."""
+
+    def __init__(self, text):
+        self.lines = text.splitlines()
+        self.has_feature = False
+        self.scenarios = []
+        self.locations = {}
+
+        name, line_no, whens = None, 0, 0
+        for n, line in enumerate(self.lines, 1):
+            if line.startswith('Feature:'):
+                self.has_feature = True
+            stripped = line.strip()
+            if stripped.startswith('Scenario:'):
+                if name is not None:
+                    self.scenarios.append((name, line_no, whens))
+                name, line_no, whens = stripped.replace('Scenario:', '').strip(), n, 0
+                self.locations.setdefault(name, []).append(n)
+            elif stripped.startswith('When ') and name is not None:
+                whens += 1
+        if name is not None:
+            self.scenarios.append((name, line_no, whens))
+
+
+class TracingIndex:
+    """Tables over the entries of a scenario-tracing.yaml (see module docstring)."""
+
+    def __init__(self, data):
+        if data and not isinstance(data, dict):
+            raise ValueError('scenario tracing is not a mapping')
+        self.data = data or None
+        self.scenarios = (data or {}).get('scenarios') or []
+        if not isinstance(self.scenarios, list):
+            raise ValueError('scenario tracing: scenarios is not a list')
+        self.by_element = {}
+        self.categories = {}
+        self.by_invariant = {}
+        self.by_name = {}
+        self.by_id = {}
+
+        for sc in self.scenarios:
+            if not isinstance(sc, dict):
+                continue
+            exercises = sc.get('exercises', '')
+            category = sc.get('category', '')
+            _add(self.by_element, exercises, sc)
+            if _key(exercises) and _key(category):
+                self.categories.setdefault(exercises, set()).add(category)
+            if sc.get('tests_invariant'):
+                _add(self.by_invariant, sc['tests_invariant'], sc)
+            _add(self.by_name, sc.get('scenario', ''), sc)
+            _add(self.by_id, sc.get('id', '???'), sc)
+
+
+def load_feature(f):
+    """FeatureIndex of an open .feature file."""
+    return FeatureIndex(f.read())
+
+
+def load_tracing(f):
+    """TracingIndex of an open scenario-tracing.yaml."""
+    return TracingIndex(yaml_io.load(f))
@@ -0,0 +1,286 @@
+"""
+capability_index.py — Compiled lookup tables for the discovery capability indexes.
+
+Used by: validation_engine.py (mod-bridge-001 manifest-check.sh), discovery tooling
+
+runtime/discovery/capability-index.yaml (CODE) and
+design-capability-index.yaml (DESIGN) are authored for people: features sit
+under capabilities (or under a methodology variant), modules under
+implementations. Resolving a reference means walking that tree. compile_index()
+flattens one index into lookup tables keyed the way callers ask:
+
+  features       "capability.feature" -> feature record (+ capability, variant,
+                                         modules, implementations by stack)
+  capabilities   capability id        -> capability record (without features)
+                                         + its feature refs
+  modules        module id            -> feature refs it implements
+  module_ids     "mod-code-015"       -> full module id
+  stacks         stack                -> feature refs with an implementation for it
+  keywords       lowercase keyword    -> capability / feature refs
+
+load() keeps the compiled tables in .compiled/<index>.json next to the
+source and rebuilds them when the source's SHA-256 no longer matches, so a
+lookup costs one JSON load plus a hash of the YAML instead of a YAML parse.
+
+Usage:
+  python3 capability_index.py build [index.yaml...]       # (re)compile; default: both KB indexes
+  python3 capability_index.py feature <capability.feature> [--stack S] [--index FILE]
+  python3 capability_index.py module <module-id-or-prefix> [--index FILE]
+  python3 capability_index.py keyword <keyword> [--index FILE]
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+
+KB_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+DISCOVERY_DIR = os.path.join(KB_ROOT, 'runtime', 'discovery')
+INDEXES = {
+    'code': os.path.join(DISCOVERY_DIR, 'capability-index.yaml'),
+    'design': os.path.join(DISCOVERY_DIR, 'design-capability-index.yaml'),
+}
+
+# Bump when the layout of the compiled tables changes
+FORMAT = 1
+
+MODULE_PREFIX = re.compile(r'^(mod-[a-z]+-\d+)')
+
+
+class CapabilityIndex:
+    """Compiled tables of one capability index (see module docstring)."""
+
+    def __init__(self, tables):
+        self.source = tables['source']
+        self.domain = tables['domain']
+        self.version = tables['version']
+        self.features = tables['features']
+        self.capabilities = tables['capabilities']
+        self.modules = tables['modules']
+        self.module_ids = tables['module_ids']
+        self.stacks = tables['stacks']
+        self.keywords = tables['keywords']
+
+    def feature(self, ref):
+        """Feature record for "capability.feature", or None."""
+        return self.features.get(ref)
+
+    def module_for(self, ref, stack=None):
+        """
+        Module implementing feature `ref` on `stack` (the feature's default
+        implementation when stack is None), or None.
+        """
+        feature = self.features.get(ref)
+        if feature is None:
+            return None
+        if feature['implementations']:
+            return feature['implementations'].get(stack or feature.get('default'))
+        # DESIGN features name their module directly
+        return feature['modules'][0] if feature['modules'] else None
+
+    def resolve_module(self, module):
+        """Full module id for a full id or a "mod-code-015" prefix, or None."""
+        if module in self.modules:
+            return module
+        match = MODULE_PREFIX.match(module)
+        return self.module_ids.get(match.group(1)) if match else None
+
+    def match_keyword(self, keyword):
+        return self.keywords.get(keyword.lower(), [])
+
+
+# ═══════════════════════════════════════════════════════════════
+# COMPILE
+# ═══════════════════════════════════════════════════════════════
+
+def _iter_features(capability):
+    """(variant, feature_id, feature) for CODE and DESIGN (variant) layouts."""
+    for feat_id, feat in (capability.get('features') or {}).items():
+        yield None, feat_id, feat
+    for variant_id, variant in (capability.get('variants') or {}).items():
+        for feat_id, feat in (variant.get('features') or {}).items():
+            yield variant_id, feat_id, feat
+
+
+def _add(table, key, ref):
+    refs = table.setdefault(key, [])
+    if ref not in refs:
+        refs.append(ref)
+
+
+def compile_index(data, source=''):
+    """Flatten a parsed capability index into lookup tables."""
+    features, capabilities, modules, module_ids, stacks, keywords = {}, {}, {}, {}, {}, {}
+
+    for cap_id, cap in (data.get('capabilities') or {}).items():
+        cap = cap or {}
+        record = {k: v for k, v in cap.items() if k not in ('features', 'variants')}
+        record['features'] = []
+        capabilities[cap_id] = record
+        for kw in cap.get('keywords') or []:
+            _add(keywords, str(kw).lower(), cap_id)
+        for variant_id, variant in (cap.get('variants') or {}).items():
+            for kw in (variant or {}).get('keywords') or []:
+                _add(keywords, str(kw).lower(), cap_id)
+
+        for variant, feat_id, feat in _iter_features(cap):
+            feat = feat or {}
+            ref = f"{cap_id}.{feat_id}"
+            implementations = {}
+            feat_modules = []
+            for impl in feat.get('implementations') or []:
+                if impl.get('stack'):
+                    implementations[impl['stack']] = impl.get('module')
+                    _add(stacks, impl['stack'], ref)
+                if impl.get('module') and impl['module'] not in feat_modules:
+                    feat_modules.append(impl['module'])
+            if feat.get('module') and feat['module'] not in feat_modules:
+                feat_modules.append(feat['module'])
+
+            features[ref] = dict(feat, capability=cap_id, feature=feat_id, variant=variant,
+                                 modules=feat_modules, implementations=implementations)
+            record['features'].append(ref)
+            for module in feat_modules:
+                _add(modules, module, ref)
+                match = MODULE_PREFIX.match(module)
+                if match:
+                    module_ids.setdefault(match.group(1), module)
+            for kw in feat.get('keywords') or []:
+                _add(keywords, str(kw).lower(), ref)
+
+    return {
+        'format': FORMAT,
+        'source': source,
+        'domain': data.get('domain'),
+        'version': data.get('version'),
+        'features': features,
+        'capabilities': capabilities,
+        'modules': modules,
+        'module_ids': module_ids,
+        'stacks': stacks,
+        'keywords': keywords,
+    }
+
+
+# ═══════════════════════════════════════════════════════════════
+# LOAD
+# ═══════════════════════════════════════════════════════════════
+
+def compiled_path(path):
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, '.compiled', os.path.splitext(name)[0] + '.json')
+
+
+def _sha256(text):
+    return hashlib.sha256(text).hexdigest()
+
+
+def build(path):
+    """Compile `path` and write the tables next to it. Returns the tables."""
+    import yaml_io  # only needed to recompile; keeps load() free of the YAML import
+
+    with open(path, 'rb') as f:
+        text = f.read()
+    tables = compile_index(yaml_io.load(text) or {}, source=os.path.basename(path))
+    tables['sha256'] = _sha256(text)
+    _write(compiled_path(path), tables)
+    return tables
+
+
+def _write(target, tables):
+    """Best effort: a read-only KB still works, it just recompiles each time."""
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(tmp, 'w') as f:
+            json.dump(tables, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, target)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def load(path=None):
+    """
+    CapabilityIndex for `path` (default: the CODE index), from the compiled
+    tables when they match the source, recompiling them otherwise.
+    """
+    path = path or INDEXES['code']
+    with open(path, 'rb') as f:
+        digest = _sha256(f.read())
+    try:
+        with open(compiled_path(path)) as f:
+            tables = json.load(f)
+        if tables.get('format') == FORMAT and tables.get('sha256') == digest:
+            return CapabilityIndex(tables)
+    except (OSError, ValueError):
+        pass
+    return CapabilityIndex(build(path))
+
+
+def load_all():
+    """{domain: CapabilityIndex} for every KB index."""
+    return {domain: load(path) for domain, path in INDEXES.items()}
+
+
+# ═══════════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════════
+
+def _option(args, name, default=None):
+    if name in args:
+        i = args.index(name)
+        value = args[i + 1]
+        del args[i:i + 2]
+        return value
+    return default
+
+
+def main(argv):
+    args = list(argv)
+    if not args or args[0] in ('-h', '--help'):
+        print(__doc__.split('Usage:')[1].rstrip())
+        return 0 if args else 1
+    command = args.pop(0)
+    index_path = _option(args, '--index')
+    stack = _option(args, '--stack')
+
+    if command == 'build':
+        for path in args or INDEXES.values():
+            tables = build(path)
+            print(f"  OK: {path} -> {compiled_path(path)} "
+                  f"({len(tables['capabilities'])} capabilities, {len(tables['features'])} features, "
+                  f"{len(tables['modules'])} modules)")
+        return 0
+
+    if not args:
+        print(f"ERROR: {command} needs an argument")
+        return 1
+    index = load(index_path)
+    if command == 'feature':
+        feature = index.feature(args[0])
+        if feature is None:
+            print(f"ERROR: feature '{args[0]}' not found in {index.source}")
+            return 1
+        if stack:
+            feature = dict(feature, module=index.module_for(args[0], stack))
+        print(json.dumps(feature, indent=2, ensure_ascii=False))
+    elif command == 'module':
+        module = index.resolve_module(args[0])
+        if module is None:
+            print(f"ERROR: module '{args[0]}' not found in {index.source}")
+            return 1
+        print(json.dumps({'module': module, 'features': index.modules[module]}, indent=2))
+    elif command == 'keyword':
+        print(json.dumps(index.match_keyword(' '.join(args)), indent=2, ensure_ascii=False))
+    else:
+        print(f"ERROR: unknown command '{command}'")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,446 @@
+"""
+validation_engine.py — In-process runner for the design-phase validators.
+
+Used by: mod-design-000 requirements-check.sh, mod-design-001 context-map-check.sh,
+         mod-design-002 aggregate-check.sh, mod-design-003 api-mapping-check.sh,
+         field-mapping-check.sh, openapi-lint.sh, mod-design-004 gherkin-syntax-check.sh,
+         coverage-check.sh, tracing-check.sh, bdd-check.sh, mod-bridge-001 manifest-check.sh
+
+Each check's rules live next to its shell script in the owning module
+(validation/<name>_check.py). A rules file declares the formats of its inputs
+and a run() function that receives the parsed trees:
+
+    INPUTS = ('yaml',)
+
+    def run(report, data, option='full-tactical'):
+        report.errors.append(...)
+
+Input formats (LOADERS): yaml, json, document (JSON for *.json files, YAML
+otherwise), lines, capability-index, feature and tracing (indexed .feature
+and scenario-tracing.yaml, see bdd_index.py).
+
+The engine parses every input once and hands the same tree to every check
+that reads it, so a batch of checks over one DESIGN tree costs one
+interpreter start and one parse per artifact instead of two of each per
+script. The shell scripts stay as thin wrappers over the line protocol below
+and keep their output and exit codes.
+
+Line protocol (stdout):
+  INVALID:<path>        input missing or not parseable; nothing else follows
+  <info line>           free-form progress lines from the check
+  ERROR:<message>
+  WARNING:<message>
+  SUMMARY:<errors>:<warnings>
+
+Usage:
+  python3 validation_engine.py <check> <input>... [option]
+  python3 validation_engine.py --batch [jobs-file]     # one "<check> <args>" per line, '-' = stdin
+  python3 validation_engine.py --files <check> <file-or-dir>... [--with <shared-input>]...
+                               [--option <value>] [-j N] [--json <report.json>|-]
+  python3 validation_engine.py --list
+
+An unknown check, a wrong number of arguments or an unreadable jobs file is
+reported as one "ERROR:<message>" line and the usage on stderr, exit code 2.
+
+--files runs one check over many files. The check's first input varies per
+file; its other inputs are given once with --with and loaded once.
+Directories are searched for the check's BATCH_PATTERN. Output is a
+"FILE:<path>" header plus the line protocol for each file, in the given
+order, or an aggregated JSON report with --json. Exits 1 if any file fails
+or is invalid, 2 on a command-line error (reported on stderr).
+
+Python API:
+  from validation_engine import Artifacts, run_check, check_files
+  artifacts = Artifacts()
+  report = run_check('aggregate', ['DESIGN/cards/aggregate-definitions.yaml'], artifacts)
+  results = check_files('manifest', ['DESIGN/'], shared=['capability-index.yaml'], jobs=4)
+"""
+
+import fnmatch
+import importlib.util
+import inspect
+import json
+import multiprocessing
+import os
+import shlex
+import sys
+import time
+from datetime import datetime, timezone
+
+import bdd_index
+import yaml_io
+
+KB_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+MODULES_DIR = os.path.join(KB_ROOT, 'modules')
+
+# Check name -> rules file, relative to modules/
+CHECKS = {
+    'requirements': 'mod-design-000-requirements-normalization/validation/requirements_check.py',
+    'context-map': 'mod-design-001-strategic-ddd/validation/context_map_check.py',
+    'aggregate': 'mod-design-002-tactical-design/validation/aggregate_check.py',
+    'api-mapping': 'mod-design-003-api-mapping/validation/api_mapping_check.py',
+    'field-mapping': 'mod-design-003-api-mapping/validation/field_mapping_check.py',
+    'openapi-lint': 'mod-design-003-api-mapping/validation/openapi_lint.py',
+    'gherkin': 'mod-design-004-bdd-scenarios/validation/gherkin_check.py',
+    'coverage': 'mod-design-004-bdd-scenarios/validation/coverage_check.py',
+    'tracing': 'mod-design-004-bdd-scenarios/validation/tracing_check.py',
+    'manifest': 'mod-bridge-001-blueprint-binding/validation/manifest_check.py',
+}
+
+
+class InvalidInput(Exception):
+    """An input file is missing or cannot be parsed in its declared format."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.path = path
+
+
+# ═══════════════════════════════════════════════════════════════
+# ARTIFACTS
+# ═══════════════════════════════════════════════════════════════
+
+def _read_lines(f):
+    return f.read().splitlines()
+
+
+def _read_document(f):
+    """JSON for *.json files (e.g. contract-gen.py --format json), YAML otherwise."""
+    if f.name.endswith('.json'):
+        return json.load(f)
+    return yaml_io.load(f)
+
+
+def _capability_index(f):
+    import capability_index
+    return capability_index.load(f.name)
+
+
+LOADERS = {
+    'yaml': yaml_io.load,
+    'json': json.load,
+    'document': _read_document,
+    'lines': _read_lines,
+    'capability-index': _capability_index,
+    'feature': bdd_index.load_feature,
+    'tracing': bdd_index.load_tracing,
+}
+
+
+class Artifacts:
+    """
+    Parsed input files, keyed by (real path, format). An entry is reused while
+    the file's (mtime_ns, size) is unchanged, so a resident caller sees edits.
+    Trees are shared between checks and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self.loads = 0
+        self.hits = 0
+
+    def get(self, path, fmt):
+        key = (os.path.realpath(path), fmt)
+        try:
+            st = os.stat(key[0])
+        except OSError:
+            raise InvalidInput(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(key)
+        if cached and cached[0] == stamp:
+            self.hits += 1
+            return cached[1]
+        try:
+            with open(key[0]) as f:
+                data = LOADERS[fmt](f)
+        except (OSError, UnicodeDecodeError, ValueError, yaml_io.yaml.YAMLError):
+            raise InvalidInput(path)
+        self._cache[key] = (stamp, data)
+        self.loads += 1
+        return data
+
+
+# ═══════════════════════════════════════════════════════════════
+# CHECKS
+# ═══════════════════════════════════════════════════════════════
+
+class Report:
+    def __init__(self, check):
+        self.check = check
+        self.info = []
+        self.errors = []
+        self.warnings = []
+        self.invalid = None
+
+    def lines(self):
+        if self.invalid is not None:
+            return [f"INVALID:{self.invalid}"]
+        return (self.info
+                + [f"ERROR:{e}" for e in self.errors]
+                + [f"WARNING:{w}" for w in self.warnings]
+                + [f"SUMMARY:{len(self.errors)}:{len(self.warnings)}"])
+
+
+_rules = {}
+
+
+def load_rules(name):
+    """Import the rules file registered for check `name` (once per process)."""
+    if name not in _rules:
+        if name not in CHECKS:
+            raise KeyError(f"Unknown check '{name}' (available: {', '.join(CHECKS)})")
+        path = os.path.join(MODULES_DIR, CHECKS[name])
+        spec = importlib.util.spec_from_file_location(f"checks.{name.replace('-', '_')}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _rules[name] = module
+    return _rules[name]
+
+
+def run_check(name, args, artifacts=None):
+    """
+    Run check `name` on `args` (input paths, then any options) and return its
+    Report. A failure inside the rules is reported as an error rather than
+    passing silently.
+    """
+    rules = load_rules(name)
+    artifacts = artifacts if artifacts is not None else Artifacts()
+    report = Report(name)
+    paths, options = args[:len(rules.INPUTS)], args[len(rules.INPUTS):]
+    try:
+        if len(paths) < len(rules.INPUTS):
+            raise TypeError
+        inspect.signature(rules.run).bind(report, *paths, *options)
+    except TypeError:
+        most = len(inspect.signature(rules.run).parameters) - 1 - len(rules.INPUTS)
+        expected = f"{len(rules.INPUTS)} input file(s)" + (f" and up to {most} option(s)" if most else "")
+        raise TypeError(f"check '{name}' expects {expected}, got {len(args)} argument(s)") from None
+    try:
+        inputs = [artifacts.get(p, fmt) for p, fmt in zip(paths, rules.INPUTS)]
+    except InvalidInput as e:
+        report.invalid = e.path
+        return report
+    try:
+        rules.run(report, *inputs, *options)
+    except Exception as e:
+        report.errors.append(f"Validation crashed: {type(e).__name__}: {e}")
+    return report
+
+
+def run_batch(lines, artifacts=None, out=sys.stdout):
+    """
+    Run one check per "<check> <args>" line (blank lines and # comments are
+    skipped), sharing parsed inputs across jobs. Each job's output is
+    preceded by a "JOB:<line>" header. Returns the number of jobs with errors.
+    A line that names no known check, or gives it the wrong number of
+    arguments, stops the batch with a ValueError naming the line.
+    """
+    artifacts = artifacts if artifacts is not None else Artifacts()
+    failed = 0
+    for n, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            name, *args = shlex.split(line)
+            report = run_check(name, args, artifacts)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"job line {n}: {e.args[0]}") from None
+        out.write(f"JOB:{line}\n")
+        out.write(''.join(f"{l}\n" for l in report.lines()))
+        failed += bool(report.errors or report.invalid is not None)
+    return failed
+
+
+# ═══════════════════════════════════════════════════════════════
+# FILES (one check, many inputs)
+# ═══════════════════════════════════════════════════════════════
+
+def collect_files(paths, pattern):
+    """
+    `paths` with every directory replaced by the files under it whose name
+    matches `pattern`, sorted. Files named directly are kept as given.
+    """
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        if pattern is None:
+            raise ValueError(f"{path} is a directory; this check takes files only")
+        found = []
+        for root, dirs, names in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+            found.extend(os.path.join(root, n) for n in names if fnmatch.fnmatch(n, pattern))
+        files.extend(sorted(found))
+    return files
+
+
+# Set in the parent before forking workers, inherited by them
+_files_job = None
+
+
+def _check_file(path):
+    name, shared, options, artifacts = _files_job
+    return run_check(name, [path, *shared, *options], artifacts)
+
+
+def check_files(name, paths, shared=(), options=(), jobs=1, artifacts=None):
+    """
+    Run check `name` on every file in `paths` (directories are searched for
+    the check's BATCH_PATTERN). Shared inputs are parsed once, before any
+    worker starts. With jobs > 1 the files are split across forked worker
+    processes. Returns [(path, Report)] in file order.
+    """
+    global _files_job
+    rules = load_rules(name)
+    files = collect_files(paths, getattr(rules, 'BATCH_PATTERN', None))
+    artifacts = artifacts if artifacts is not None else Artifacts()
+    shared = list(shared)
+    if len(shared) != len(rules.INPUTS) - 1:
+        raise TypeError(f"check '{name}' expects {len(rules.INPUTS) - 1} shared input(s), got {len(shared)}")
+    for path, fmt in zip(shared, rules.INPUTS[1:]):
+        try:
+            artifacts.get(path, fmt)
+        except InvalidInput:
+            pass  # reported per file by run_check
+
+    _files_job = (name, shared, list(options), artifacts)
+    jobs = min(jobs, len(files))
+    if jobs > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        with multiprocessing.get_context('fork').Pool(jobs) as pool:
+            reports = pool.map(_check_file, files, chunksize=max(1, len(files) // (jobs * 4)))
+    else:
+        reports = [_check_file(path) for path in files]
+    return list(zip(files, reports))
+
+
+def file_result(report):
+    if report.invalid is not None:
+        return 'INVALID'
+    return 'FAIL' if report.errors else 'PASS'
+
+
+def files_report(name, results, shared, options, duration_ms):
+    """Aggregated JSON report for check_files() results."""
+    entries = [{
+        'file': path,
+        'result': file_result(report),
+        'errors': report.errors,
+        'warnings': report.warnings,
+        'info': [line.strip() for line in report.info],
+    } for path, report in results]
+    counts = [e['result'] for e in entries]
+    return {
+        'version': '1.0',
+        'check': name,
+        'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'shared_inputs': list(shared),
+        'options': list(options),
+        'summary': {
+            'overall_result': 'FAIL' if any(c != 'PASS' for c in counts) else 'PASS',
+            'total_files': len(entries),
+            'passed': counts.count('PASS'),
+            'failed': counts.count('FAIL'),
+            'invalid': counts.count('INVALID'),
+            'total_errors': sum(len(e['errors']) for e in entries),
+            'total_warnings': sum(len(e['warnings']) for e in entries),
+            'duration_ms': duration_ms,
+        },
+        'files': entries,
+    }
+
+
+def usage_error(message):
+    """Report a command-line mistake on stderr; returns the exit code (2)."""
+    print(f"validation_engine.py: {message}", file=sys.stderr)
+    return 2
+
+
+def files_main(argv):
+    if not argv:
+        return usage_error("--files needs a check name")
+    name, paths, shared, options, jobs, json_out = argv[0], [], [], [], 1, None
+    if name not in CHECKS:
+        return usage_error(f"unknown check '{name}' (available: {', '.join(CHECKS)})")
+    args = iter(argv[1:])
+    for arg in args:
+        if arg not in ('--with', '--option', '-j', '--json'):
+            paths.append(arg)
+            continue
+        value = next(args, None)
+        if value is None:
+            return usage_error(f"{arg} needs a value")
+        if arg == '--with':
+            shared.append(value)
+        elif arg == '--option':
+            options.append(value)
+        elif arg == '-j':
+            try:
+                jobs = int(value)
+            except ValueError:
+                return usage_error(f"-j needs a number of worker processes, got '{value}'")
+        else:
+            json_out = value
+    if not paths:
+        return usage_error(f"--files {name} needs at least one file or directory")
+    expected = len(load_rules(name).INPUTS) - 1
+    if len(shared) != expected:
+        return usage_error(f"check '{name}' takes {expected} --with input(s), got {len(shared)}")
+
+    start = time.perf_counter()
+    try:
+        results = check_files(name, paths, shared, options, jobs)
+    except (TypeError, ValueError) as e:
+        return usage_error(str(e))
+    duration_ms = int((time.perf_counter() - start) * 1000)
+    if json_out:
+        report = files_report(name, results, shared, options, duration_ms)
+        if json_out == '-':
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            with open(json_out, 'w') as f:
+                json.dump(report, f, indent=2)
+                f.write('\n')
+    if json_out != '-':
+        for path, report in results:
+            print(f"FILE:{path}")
+            print('\n'.join(report.lines()))
+    return 1 if any(file_result(r) != 'PASS' for _, r in results) else 0
+
+
+def usage():
+    return __doc__.split('Usage:')[1].split('Python API:')[0].rstrip()
+
+
+def main(argv):
+    if not argv or argv[0] in ('-h', '--help'):
+        print(usage())
+        return 0 if argv else 1
+    if argv[0] == '--list':
+        for name, path in CHECKS.items():
+            print(f"{name:14} modules/{path}")
+        return 0
+    if argv[0] == '--files':
+        return files_main(argv[1:])
+    try:
+        if argv[0] == '--batch':
+            source = argv[1] if len(argv) > 1 else '-'
+            if source == '-':
+                return 1 if run_batch(sys.stdin) else 0
+            with open(source) as f:
+                return 1 if run_batch(f) else 0
+        report = run_check(argv[0], argv[1:])
+    except (KeyError, TypeError, ValueError, OSError) as e:
+        # Unknown check, wrong arguments or unreadable jobs file: no traceback
+        print(f"ERROR:{e.args[0] if isinstance(e, KeyError) else e}", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        return 2
+
+    print('\n'.join(report.lines()))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
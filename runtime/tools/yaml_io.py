@@ -0,0 +1,132 @@
+"""
+yaml_io.py — Shared YAML load/dump for the KB Python tooling.
+
+Used by: mod-bridge-001 contract-gen.py, validation_engine.py (design-phase
+         and manifest validators), capability_index.py, bdd_index.py
+
+Parses and emits through libyaml (CSafeLoader / CSafeDumper) when PyYAML was
+built with it, falling back to the pure-Python implementation otherwise.
+
+dump() output is byte-identical to
+    yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+The libyaml emitter folds long double-quoted scalars and escapes astral
+characters differently from the pure-Python one, so documents containing any
+string that would need double quotes (control characters, line breaks,
+characters outside the BMP) are emitted with the pure-Python dumper.
+
+Shell validators reach this module through PYTHONPATH:
+  export PYTHONPATH="$KB_ROOT/runtime/tools${PYTHONPATH:+:$PYTHONPATH}"
+"""
+
+import re
+
+import yaml
+
+LIBYAML = bool(getattr(yaml, '__with_libyaml__', False))
+
+Loader = yaml.CSafeLoader if LIBYAML else yaml.SafeLoader
+Dumper = yaml.CSafeDumper if LIBYAML else yaml.SafeDumper
+
+DUMP_DEFAULTS = {'default_flow_style': False, 'sort_keys': False, 'allow_unicode': True}
+
+# Characters both emitters write unescaped in plain or single-quoted style
+_NEEDS_PY_EMITTER = re.compile(r'[^\x20-\x7e\xa0-\ud7ff\ue000-\ufefe\uff00-\ufffd]')
+
+
+def load(stream):
+    """Parse a YAML string or stream with the fastest available safe loader."""
+    return yaml.load(stream, Loader=Loader)
+
+
+def load_file(path):
+    with open(path) as f:
+        return load(f)
+
+
+class _IncrementalLoader(yaml.composer.Composer, Loader):
+    """Loader whose nodes are composed on demand instead of per document."""
+
+    def __init__(self, stream):
+        Loader.__init__(self, stream)
+        yaml.composer.Composer.__init__(self)
+
+
+def iter_items(path, key):
+    """
+    Yield the items of the top-level sequence `key` in a YAML mapping file
+    one at a time, without building the rest of the document.
+
+    Memory stays bounded by the largest single item, which is what lets the
+    bridge stream contexts with thousands of aggregates. Other top-level
+    values are parsed and discarded.
+    """
+    with open(path) as f:
+        loader = _IncrementalLoader(f)
+        try:
+            loader.get_event()                                  # StreamStart
+            if loader.check_event(yaml.StreamEndEvent):
+                return
+            loader.get_event()                                  # DocumentStart
+            if not loader.check_event(yaml.MappingStartEvent):
+                return
+            loader.get_event()
+            while not loader.check_event(yaml.MappingEndEvent):
+                name = loader.construct_document(loader.compose_node(None, None))
+                if name == key and loader.check_event(yaml.SequenceStartEvent):
+                    loader.get_event()
+                    index = 0
+                    while not loader.check_event(yaml.SequenceEndEvent):
+                        yield loader.construct_document(loader.compose_node(None, index))
+                        index += 1
+                    loader.get_event()
+                else:
+                    loader.compose_node(None, None)
+        finally:
+            loader.dispose()
+
+
+def _emitter_safe(node):
+    """True if libyaml emits this tree exactly like the pure-Python emitter."""
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            if _NEEDS_PY_EMITTER.search(value):
+                return False
+        elif isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return True
+
+
+class _NoAliasDumper(Dumper):
+    def ignore_aliases(self, data):
+        return True
+
+
+class _NoAliasPyDumper(yaml.SafeDumper):
+    def ignore_aliases(self, data):
+        return True
+
+
+def dump(data, stream=None, aliases=True, **kwargs):
+    """
+    Serialise data as block-style YAML, preserving key order.
+    Returns the text when stream is None, like yaml.dump().
+
+    aliases=False writes shared objects out in full at every occurrence
+    instead of as &anchor/*alias pairs (the data must not be recursive).
+    """
+    options = dict(DUMP_DEFAULTS, **kwargs)
+    fast, pure = (Dumper, yaml.SafeDumper) if aliases else (_NoAliasDumper, _NoAliasPyDumper)
+    dumper = fast
+    if fast is not pure and LIBYAML and not _emitter_safe(data):
+        dumper = pure
+    return yaml.dump(data, stream, Dumper=dumper, **options)
+
+
+def dump_file(data, path, aliases=True, **kwargs):
+    with open(path, 'w') as f:
+        dump(data, f, aliases=aliases, **kwargs)
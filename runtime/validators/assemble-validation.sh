@@ -144,6 +144,38 @@ for module in "${MODULES[@]}"; do
     fi
 done
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared script libraries (sourced by tier scripts from scripts/lib/)
+# ─────────────────────────────────────────────────────────────────────────────
+echo ""
+echo "▶ Script libraries..."
+LIB_SRC="$KB_ROOT/runtime/validators/lib"
+if [ -d "$LIB_SRC" ]; then
+    mkdir -p "$VALIDATION_DIR/scripts/lib"
+    for lib in "$LIB_SRC"/*.sh; do
+        if [ -f "$lib" ] && [[ ! "$(basename "$lib")" == ._* ]]; then
+            cp "$lib" "$VALIDATION_DIR/scripts/lib/"
+            echo "   ✓ $(basename "$lib") -> scripts/lib/"
+        fi
+    done
+else
+    echo "   ⚠ Source not found: $LIB_SRC"
+fi
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Trace schemas (traceability-check.sh validates the manifest and trace/ files)
+# ─────────────────────────────────────────────────────────────────────────────
+echo ""
+echo "▶ Trace schemas..."
+SCHEMAS_SRC="$KB_ROOT/runtime/schemas/trace"
+if [ -d "$SCHEMAS_SRC" ]; then
+    mkdir -p "$VALIDATION_DIR/schemas"
+    cp "$SCHEMAS_SRC"/*.schema.json "$VALIDATION_DIR/schemas/"
+    echo "   ✓ $(ls "$SCHEMAS_SRC"/*.schema.json | wc -l | tr -d ' ') schemas -> schemas/"
+else
+    echo "   ⚠ Source not found: $SCHEMAS_SRC"
+fi
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Copy and configure run-all.sh
 # ─────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,277 @@
+#!/bin/sh
+# ═══════════════════════════════════════════════════════════════════════════════
+# java-index.sh — One-pass fact index of the Java sources under a directory
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# PURPOSE:
+#   Reads every .java file under a directory once (one awk pass) and records
+#   what the conformance and syntax checks ask about, so they query the index
+#   instead of re-running grep/find per file and per check.
+#
+# USAGE:
+#   ./java-index.sh <dir>                     # print the index
+#
+#   . "$LIB_DIR/java-index.sh"                # as a library
+#   java_index_build "$SERVICE_DIR"           # sets JAVA_INDEX / JAVA_INDEX_ROOT
+#   java_files 'ModelAssembler\.java$'        # indexed files whose name matches
+#   java_checks 'Adapter\.java$' 'annotation=^@Retry$'
+#                                             # per matching file: path + 1/0 per check
+#
+#   With JAVA_INDEX_CACHE set (run-all.sh sets it to its work directory) the
+#   index of a directory is built once and shared by every script of the run;
+#   otherwise it goes to a temporary file removed when the caller exits.
+#
+# INDEX FORMAT (tab-separated, one fact per line, paths relative to <dir>):
+#   <file>  file
+#   <file>  package     <name>          <line>
+#   <file>  type        <Name>          <class|interface|enum|record>  <line>
+#   <file>  extends     <Type>          <declaring type>
+#   <file>  implements  <Type>          <declaring type>
+#   <file>  annotation  <@Name>         <line>
+#   <file>  field       <NAME>          <modifiers and type>           <line>   (static final only)
+#   <file>  ident       <identifier>                                   (once per file)
+#   <file>  lint        <issue>         <line>                         (replace-3-args, unclosed-string,
+#                                                                   transactional; systemapi: first line only)
+#   <file>  braces      <open>          <close>
+#   <file>  parens      <open>          <close>
+#
+#   Declarations, annotations and identifiers are read from code with
+#   comments and string literals removed; lint facts and brace/paren counts
+#   from the raw text, as the grep-based checks did.
+#
+# POSIX COMPATIBLE - sh and any POSIX awk
+#
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Print the index of the .java files under $1
+java_index_scan() {
+    (cd "$1" && find . -name "*.java" -type f 2>/dev/null | sed 's|^\./||' | tr '\n' '\0' \
+        | xargs -0 awk '
+function flush() {
+    if (file == "") return
+    print file, "braces", ob, cb
+    print file, "parens", op, cp
+}
+# Code of one line with comments and string/char literals removed
+function strip(s) {
+    if (inblock) {
+        if (!match(s, /\*\//)) return ""
+        s = substr(s, RSTART + 2)
+        inblock = 0
+    }
+    gsub(/"([^"\\]|\\.)*"/, "\"\"", s)
+    gsub(/\047([^\047\\]|\\.)*\047/, "\047\047", s)
+    gsub(/\/\*([^*]|\*+[^*\/])*\*+\//, " ", s)
+    sub(/\/\/.*/, "", s)
+    if (match(s, /\/\*/)) {
+        s = substr(s, 1, RSTART - 1)
+        inblock = 1
+    }
+    return s
+}
+function clause(list, kind, owner,    n, parts, i, t) {
+    sub(/[ \t]permits[ \t].*/, "", list)
+    n = split(list, parts, ",")
+    for (i = 1; i <= n; i++) {
+        t = parts[i]
+        gsub(/[ \t]/, "", t)
+        if (t != "") print file, kind, t, owner
+    }
+}
+# Type declaration header: "class Name<T> extends A implements B, C {"
+function decl(h, line,    d, w, kind, name, rest, ext, impl) {
+    match(h, /(class|interface|enum|record)[ \t]+[A-Za-z_$][A-Za-z0-9_$]*/)
+    d = substr(h, RSTART, RLENGTH)
+    rest = substr(h, RSTART + RLENGTH)
+    split(d, w, /[ \t]+/)
+    kind = w[1]
+    name = w[2]
+    print file, "type", name, kind, line
+    sub(/\{.*/, "", rest)
+    while (gsub(/<[^<>]*>/, "", rest)) ;
+    if (kind == "record") sub(/^[ \t]*\([^)]*\)/, "", rest)
+    ext = rest
+    impl = ""
+    if (match(rest, /(^|[ \t])implements[ \t]/)) {
+        impl = substr(rest, RSTART + RLENGTH)
+        ext = substr(rest, 1, RSTART - 1)
+    }
+    if (match(ext, /(^|[ \t])extends[ \t]/)) clause(substr(ext, RSTART + RLENGTH), "extends", name)
+    if (impl != "") clause(impl, "implements", name)
+}
+BEGIN { OFS = "\t" }
+FNR == 1 {
+    flush()
+    file = FILENAME
+    inblock = 0
+    header = ""
+    quoted = 0
+    systemapi = 0
+    seen_package = 0
+    ob = cb = op = cp = 0
+    split("", seen)
+    print file, "file"
+}
+{
+    raw = $0
+    t = raw; ob += gsub(/\{/, "", t)
+    t = raw; cb += gsub(/\}/, "", t)
+    t = raw; op += gsub(/\(/, "", t)
+    t = raw; cp += gsub(/\)/, "", t)
+    if (raw ~ /\.replace[ \t]*\([ \t]*"[^"]*"[ \t]*,[ \t]*"[^"]*"[ \t]*,[ \t]*[^)]+\)/)
+        print file, "lint", "replace-3-args", FNR
+    if (index(raw, "@Transactional"))
+        print file, "lint", "transactional", FNR
+    if (!systemapi && raw ~ /systemapi|SystemApi|system-api/) {
+        print file, "lint", "systemapi", FNR
+        systemapi = 1
+    }
+    # Odd number of quotes on one of the first 100 lines that have any
+    if (index(raw, "\"") && quoted < 100) {
+        quoted++
+        t = raw
+        gsub(/\\"/, "X", t)
+        if (gsub(/"/, "", t) % 2) print file, "lint", "unclosed-string", FNR
+    }
+
+    code = strip(raw)
+    if (code ~ /^[ \t]*$/) next
+
+    if (header != "") {
+        header = header " " code
+        if (index(code, "{") || index(code, ";")) {
+            decl(header, header_line)
+            header = ""
+        }
+    } else if (match(code, /(^|[^A-Za-z0-9_$.])(class|interface|enum|record)[ \t]+[A-Za-z_$][A-Za-z0-9_$]*/)) {
+        h = substr(code, RSTART)
+        if (index(h, "{") || index(h, ";")) decl(h, FNR)
+        else { header = h; header_line = FNR }
+    }
+
+    if (!seen_package && match(code, /^[ \t]*package[ \t]+[A-Za-z_][A-Za-z0-9_.]*/)) {
+        d = substr(code, RSTART, RLENGTH)
+        sub(/^[ \t]*package[ \t]+/, "", d)
+        print file, "package", d, FNR
+        seen_package = 1
+    }
+
+    s = code
+    while (match(s, /@[A-Za-z_$][A-Za-z0-9_$.]*/)) {
+        a = substr(s, RSTART, RLENGTH)
+        if (a != "@interface") print file, "annotation", a, FNR
+        s = substr(s, RSTART + RLENGTH)
+    }
+
+    d = code
+    sub(/[=;].*/, "", d)
+    if (d ~ /(^|[ \t])static[ \t]/ && d ~ /(^|[ \t])final[ \t]/ && d !~ /[(){]/) {
+        gsub(/[ \t]+/, " ", d)
+        sub(/^ /, "", d)
+        sub(/ $/, "", d)
+        n = split(d, w, " ")
+        if (n >= 3) {
+            mods = w[1]
+            for (i = 2; i < n; i++) mods = mods " " w[i]
+            print file, "field", w[n], mods, FNR
+        }
+    }
+
+    s = code
+    gsub(/[^A-Za-z0-9_$]+/, " ", s)
+    n = split(s, w, " ")
+    for (i = 1; i <= n; i++) {
+        if (w[i] ~ /^[A-Za-z_$]/ && !(w[i] in seen)) {
+            seen[w[i]] = 1
+            print file, "ident", w[i]
+        }
+    }
+}
+END { flush() }
+')
+}
+
+# java_index_build <dir>: index <dir> (or reuse this run's index of it) and
+# set JAVA_INDEX to the index file and JAVA_INDEX_ROOT to <dir>
+java_index_build() {
+    JAVA_INDEX_ROOT="$1"
+    if [ -n "${JAVA_INDEX_CACHE:-}" ] && [ -d "$JAVA_INDEX_CACHE" ]; then
+        key=$(cd "$1" && pwd -P | cksum | cut -d' ' -f1)
+        JAVA_INDEX="$JAVA_INDEX_CACHE/java-index.$key.tsv"
+        if [ ! -f "$JAVA_INDEX" ]; then
+            java_index_scan "$1" > "$JAVA_INDEX.$$"
+            mv "$JAVA_INDEX.$$" "$JAVA_INDEX"
+        fi
+    else
+        JAVA_INDEX=$(mktemp "${TMPDIR:-/tmp}/java-index.XXXXXX")
+        trap 'rm -f "$JAVA_INDEX"' EXIT
+        java_index_scan "$1" > "$JAVA_INDEX"
+    fi
+}
+
+# java_files [name-regex]: paths (under JAVA_INDEX_ROOT) of the indexed files
+# whose file name matches the ERE, in walk order
+java_files() {
+    JAVA_NAME="${1:-.}" java_checks_scan
+}
+
+# java_checks <name-regex> <kind>=<value-regex>[=<detail-regex>]...
+#   One line per indexed file whose name matches: its path, then a TAB and
+#   1 or 0 per check (1 = the file has a <kind> record whose value, and next
+#   column, match). All files and checks in one pass over the index, e.g.
+#     java_checks 'Adapter\.java$' 'annotation=^@Retry$' 'implements=Repository'
+java_checks() {
+    JAVA_NAME="$1"
+    shift
+    JAVA_NAME="$JAVA_NAME" JAVA_CHECKS="$(printf '%s\n' "$@")" java_checks_scan
+}
+
+# Regexes reach awk through the environment: -v would expand their escapes
+java_checks_scan() {
+    awk -F'\t' -v root="$JAVA_INDEX_ROOT" '
+function flush(    i, line) {
+    if (!want) return
+    line = root "/" file
+    for (i = 1; i <= nc; i++) line = line OFS (hit[i] ? 1 : 0)
+    print line
+}
+BEGIN {
+    OFS = "\t"
+    name = ENVIRON["JAVA_NAME"]
+    nc = split(ENVIRON["JAVA_CHECKS"], spec, "\n")
+    for (i = 1; i <= nc; i++) {
+        j = index(spec[i], "=")
+        kind[i] = substr(spec[i], 1, j - 1)
+        val[i] = substr(spec[i], j + 1)
+        det[i] = ""
+        if ((j = index(val[i], "=")) > 0) {
+            det[i] = substr(val[i], j + 1)
+            val[i] = substr(val[i], 1, j - 1)
+        }
+    }
+}
+$2 == "file" {
+    flush()
+    file = $1
+    n = $1
+    sub(/.*\//, "", n)
+    want = (n ~ name)
+    split("", hit)
+    next
+}
+want {
+    for (i = 1; i <= nc; i++)
+        if (!hit[i] && $2 == kind[i] && $3 ~ val[i] && $4 ~ det[i]) hit[i] = 1
+}
+END { flush() }' "$JAVA_INDEX"
+}
+
+case "$0" in
+    *java-index.sh)
+        if [ $# -lt 1 ] || [ ! -d "$1" ]; then
+            echo "Usage: java-index.sh <dir>"
+            exit 1
+        fi
+        java_index_scan "$1"
+        ;;
+esac
@@ -11,11 +11,31 @@
 #
 # ═══════════════════════════════════════════════════════════════════
 #
-# USAGE: ./run-all.sh
+# USAGE: ./run-all.sh [-j N] [--no-cache]
 #
 # This script runs all validation scripts in tier0, tier1, tier2, tier3 directories
 # and generates a JSON report.
 #
+# PARALLEL MODE:
+# - -j N (or VALIDATION_JOBS=N) runs up to N scripts of a tier at once (default: 1)
+# - Tiers still run one after another
+# - A script that must wait for others in its tier declares it in its header:
+#     # RUN_AFTER: compile-check
+# - Results are printed and reported in script order, whatever order they finish in
+#
+# RESULT CACHE:
+# - Each script's exit code and output are stored in .cache/ under a key built
+#   from the script's content and the content of its inputs, and replayed
+#   instead of re-running the script while neither changes
+# - Inputs default to every file of the directory the script receives
+#   (build output - target/, build/, .gradle/, .git/ at the top of the project -
+#   is ignored). A script can narrow them in its header, as shell patterns
+#   relative to that directory (* also matches /, a directory covers its files):
+#     # CACHE_INPUTS: pom.xml src/main/*.java
+# - A script whose result depends on more than its files opts out with:
+#     # CACHE: off
+# - --no-cache (or VALIDATION_CACHE=0) runs every script
+#
 # IMPORTANT: 
 # - Tier-0 scripts receive PACKAGE_DIR (the generation package root)
 # - Tier 1-3 scripts receive PROJECT_DIR (the generated project)
@@ -35,6 +55,31 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PACKAGE_DIR="$SCRIPT_DIR/.."
 PROJECT_DIR="$SCRIPT_DIR/../output/{{SERVICE_NAME}}"
 REPORTS_DIR="$SCRIPT_DIR/reports"
+CACHE_DIR="$SCRIPT_DIR/.cache"
+
+# Worker count: -j N / --jobs N, or VALIDATION_JOBS
+JOBS="${VALIDATION_JOBS:-1}"
+CACHE="${VALIDATION_CACHE:-1}"
+while [[ $# -gt 0 ]]; do
+    case "$1" in
+        -j|--jobs) JOBS="$2"; shift 2 ;;
+        -j*) JOBS="${1#-j}"; shift ;;
+        --no-cache) CACHE=0; shift ;;
+        *) echo "Usage: $0 [-j N] [--no-cache]"; exit 1 ;;
+    esac
+done
+if ! [[ "$JOBS" =~ ^[1-9][0-9]*$ ]]; then
+    echo "ERROR: worker count must be a positive integer (got '$JOBS')"
+    exit 1
+fi
+
+# Captured output and exit code of each script
+WORK_DIR="$(mktemp -d "${TMPDIR:-/tmp}/run-all.XXXXXX")"
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+# scripts/lib/java-index.sh indexes the Java sources once per run and shares
+# the index between the scripts that use it (tier 0 conformance, tier 2 syntax)
+export JAVA_INDEX_CACHE="$WORK_DIR"
 
 # Colors for output (compatible with bash 3.2+)
 RED='\033[0;31m'
@@ -47,6 +92,15 @@ NC='\033[0m' # No Color
 TOTAL_PASSED=0
 TOTAL_FAILED=0
 TOTAL_SKIPPED=0
+CACHE_HITS=0
+CACHE_MISSES=0
+
+# Content hashing (sha256sum on Linux, shasum on macOS)
+if command -v sha256sum >/dev/null 2>&1; then
+    HASH_CMD="sha256sum"
+else
+    HASH_CMD="shasum -a 256"
+fi
 
 # Results for JSON report
 declare -a TIER0_RESULTS
@@ -54,26 +108,15 @@ declare -a TIER1_RESULTS
 declare -a TIER2_RESULTS
 declare -a TIER3_RESULTS
 
-run_validation() {
+record_result() {
     local tier=$1
-    local script=$2
-    local target_dir=$3
-    local name=$(basename "$script" .sh)
+    local name=$2
+    local exit_code=$3
+    local output=$4
     
     # Aligned output
     printf "  %-40s " "$name"
     
-    # Ensure script is executable
-    if [[ ! -x "$script" ]]; then
-        chmod +x "$script"
-    fi
-    
-    # Run script and capture output and exit code
-    local output
-    local exit_code
-    output=$("$script" "$target_dir" 2>&1)
-    exit_code=$?
-    
     # Process result based on exit code
     case $exit_code in
         0)
@@ -96,7 +139,213 @@ run_validation() {
     esac
 }
 
+hash_stdin() {
+    $HASH_CMD | cut -d' ' -f1
+}
+
+# Scripts source the shared libraries in scripts/lib, so they are part of
+# every cache key
+LIB_HASH=$(cat "$SCRIPT_DIR"/scripts/lib/*.sh 2>/dev/null | hash_stdin)
+
+# "<hash>  <path>" for every file under a directory, sorted by path, leaving
+# out build output, VCS data and this runner's own cache and reports.
+# Build output is only pruned at the top of the directory and of the project
+# inside it (tier 0): a package named build/ or target/ deeper in the tree is
+# source.
+tree_manifest() {
+    local dir project d
+    dir="$(cd "$1" && pwd)"
+    project="$(cd "$PROJECT_DIR" 2>/dev/null && pwd)"
+    local prune=(-path ./.git -o -path ./target -o -path ./build -o -path ./.gradle)
+    for d in "$project/.git" "$project/target" "$project/build" "$project/.gradle" \
+             "$CACHE_DIR" "$REPORTS_DIR"; do
+        case "$d" in
+            "$dir"/*) prune+=(-o -path "./${d#$dir/}") ;;
+        esac
+    done
+    (cd "$dir" && find . \( "${prune[@]}" \) -prune -o -type f -print \
+        | sed 's|^\./||' | LC_ALL=C sort | tr '\n' '\0' | xargs -0 $HASH_CMD)
+}
+
+# Cache key of a script run: script and scripts/lib content, target directory
+# and the manifest lines of its inputs (all of them unless it declares
+# CACHE_INPUTS)
+cache_key() {
+    local script=$1
+    local target_dir=$2
+    local manifest=$3
+    local inputs line path pattern
+    local patterns=()
+    
+    inputs=$(sed -n 's/^# CACHE_INPUTS:[[:space:]]*//p' "$script" | head -1)
+    read -r -a patterns <<< "$inputs"
+    {
+        hash_stdin < "$script"
+        echo "$LIB_HASH"
+        echo "$target_dir"
+        if [[ ${#patterns[@]} -eq 0 ]]; then
+            cat "$manifest"
+        else
+            while IFS= read -r line; do
+                path=${line#*  }
+                for pattern in "${patterns[@]}"; do
+                    case "$path" in
+                        $pattern|$pattern/*) echo "$line"; break ;;
+                    esac
+                done
+            done < "$manifest"
+        fi
+    } | hash_stdin
+}
+
+# Run one script, leaving its output in $job.out and its exit code in $job.rc
+# (.rc is written last, so its presence means the script has finished).
+# With a manifest, a cached result is replayed instead when there is one;
+# $job.cache then records HIT or MISS and $job.key the cache key.
+run_script() {
+    local script=$1
+    local target_dir=$2
+    local job=$3
+    local manifest=$4
+    local exit_code key
+    
+    if [[ -n "$manifest" ]] && ! grep -q '^# CACHE:[[:space:]]*off' "$script"; then
+        key=$(cache_key "$script" "$target_dir" "$manifest")
+        echo "$key" > "$job.key"
+        if [[ -f "$CACHE_DIR/$key.rc" ]]; then
+            cp "$CACHE_DIR/$key.out" "$job.out"
+            echo HIT > "$job.cache"
+            cp "$CACHE_DIR/$key.rc" "$job.rc.tmp"
+            mv "$job.rc.tmp" "$job.rc"
+            return
+        fi
+        echo MISS > "$job.cache"
+    fi
+    
+    "$script" "$target_dir" > "$job.out" 2>&1
+    exit_code=$?
+    if [[ -n "$key" ]]; then
+        cp "$job.out" "$CACHE_DIR/$key.out"
+        echo "$exit_code" > "$CACHE_DIR/$key.rc.tmp"
+        mv "$CACHE_DIR/$key.rc.tmp" "$CACHE_DIR/$key.rc"
+    fi
+    echo "$exit_code" > "$job.rc.tmp"
+    mv "$job.rc.tmp" "$job.rc"
+}
+
+# Names of the scripts (same tier) this one must wait for
+run_after() {
+    sed -n 's/^# RUN_AFTER:[[:space:]]*//p' "$1" | head -1
+}
+
+run_tier() {
+    local tier=$1
+    local target_dir=$2
+    shift 2
+    local scripts=("$@")
+    local count=${#scripts[@]}
+    local names=() after=() state=()
+    local i j dep ready running=0 reported=0 started job
+    local manifest=""
+    
+    if [[ "$CACHE" != 0 && $count -gt 0 ]]; then
+        manifest="$WORK_DIR/tier$tier.manifest"
+        tree_manifest "$target_dir" > "$manifest"
+    fi
+    
+    for ((i = 0; i < count; i++)); do
+        names[i]=$(basename "${scripts[i]}" .sh)
+        after[i]=$(run_after "${scripts[i]}")
+        state[i]=pending
+        # Ensure script is executable
+        if [[ ! -x "${scripts[i]}" ]]; then
+            chmod +x "${scripts[i]}"
+        fi
+    done
+    
+    while ((reported < count)); do
+        # Start every pending script whose RUN_AFTER scripts are done, up to JOBS
+        started=0
+        for ((i = 0; i < count && running < JOBS; i++)); do
+            [[ ${state[i]} == pending ]] || continue
+            ready=1
+            for dep in ${after[i]}; do
+                for ((j = 0; j < count; j++)); do
+                    if [[ ${names[j]} == "$dep" && ${state[j]} != done ]]; then
+                        ready=0
+                    fi
+                done
+            done
+            ((ready)) || continue
+            job="$WORK_DIR/tier$tier.$i"
+            if ((JOBS > 1)); then
+                run_script "${scripts[i]}" "$target_dir" "$job" "$manifest" &
+            else
+                run_script "${scripts[i]}" "$target_dir" "$job" "$manifest"
+            fi
+            state[i]=running
+            ((running++))
+            started=1
+        done
+        
+        # Nothing runnable and nothing running: RUN_AFTER names a cycle
+        if ((!started && running == 0)); then
+            for ((i = 0; i < count; i++)); do
+                if [[ ${state[i]} == pending && -n ${after[i]} ]]; then
+                    echo "  WARNING: ignoring RUN_AFTER cycle at ${names[i]}" >&2
+                    after[i]=""
+                fi
+            done
+            continue
+        fi
+        
+        for ((i = 0; i < count; i++)); do
+            if [[ ${state[i]} == running && -f "$WORK_DIR/tier$tier.$i.rc" ]]; then
+                state[i]=done
+                ((running--))
+            fi
+        done
+        
+        # Report finished scripts in script order
+        while ((reported < count)) && [[ ${state[reported]} == done ]]; do
+            job="$WORK_DIR/tier$tier.$reported"
+            record_result "$tier" "${names[reported]}" "$(cat "$job.rc")" "$(cat "$job.out")"
+            if [[ -f "$job.cache" ]]; then
+                if [[ $(cat "$job.cache") == HIT ]]; then
+                    ((CACHE_HITS++))
+                else
+                    ((CACHE_MISSES++))
+                fi
+                cat "$job.key" >> "$WORK_DIR/cache-keys"
+            fi
+            ((reported++))
+        done
+        
+        if ((!started && running > 0)); then
+            sleep 0.1
+        fi
+    done
+    wait
+}
+
+# Run every *.sh script of a tier directory against target_dir
+run_tier_dir() {
+    local tier=$1
+    local dir=$2
+    local target_dir=$3
+    local scripts=()
+    local script
+    
+    for script in "$dir/"*.sh; do
+        [[ -f "$script" ]] && scripts+=("$script")
+    done
+    run_tier "$tier" "$target_dir" "${scripts[@]}"
+}
+
 # Header
+if [[ "$CACHE" != 0 ]]; then
+    mkdir -p "$CACHE_DIR"
+fi
 echo ""
 echo -e "${BLUE}═══════════════════════════════════════════════════════════════════${NC}"
 echo -e "${BLUE}  ENABLEMENT 2.0 - VALIDATION SUITE${NC}"
@@ -116,9 +365,7 @@ fi
 # ─────────────────────────────────────────────────────────────────────
 echo -e "${BLUE}▶ TIER 0: Conformance Validations (DEC-024/DEC-025)${NC}"
 if [[ -d "$SCRIPT_DIR/scripts/tier0" ]]; then
-    for script in "$SCRIPT_DIR/scripts/tier0/"*.sh; do
-        [[ -f "$script" ]] && run_validation "0" "$script" "$PACKAGE_DIR"
-    done
+    run_tier_dir "0" "$SCRIPT_DIR/scripts/tier0" "$PACKAGE_DIR"
 else
     echo "  (no tier0 scripts found)"
 fi
@@ -129,9 +376,7 @@ echo ""
 # ─────────────────────────────────────────────────────────────────────
 echo -e "${BLUE}▶ TIER 1: Universal Validations${NC}"
 if [[ -d "$SCRIPT_DIR/scripts/tier1" ]]; then
-    for script in "$SCRIPT_DIR/scripts/tier1/"*.sh; do
-        [[ -f "$script" ]] && run_validation "1" "$script" "$PROJECT_DIR"
-    done
+    run_tier_dir "1" "$SCRIPT_DIR/scripts/tier1" "$PROJECT_DIR"
 else
     echo "  (no tier1 scripts found)"
 fi
@@ -142,9 +387,7 @@ echo ""
 # ─────────────────────────────────────────────────────────────────────
 echo -e "${BLUE}▶ TIER 2: Technology Validations ({{STACK}})${NC}"
 if [[ -d "$SCRIPT_DIR/scripts/tier2" ]]; then
-    for script in "$SCRIPT_DIR/scripts/tier2/"*.sh; do
-        [[ -f "$script" ]] && run_validation "2" "$script" "$PROJECT_DIR"
-    done
+    run_tier_dir "2" "$SCRIPT_DIR/scripts/tier2" "$PROJECT_DIR"
 else
     echo "  (no tier2 scripts found)"
 fi
@@ -155,9 +398,7 @@ echo ""
 # ─────────────────────────────────────────────────────────────────────
 echo -e "${BLUE}▶ TIER 3: Module-specific Validations${NC}"
 if [[ -d "$SCRIPT_DIR/scripts/tier3" ]]; then
-    for script in "$SCRIPT_DIR/scripts/tier3/"*.sh; do
-        [[ -f "$script" ]] && run_validation "3" "$script" "$PROJECT_DIR"
-    done
+    run_tier_dir "3" "$SCRIPT_DIR/scripts/tier3" "$PROJECT_DIR"
 else
     echo "  (no tier3 scripts found)"
 fi
@@ -172,6 +413,9 @@ echo -e "${BLUE}═════════════════════
 echo -e "  Passed:  ${GREEN}$TOTAL_PASSED${NC}"
 echo -e "  Failed:  ${RED}$TOTAL_FAILED${NC}"
 echo -e "  Skipped: ${YELLOW}$TOTAL_SKIPPED${NC}"
+if [[ "$CACHE" != 0 ]]; then
+    echo -e "  Cached:  $CACHE_HITS of $((CACHE_HITS + CACHE_MISSES))"
+fi
 echo ""
 
 # Determine overall result
@@ -222,7 +466,9 @@ cat > "$REPORTS_DIR/validation-results.json" << EOF
     "total_validations": $((TOTAL_PASSED + TOTAL_FAILED + TOTAL_SKIPPED)),
     "passed": $TOTAL_PASSED,
     "failed": $TOTAL_FAILED,
-    "skipped": $TOTAL_SKIPPED
+    "skipped": $TOTAL_SKIPPED,
+    "cache_hits": $CACHE_HITS,
+    "cache_misses": $CACHE_MISSES
   },
   "tiers": {
     "tier1": {
@@ -244,4 +490,15 @@ EOF
 echo "Report saved to: $REPORTS_DIR/validation-results.json"
 echo ""
 
+# Keep only the cache entries this run used
+if [[ "$CACHE" != 0 ]]; then
+    for entry in "$CACHE_DIR"/*; do
+        [[ -f "$entry" ]] || continue
+        key=$(basename "$entry")
+        if ! grep -qx "${key%%.*}" "$WORK_DIR/cache-keys" 2>/dev/null; then
+            rm -f "$entry"
+        fi
+    done
+fi
+
 exit $EXIT_CODE
@@ -0,0 +1,190 @@
+#!/bin/bash
+# ═══════════════════════════════════════════════════════════════════
+# run-all-cache-test.sh - Result cache of run-all.sh.tpl
+# ═══════════════════════════════════════════════════════════════════
+#
+# Usage: ./run-all-cache-test.sh
+#
+# Assembles a throwaway package (run-all.sh from the template, the shipped
+# tier 0-3 scripts of the java-spring stack, a small generated project),
+# then edits one file at a time and checks that run-all.sh re-runs exactly
+# the scripts whose CACHE_INPUTS cover that file (plus the CACHE: off ones)
+# and replays every other result from the cache.
+#
+# Each copied script logs its name on start (CACHE_TEST_LOG), so the test
+# sees which scripts actually ran. compile-check.sh and test-check.sh are
+# left out: they need Maven and are never cached.
+#
+# Exit codes:
+#   0 - All cases passed
+#   1 - A case re-ran too many or too few scripts
+# ═══════════════════════════════════════════════════════════════════
+
+VALIDATORS="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+KB_ROOT="$(cd "$VALIDATORS/../.." && pwd)"
+TMP="$(mktemp -d "${TMPDIR:-/tmp}/run-all-cache-test.XXXXXX")"
+trap 'rm -rf "$TMP"' EXIT
+
+PKG="$TMP/pkg"
+PROJECT="$PKG/output/svc"
+export CACHE_TEST_LOG="$TMP/ran"
+FAILED=0
+
+# Scripts whose result never comes from the cache
+ALWAYS="project-structure-check traceability-check"
+
+# ─────────────────────────────────────────────────────────────────────
+# Package
+# ─────────────────────────────────────────────────────────────────────
+mkdir -p "$PKG/validation/scripts/"{tier0,tier1,tier2,tier3,lib}
+sed -e 's/{{SERVICE_NAME}}/svc/g' -e 's/{{STACK}}/java-spring/g' \
+    "$VALIDATORS/run-all.sh.tpl" > "$PKG/validation/run-all.sh"
+chmod +x "$PKG/validation/run-all.sh"
+cp "$VALIDATORS/lib/"*.sh "$PKG/validation/scripts/lib/"
+
+add_script() {
+    local tier=$1
+    local script=$2
+    local copy
+    copy="$PKG/validation/scripts/tier$tier/$(basename "$script")"
+    # Log the start right after the shebang; the headers stay as shipped
+    sed '1a\
+echo "$(basename "$0" .sh)" >> "$CACHE_TEST_LOG"' "$script" > "$copy"
+    chmod +x "$copy"
+}
+
+for s in "$VALIDATORS"/tier-0-conformance/*.sh; do add_script 0 "$s"; done
+for s in $(find "$VALIDATORS/tier-1-universal" -name "*.sh"); do add_script 1 "$s"; done
+for s in actuator-check application-yml-check syntax-check; do
+    add_script 2 "$VALIDATORS/tier-2-technology/code-projects/java-spring/$s.sh"
+done
+for s in "$KB_ROOT"/modules/mod-code-*/validation/*.sh; do add_script 3 "$s"; done
+
+# ─────────────────────────────────────────────────────────────────────
+# Project (com.acme.build is a package, not build output)
+# ─────────────────────────────────────────────────────────────────────
+JAVA="$PROJECT/src/main/java/com/acme"
+mkdir -p "$JAVA/domain" "$JAVA/build" "$PROJECT/src/main/resources" \
+         "$PROJECT/src/test/java/com/acme" "$PROJECT/target/classes"
+cat > "$PROJECT/pom.xml" << 'EOF'
+<project>
+  <artifactId>svc</artifactId>
+  <dependencies>
+    <dependency><artifactId>spring-boot-starter-actuator</artifactId></dependency>
+  </dependencies>
+</project>
+EOF
+cat > "$PROJECT/src/main/resources/application.yml" << 'EOF'
+spring:
+  application:
+    name: svc
+management:
+  endpoints:
+    web:
+      exposure:
+        include: health
+EOF
+cat > "$JAVA/domain/Order.java" << 'EOF'
+package com.acme.domain;
+
+public class Order {
+    private String id;
+}
+EOF
+cat > "$JAVA/build/BuildInfo.java" << 'EOF'
+package com.acme.build;
+
+public class BuildInfo {
+    public static final String VERSION = "1.0";
+}
+EOF
+cat > "$PROJECT/src/test/java/com/acme/OrderTest.java" << 'EOF'
+package com.acme;
+
+class OrderTest {
+}
+EOF
+echo "svc" > "$PROJECT/README.md"
+echo "stale" > "$PROJECT/target/classes/Order.class"
+
+# ─────────────────────────────────────────────────────────────────────
+# Cases
+# ─────────────────────────────────────────────────────────────────────
+
+# Run the suite; prints the scripts that ran, sorted
+run_suite() {
+    : > "$CACHE_TEST_LOG"
+    "$PKG/validation/run-all.sh" > "$TMP/out" 2>&1
+    sort "$CACHE_TEST_LOG"
+}
+
+# expect <case> <scripts expected to run besides $ALWAYS>...
+expect() {
+    local name=$1
+    shift
+    local expected actual
+    expected=$(printf '%s\n' $ALWAYS "$@" | sort)
+    actual=$(run_suite)
+    if [[ "$actual" == "$expected" ]]; then
+        echo "✅ PASS: $name"
+    else
+        echo "❌ FAIL: $name"
+        diff <(echo "$expected") <(echo "$actual") | sed -n 's/^</    not run: /p; s/^>/    re-ran:  /p'
+        FAILED=$((FAILED + 1))
+    fi
+}
+
+CACHED=$(grep -L '^# CACHE:[[:space:]]*off' "$PKG"/validation/scripts/tier*/*.sh | wc -l)
+CACHED=$((CACHED))
+
+run_suite > /dev/null
+expect "unchanged project replays every result"
+if ! grep -q "Cached:  $CACHED of $CACHED" "$TMP/out"; then
+    echo "❌ FAIL: summary does not report $CACHED of $CACHED cached"
+    grep "Cached:" "$TMP/out" | sed 's/^/    /'
+    FAILED=$((FAILED + 1))
+fi
+
+echo "# edited" >> "$PROJECT/README.md"
+expect "README.md edit re-runs only the whole-package check" \
+    package-structure-check
+
+echo "# edited" >> "$PROJECT/target/classes/Order.class"
+expect "build output edit re-runs nothing"
+
+echo "  # edited" >> "$PROJECT/src/main/resources/application.yml"
+expect "application.yml edit re-runs the checks that read it" \
+    package-structure-check actuator-check application-yml-check \
+    circuit-breaker-check retry-check timeout-check rate-limiter-check \
+    jpa-check systemapi-check config-check
+
+echo "<!-- edited -->" >> "$PROJECT/pom.xml"
+expect "pom.xml edit re-runs the checks that read it" \
+    package-structure-check actuator-check \
+    circuit-breaker-check retry-check timeout-check rate-limiter-check \
+    jpa-check systemapi-check
+
+echo "// edited" >> "$JAVA/build/BuildInfo.java"
+expect "Java edit under a build/ package re-runs the Java checks" \
+    package-structure-check template-conformance-check naming-conventions-check \
+    syntax-check circuit-breaker-check retry-check timeout-check \
+    rate-limiter-check hexagonal-structure-check jpa-check systemapi-check \
+    integration-check hateoas-check pagination-check \
+    compensation-endpoint-check compensation-interface-check \
+    transaction-log-check
+
+echo "// edited" >> "$PROJECT/src/test/java/com/acme/OrderTest.java"
+expect "test source edit re-runs the checks that read src/test" \
+    package-structure-check template-conformance-check syntax-check \
+    retry-check rate-limiter-check hexagonal-structure-check jpa-check \
+    systemapi-check integration-check hateoas-check pagination-check \
+    compensation-endpoint-check compensation-interface-check \
+    transaction-log-check
+
+echo ""
+if [[ $FAILED -gt 0 ]]; then
+    echo "❌ $FAILED case(s) failed"
+    exit 1
+fi
+echo "✅ All cases passed"
+exit 0
@@ -8,6 +8,11 @@
 #   mandatory "fingerprints" - unique patterns that MUST appear if the template
 #   was followed correctly.
 #
+#   The service's Java sources are read once into a fact index
+#   (lib/java-index.sh: annotations, type declarations, extends/implements,
+#   constants, identifiers per file); each group of fingerprints is one query
+#   over the index instead of a find/grep per file and per fingerprint.
+#
 # USAGE:
 #   ./template-conformance-check.sh <package_dir>
 #
@@ -16,11 +21,14 @@
 #   1 - One or more conformance checks failed
 #
 # POSIX COMPATIBLE - works with sh/bash 3.2+ (macOS default)
+# CACHE_INPUTS: output/*.java
 #
 # ═══════════════════════════════════════════════════════════════════════════════
 
 PACKAGE_DIR="${1:-.}"
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 SERVICE_DIR="$PACKAGE_DIR/output"
+TAB=$(printf '\t')
 
 # Find the actual service directory (first subdirectory of output/)
 if [ -d "$SERVICE_DIR" ]; then
@@ -53,29 +61,21 @@ if [ ! -d "$SERVICE_DIR" ]; then
 fi
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# FINGERPRINT CHECK FUNCTION
+# JAVA SOURCE INDEX
 # ═══════════════════════════════════════════════════════════════════════════════
-# Checks if a file contains all required patterns (pipe-separated)
-# Usage: check_fingerprints "file" "pattern1|pattern2|pattern3"
+# scripts/lib/ in an assembled package, runtime/validators/lib/ in the KB.
+# java_checks prints, per matching file, its path and 1/0 per fingerprint.
 
-check_fingerprints() {
-    file="$1"
-    patterns="$2"
-    filename=$(basename "$file")
-    all_found=true
-    
-    # Split patterns by | and check each
-    echo "$patterns" | tr '|' '\n' | while read pattern; do
-        if [ -n "$pattern" ]; then
-            if grep -qE "$pattern" "$file" 2>/dev/null; then
-                : # Pattern found
-            else
-                echo "❌ FAIL: $filename: Missing required pattern: $pattern"
-                # Note: can't increment ERRORS here due to subshell
-            fi
-        fi
-    done
-}
+for LIB_DIR in "$SCRIPT_DIR/../lib" "$SCRIPT_DIR/../../../lib"; do
+    [ -f "$LIB_DIR/java-index.sh" ] && break
+done
+if [ ! -f "$LIB_DIR/java-index.sh" ]; then
+    fail "java-index.sh not found (expected in $SCRIPT_DIR/../lib)"
+    exit 1
+fi
+. "$LIB_DIR/java-index.sh"
+
+java_index_build "$SERVICE_DIR"
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # FINGERPRINT CHECKS BY MODULE
@@ -85,17 +85,22 @@ echo "── Checking Module Fingerprints ────────────
 echo ""
 
 # mod-code-015: Hexagonal Base - CorrelationIdFilter
-CORR_FILTER=$(find "$SERVICE_DIR" -name "CorrelationIdFilter.java" -type f 2>/dev/null | head -1)
+IFS="$TAB" read -r CORR_FILTER HAS_HEADER HAS_GETTER PRIVATE_CONSTANT <<EOF
+$(java_checks '^CorrelationIdFilter\.java$' \
+    'field=^CORRELATION_ID_HEADER$=(^| )public static final String$' \
+    'ident=^getCurrentCorrelationId$' \
+    'field=^CORRELATION_ID=(^| )private static final String$' | head -1)
+EOF
 if [ -n "$CORR_FILTER" ]; then
     info "Checking mod-code-015: CorrelationIdFilter.java"
     MISSING=0
-    if grep -q "public static final String CORRELATION_ID_HEADER" "$CORR_FILTER" 2>/dev/null; then
+    if [ "$HAS_HEADER" = 1 ]; then
         : # OK
     else
         fail "CorrelationIdFilter: Missing CORRELATION_ID_HEADER constant"
         MISSING=1
     fi
-    if grep -q "getCurrentCorrelationId" "$CORR_FILTER" 2>/dev/null; then
+    if [ "$HAS_GETTER" = 1 ]; then
         : # OK
     else
         fail "CorrelationIdFilter: Missing getCurrentCorrelationId() method"
@@ -107,17 +112,21 @@ if [ -n "$CORR_FILTER" ]; then
 fi
 
 # mod-code-015: GlobalExceptionHandler
-EXCEPTION_HANDLER=$(find "$SERVICE_DIR" -name "GlobalExceptionHandler.java" -type f 2>/dev/null | head -1)
+IFS="$TAB" read -r EXCEPTION_HANDLER HAS_ADVICE HAS_HANDLER <<EOF
+$(java_checks '^GlobalExceptionHandler\.java$' \
+    'annotation=^@RestControllerAdvice$' \
+    'annotation=^@ExceptionHandler$' | head -1)
+EOF
 if [ -n "$EXCEPTION_HANDLER" ]; then
     info "Checking mod-code-015: GlobalExceptionHandler.java"
     MISSING=0
-    if grep -q "@RestControllerAdvice" "$EXCEPTION_HANDLER" 2>/dev/null; then
+    if [ "$HAS_ADVICE" = 1 ]; then
         : # OK
     else
         fail "GlobalExceptionHandler: Missing @RestControllerAdvice"
         MISSING=1
     fi
-    if grep -q "@ExceptionHandler" "$EXCEPTION_HANDLER" 2>/dev/null; then
+    if [ "$HAS_HANDLER" = 1 ]; then
         : # OK
     else
         fail "GlobalExceptionHandler: Missing @ExceptionHandler"
@@ -129,63 +138,77 @@ if [ -n "$EXCEPTION_HANDLER" ]; then
 fi
 
 # mod-code-019: ModelAssembler (HATEOAS)
-ASSEMBLERS=$(find "$SERVICE_DIR" -name "*ModelAssembler.java" -type f 2>/dev/null)
-for assembler in $ASSEMBLERS; do
+while IFS="$TAB" read -r assembler EXTENDS_SUPPORT HAS_SELF_REL; do
     if [ -n "$assembler" ]; then
-        info "Checking mod-code-019: $(basename $assembler)"
+        info "Checking mod-code-019: ${assembler##*/}"
         MISSING=0
-        if grep -q "extends RepresentationModelAssemblerSupport" "$assembler" 2>/dev/null; then
+        if [ "$EXTENDS_SUPPORT" = 1 ]; then
             : # OK
         else
-            fail "$(basename $assembler): Should extend RepresentationModelAssemblerSupport"
+            fail "${assembler##*/}: Should extend RepresentationModelAssemblerSupport"
             MISSING=1
         fi
-        if grep -q "withSelfRel" "$assembler" 2>/dev/null; then
+        if [ "$HAS_SELF_REL" = 1 ]; then
             : # OK
         else
-            warn "$(basename $assembler): Missing withSelfRel() call"
+            warn "${assembler##*/}: Missing withSelfRel() call"
         fi
         if [ $MISSING -eq 0 ]; then
-            pass "$(basename $assembler): All fingerprints present"
+            pass "${assembler##*/}: All fingerprints present"
         fi
     fi
-done
+done <<EOF
+$(java_checks 'ModelAssembler\.java$' \
+    'extends=(^|\.)RepresentationModelAssemblerSupport$' \
+    'ident=^withSelfRel$')
+EOF
 
-# mod-code-017: SystemApiAdapter
-ADAPTERS=$(find "$SERVICE_DIR" -name "*SystemApiAdapter.java" -o -name "*Adapter.java" 2>/dev/null | grep -i "systemapi\|adapter")
-for adapter in $ADAPTERS; do
-    if [ -n "$adapter" ] && [ -f "$adapter" ]; then
-        info "Checking mod-code-017: $(basename $adapter)"
+# mod-code-017: SystemApiAdapter (*SystemApiAdapter.java included)
+ADAPTERS=$(java_checks 'Adapter\.java$' \
+    'implements=Repository' \
+    'annotation=^@(Component|Service|Repository)' \
+    'annotation=^@CircuitBreaker$' \
+    'annotation=^@Retry$' \
+    'annotation=^@TimeLimiter$')
+while IFS="$TAB" read -r adapter IMPLEMENTS_REPOSITORY IS_COMPONENT CIRCUIT_BREAKER RETRY TIME_LIMITER; do
+    if [ -n "$adapter" ]; then
+        info "Checking mod-code-017: ${adapter##*/}"
         MISSING=0
-        if grep -q "implements.*Repository" "$adapter" 2>/dev/null; then
+        if [ "$IMPLEMENTS_REPOSITORY" = 1 ]; then
             : # OK
         else
-            warn "$(basename $adapter): Should implement a Repository interface"
+            warn "${adapter##*/}: Should implement a Repository interface"
         fi
-        if grep -q "@Component\|@Service\|@Repository" "$adapter" 2>/dev/null; then
+        if [ "$IS_COMPONENT" = 1 ]; then
             : # OK
         else
-            fail "$(basename $adapter): Missing Spring component annotation"
+            fail "${adapter##*/}: Missing Spring component annotation"
             MISSING=1
         fi
         if [ $MISSING -eq 0 ]; then
-            pass "$(basename $adapter): All fingerprints present"
+            pass "${adapter##*/}: All fingerprints present"
         fi
     fi
-done
+done <<EOF
+$ADAPTERS
+EOF
 
 # mod-code-018: RestClient configuration
-REST_CONFIG=$(find "$SERVICE_DIR" -name "RestClientConfig.java" -type f 2>/dev/null | head -1)
+IFS="$TAB" read -r REST_CONFIG HAS_CONFIGURATION HAS_REST_CLIENT <<EOF
+$(java_checks '^RestClientConfig\.java$' \
+    'annotation=^@Configuration$' \
+    'ident=RestClient' | head -1)
+EOF
 if [ -n "$REST_CONFIG" ]; then
     info "Checking mod-code-018: RestClientConfig.java"
     MISSING=0
-    if grep -q "@Configuration" "$REST_CONFIG" 2>/dev/null; then
+    if [ "$HAS_CONFIGURATION" = 1 ]; then
         : # OK
     else
         fail "RestClientConfig: Missing @Configuration"
         MISSING=1
     fi
-    if grep -q "RestClient" "$REST_CONFIG" 2>/dev/null; then
+    if [ "$HAS_REST_CLIENT" = 1 ]; then
         : # OK
     else
         fail "RestClientConfig: Missing RestClient reference"
@@ -197,19 +220,21 @@ if [ -n "$REST_CONFIG" ]; then
 fi
 
 # mod-code-001/002: Resilience annotations on adapters
-for adapter in $ADAPTERS; do
-    if [ -n "$adapter" ] && [ -f "$adapter" ]; then
-        if grep -q "@CircuitBreaker" "$adapter" 2>/dev/null; then
-            pass "$(basename $adapter): @CircuitBreaker annotation present"
+while IFS="$TAB" read -r adapter IMPLEMENTS_REPOSITORY IS_COMPONENT CIRCUIT_BREAKER RETRY TIME_LIMITER; do
+    if [ -n "$adapter" ]; then
+        if [ "$CIRCUIT_BREAKER" = 1 ]; then
+            pass "${adapter##*/}: @CircuitBreaker annotation present"
         fi
-        if grep -q "@Retry" "$adapter" 2>/dev/null; then
-            pass "$(basename $adapter): @Retry annotation present"
+        if [ "$RETRY" = 1 ]; then
+            pass "${adapter##*/}: @Retry annotation present"
         fi
-        if grep -q "@TimeLimiter" "$adapter" 2>/dev/null; then
-            pass "$(basename $adapter): @TimeLimiter annotation present"
+        if [ "$TIME_LIMITER" = 1 ]; then
+            pass "${adapter##*/}: @TimeLimiter annotation present"
         fi
     fi
-done
+done <<EOF
+$ADAPTERS
+EOF
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ANTI-IMPROVISATION CHECKS
@@ -220,20 +245,20 @@ echo "── Anti-Improvisation Checks ─────────────
 echo ""
 
 # Check: No implements RepresentationModelAssembler (should extend Support)
-WRONG_ASSEMBLERS=$(grep -rl "implements RepresentationModelAssembler" "$SERVICE_DIR" 2>/dev/null | grep "\.java$")
+WRONG_ASSEMBLERS=$(java_checks '' 'implements=(^|\.)RepresentationModelAssembler$' | awk -F"$TAB" '$2 == 1 { print $1 }')
 if [ -n "$WRONG_ASSEMBLERS" ]; then
     for file in $WRONG_ASSEMBLERS; do
-        fail "$(basename $file): Uses 'implements' instead of 'extends RepresentationModelAssemblerSupport'"
+        fail "${file##*/}: Uses 'implements' instead of 'extends RepresentationModelAssemblerSupport'"
     done
 else
     pass "No incorrect RepresentationModelAssembler implementations"
 fi
 
 # Check: Assembler naming convention
-WRONG_NAMES=$(find "$SERVICE_DIR" -name "*ResponseAssembler.java" -type f 2>/dev/null)
+WRONG_NAMES=$(java_files 'ResponseAssembler\.java$')
 if [ -n "$WRONG_NAMES" ]; then
     for file in $WRONG_NAMES; do
-        fail "$(basename $file): Should be named '*ModelAssembler.java'"
+        fail "${file##*/}: Should be named '*ModelAssembler.java'"
     done
 else
     pass "Assembler naming convention correct"
@@ -241,7 +266,7 @@ fi
 
 # Check: Constants visibility in CorrelationIdFilter
 if [ -n "$CORR_FILTER" ]; then
-    if grep -q "private static final String CORRELATION_ID" "$CORR_FILTER" 2>/dev/null; then
+    if [ "$PRIVATE_CONSTANT" = 1 ]; then
         fail "CorrelationIdFilter: Constants should be 'public static final' not 'private'"
     else
         pass "CorrelationIdFilter: Constants visibility correct"
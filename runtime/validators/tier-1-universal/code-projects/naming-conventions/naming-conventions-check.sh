@@ -2,6 +2,7 @@
 # naming-conventions-check.sh
 # Validates naming conventions (classes, packages)
 # Version: 1.2 - POSIX compatible (works with sh on Mac)
+# CACHE_INPUTS: src/main/java
 
 SERVICE_DIR="${1:-.}"
 
@@ -1,6 +1,7 @@
 #!/bin/bash
 # project-structure-check.sh
 # Validates basic project structure
+# CACHE: off (checks only that directories exist, which the cache key does not see)
 
 SERVICE_DIR=${1:-.}
 
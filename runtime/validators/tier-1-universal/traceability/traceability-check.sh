@@ -5,9 +5,20 @@
 # Validates .enablement/manifest.json exists and contains required fields
 # Updated for Model v3.0.11 - matches actual manifest structure from CodeGen
 #
-# POSIX compatible - does NOT require jq (uses grep/sed)
+# Usage: traceability-check.sh [output-dir] [trace-dir]
+#
+# With python3, manifest.json and every trace file that has a schema
+# (trace-dir, default: the package's trace/) are each parsed once and
+# validated against the trace schemas, with field-level messages. Schemas
+# are looked up in $TRACE_SCHEMA_DIR, the assembled validation/schemas/ and
+# the KB's runtime/schemas/trace/. Without python3 the grep-based checks run.
+#
+# POSIX compatible - does NOT require jq
+# CACHE: off (reads trace/ and schemas outside the project directory)
 
 OUTPUT_DIR="${1:-.}"
+TRACE_DIR="${2:-$OUTPUT_DIR/../../trace}"
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 ERRORS=0
 WARNINGS=0
 
@@ -31,6 +42,204 @@ json_get_value() {
     grep "\"$field\"" "$file" 2>/dev/null | sed 's/.*"'"$field"'"[[:space:]]*:[[:space:]]*"\([^"]*\)".*/\1/' | head -1
 }
 
+# Structured checks: each document is parsed once and validated against its
+# schema. Prints PASS:/FAIL:/WARN:/SKIP: lines; STOP: means the manifest is
+# unusable and nothing else was checked.
+structured_checks() {
+    python3 - "$MANIFEST" "$TRACE_DIR" "$SCHEMA_DIR" <<'PYEOF'
+import json
+import os
+import re
+import sys
+from datetime import datetime
+
+manifest_path, trace_dir, schema_dir = sys.argv[1:4]
+MAX_MESSAGES = 20
+UUID = re.compile(r'^[0-9a-fA-F]{8}-([0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$')
+TYPES = {'object': dict, 'array': list, 'string': str, 'boolean': bool, 'null': type(None)}
+PATTERNS = {}
+
+
+def json_type(value):
+    for name, cls in TYPES.items():
+        if isinstance(value, cls):
+            return name
+    return 'integer' if isinstance(value, int) else 'number'
+
+
+def type_ok(value, name):
+    if name in ('integer', 'number'):
+        if isinstance(value, bool):
+            return False
+        return isinstance(value, int if name == 'integer' else (int, float))
+    return isinstance(value, TYPES.get(name, object))
+
+
+def format_ok(value, fmt):
+    if fmt == 'uuid':
+        return bool(UUID.match(value))
+    if fmt == 'date-time':
+        try:
+            datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return False
+        return 'T' in value
+    return True
+
+
+def resolve(root, ref):
+    node = root
+    for part in ref.lstrip('#/').split('/'):
+        node = node[part]
+    return node
+
+
+def field(path, key):
+    return f"{path}.{key}" if path else key
+
+
+def validate(value, schema, root, path, errors):
+    """Draft-07 subset used by runtime/schemas/trace; visits each node once."""
+    if '$ref' in schema:
+        schema = resolve(root, schema['$ref'])
+    where = path or '(root)'
+    types = schema.get('type')
+    if types:
+        types = types if isinstance(types, list) else [types]
+        if not any(type_ok(value, t) for t in types):
+            errors.append(f"{where}: expected {' or '.join(types)}, got {json_type(value)}")
+            return
+    if 'const' in schema and value != schema['const']:
+        errors.append(f"{where}: must be {schema['const']!r}, got {value!r}")
+    if 'enum' in schema and value not in schema['enum']:
+        errors.append(f"{where}: {value!r} is not one of {', '.join(map(str, schema['enum']))}")
+
+    if isinstance(value, str):
+        pattern = schema.get('pattern')
+        if pattern:
+            regex = PATTERNS.get(pattern) or PATTERNS.setdefault(pattern, re.compile(pattern))
+            if not regex.search(value):
+                errors.append(f"{where}: {value!r} does not match {pattern}")
+        if 'format' in schema and not format_ok(value, schema['format']):
+            errors.append(f"{where}: {value!r} is not a valid {schema['format']}")
+    elif isinstance(value, dict):
+        for key in schema.get('required', ()):
+            if key not in value:
+                errors.append(f"{field(path, key)}: required field missing")
+        properties = schema.get('properties', {})
+        extra = schema.get('additionalProperties', True)
+        for key, item in value.items():
+            if key in properties:
+                validate(item, properties[key], root, field(path, key), errors)
+            elif extra is False:
+                errors.append(f"{field(path, key)}: unexpected field")
+            elif isinstance(extra, dict):
+                validate(item, extra, root, field(path, key), errors)
+    elif isinstance(value, list):
+        if 'items' in schema:
+            for i, item in enumerate(value):
+                validate(item, schema['items'], root, f"{path}[{i}]", errors)
+    elif not isinstance(value, bool) and value is not None:
+        if 'minimum' in schema and value < schema['minimum']:
+            errors.append(f"{where}: {value} is less than {schema['minimum']}")
+        if 'maximum' in schema and value > schema['maximum']:
+            errors.append(f"{where}: {value} is greater than {schema['maximum']}")
+
+
+def load(path):
+    """(document, None) or (None, reason)."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f), None
+    except ValueError as e:
+        return None, str(e)
+    except OSError as e:
+        return None, e.strerror
+
+
+def schema_check(name, document, schema_name):
+    if not schema_dir:
+        return
+    schema_path = os.path.join(schema_dir, schema_name)
+    with open(schema_path, encoding='utf-8') as f:
+        schema = json.load(f)
+    errors = []
+    validate(document, schema, schema, '', errors)
+    if not errors:
+        print(f"PASS:{name} matches {schema_name}")
+        return
+    for message in errors[:MAX_MESSAGES]:
+        print(f"WARN:{name}: {message}")
+    if len(errors) > MAX_MESSAGES:
+        print(f"WARN:{name}: ... {len(errors) - MAX_MESSAGES} more schema violations")
+
+
+# ─── manifest.json ───
+manifest, reason = load(manifest_path)
+if manifest is None:
+    print(f"FAIL:manifest.json is not valid JSON ({reason})")
+    print("STOP:")
+    sys.exit(0)
+if not isinstance(manifest, dict):
+    print(f"FAIL:manifest.json must be a JSON object, got {json_type(manifest)}")
+    print("STOP:")
+    sys.exit(0)
+print("PASS:manifest.json is valid JSON")
+
+for key in ('generation', 'enablement'):
+    print(f"PASS:Field '{key}' present" if key in manifest else f"FAIL:Field '{key}' missing (required)")
+for key in ('modules', 'status'):
+    print(f"PASS:Field '{key}' present" if key in manifest else f"WARN:Field '{key}' missing")
+
+
+def section(name):
+    value = manifest.get(name)
+    return value if isinstance(value, dict) else {}
+
+
+generation, enablement, status = section('generation'), section('enablement'), section('status')
+for label, value in (('generation.id', generation.get('id')),
+                     ('generation.timestamp', generation.get('timestamp')),
+                     ('enablement.version', enablement.get('version'))):
+    print(f"PASS:{label}: {value}" if value else f"WARN:{label} is empty or not found")
+if generation.get('service_name'):
+    print(f"PASS:generation.service_name: {generation['service_name']}")
+else:
+    print("WARN:generation.service_name is empty or not found")
+
+modules = manifest.get('modules')
+if isinstance(modules, list):
+    print(f"PASS:modules array has {len(modules)} entries" if modules else "WARN:modules array is empty")
+
+# Older CodeGen manifests report the outcome as status.generation
+key = 'overall' if 'overall' in status else 'generation'
+outcome = status.get(key)
+if outcome in ('SUCCESS', 'PENDING'):
+    print(f"PASS:status.{key}: {outcome}")
+else:
+    print(f"WARN:status.{key} is {outcome or 'not found'}")
+
+if schema_dir:
+    schema_check('manifest.json', manifest, 'manifest.schema.json')
+else:
+    print("SKIP:Schema validation (no trace schemas found)")
+
+# ─── trace/*.json with a matching <name>.schema.json ───
+if schema_dir and os.path.isdir(trace_dir):
+    for name in sorted(os.listdir(trace_dir)):
+        schema_name = name[:-len('.json')] + '.schema.json'
+        if not name.endswith('.json') or not os.path.isfile(os.path.join(schema_dir, schema_name)):
+            continue
+        document, reason = load(os.path.join(trace_dir, name))
+        if document is None:
+            print(f"FAIL:trace/{name} is not valid JSON ({reason})")
+        else:
+            schema_check(f"trace/{name}", document, schema_name)
+elif schema_dir:
+    print("SKIP:Trace files (no trace/ directory)")
+PYEOF
+}
+
 echo "════════════════════════════════════════════════════════════"
 echo "  TIER 1 - TRACEABILITY VALIDATION (Universal)"
 echo "════════════════════════════════════════════════════════════"
@@ -55,82 +264,105 @@ else
     exit 1
 fi
 
-# Check 3: Valid JSON (basic check - looks for opening/closing braces)
-if head -1 "$MANIFEST" | grep -q "^{" && tail -1 "$MANIFEST" | grep -q "}$"; then
-    pass "manifest.json appears to be valid JSON"
-else
-    fail "manifest.json does not appear to be valid JSON"
-    exit 1
-fi
+if command -v python3 >/dev/null 2>&1; then
+    # Checks 3-9 plus schema validation in one pass over each document
+    SCHEMA_DIR=""
+    for dir in "${TRACE_SCHEMA_DIR:-}" "$SCRIPT_DIR/../../schemas" "$SCRIPT_DIR/../../../schemas/trace"; do
+        if [ -n "$dir" ] && [ -f "$dir/manifest.schema.json" ]; then
+            SCHEMA_DIR="$dir"
+            break
+        fi
+    done
 
-# Check 4: Required fields - adapted for actual manifest structure
-# Actual structure has: generation, enablement, modules, status, metrics
-
-if json_has_field "$MANIFEST" "generation"; then
-    pass "Field 'generation' present"
+    RESULT=$(structured_checks)
+    while IFS= read -r line; do
+        case "$line" in
+            PASS:*) pass "${line#PASS:}" ;;
+            FAIL:*) fail "${line#FAIL:}" ;;
+            WARN:*) warn "${line#WARN:}" ;;
+            SKIP:*) skip "${line#SKIP:}" ;;
+            STOP:*) exit 1 ;;
+        esac
+    done <<EOF
+$RESULT
+EOF
 else
-    fail "Field 'generation' missing (required)"
-fi
+    # Check 3: Valid JSON (basic check - looks for opening/closing braces)
+    if head -1 "$MANIFEST" | grep -q "^{" && tail -1 "$MANIFEST" | grep -q "}$"; then
+        pass "manifest.json appears to be valid JSON"
+    else
+        fail "manifest.json does not appear to be valid JSON"
+        exit 1
+    fi
 
-if json_has_field "$MANIFEST" "enablement"; then
-    pass "Field 'enablement' present"
-else
-    fail "Field 'enablement' missing (required)"
-fi
+    # Check 4: Required fields - adapted for actual manifest structure
+    # Actual structure has: generation, enablement, modules, status, metrics
 
-if json_has_field "$MANIFEST" "modules"; then
-    pass "Field 'modules' present"
-else
-    warn "Field 'modules' missing"
-fi
+    if json_has_field "$MANIFEST" "generation"; then
+        pass "Field 'generation' present"
+    else
+        fail "Field 'generation' missing (required)"
+    fi
 
-if json_has_field "$MANIFEST" "status"; then
-    pass "Field 'status' present"
-else
-    warn "Field 'status' missing"
-fi
+    if json_has_field "$MANIFEST" "enablement"; then
+        pass "Field 'enablement' present"
+    else
+        fail "Field 'enablement' missing (required)"
+    fi
 
-# Check 5: Service name is present (in generation section)
-SERVICE_NAME=$(json_get_value "$MANIFEST" "service_name")
-if [ -n "$SERVICE_NAME" ]; then
-    pass "generation.service_name: $SERVICE_NAME"
-else
-    warn "generation.service_name is empty or not found"
-fi
+    if json_has_field "$MANIFEST" "modules"; then
+        pass "Field 'modules' present"
+    else
+        warn "Field 'modules' missing"
+    fi
 
-# Check 6: Enablement version present
-VERSION=$(json_get_value "$MANIFEST" "version")
-if [ -n "$VERSION" ]; then
-    pass "enablement.version: $VERSION"
-else
-    warn "enablement.version is empty or not found"
-fi
+    if json_has_field "$MANIFEST" "status"; then
+        pass "Field 'status' present"
+    else
+        warn "Field 'status' missing"
+    fi
 
-# Check 7: Timestamp present
-TIMESTAMP=$(json_get_value "$MANIFEST" "timestamp")
-if [ -n "$TIMESTAMP" ]; then
-    pass "generation.timestamp: $TIMESTAMP"
-else
-    warn "generation.timestamp missing"
-fi
+    # Check 5: Service name is present (in generation section)
+    SERVICE_NAME=$(json_get_value "$MANIFEST" "service_name")
+    if [ -n "$SERVICE_NAME" ]; then
+        pass "generation.service_name: $SERVICE_NAME"
+    else
+        warn "generation.service_name is empty or not found"
+    fi
 
-# Check 8: Modules array has entries
-if json_has_field "$MANIFEST" "modules"; then
-    MODULE_COUNT=$(grep -c '"id"' "$MANIFEST" 2>/dev/null || echo "0")
-    if [ "$MODULE_COUNT" -gt 0 ]; then
-        pass "modules array has ~$MODULE_COUNT entries"
+    # Check 6: Enablement version present
+    VERSION=$(json_get_value "$MANIFEST" "version")
+    if [ -n "$VERSION" ]; then
+        pass "enablement.version: $VERSION"
     else
-        warn "modules array appears empty"
+        warn "enablement.version is empty or not found"
     fi
-fi
 
-# Check 9: Generation status
-GEN_STATUS=$(json_get_value "$MANIFEST" "generation")
-# Look for SUCCESS in the status section
-if grep -q '"generation"[[:space:]]*:[[:space:]]*"SUCCESS"' "$MANIFEST" 2>/dev/null; then
-    pass "status.generation: SUCCESS"
-else
-    warn "status.generation not found or not SUCCESS"
+    # Check 7: Timestamp present
+    TIMESTAMP=$(json_get_value "$MANIFEST" "timestamp")
+    if [ -n "$TIMESTAMP" ]; then
+        pass "generation.timestamp: $TIMESTAMP"
+    else
+        warn "generation.timestamp missing"
+    fi
+
+    # Check 8: Modules array has entries
+    if json_has_field "$MANIFEST" "modules"; then
+        MODULE_COUNT=$(grep -c '"id"' "$MANIFEST" 2>/dev/null || echo "0")
+        if [ "$MODULE_COUNT" -gt 0 ]; then
+            pass "modules array has ~$MODULE_COUNT entries"
+        else
+            warn "modules array appears empty"
+        fi
+    fi
+
+    # Check 9: Generation status
+    # Look for SUCCESS in the status section
+    if grep -q '"generation"[[:space:]]*:[[:space:]]*"SUCCESS"' "$MANIFEST" 2>/dev/null; then
+        pass "status.generation: SUCCESS"
+    else
+        warn "status.generation not found or not SUCCESS"
+    fi
 fi
 
 # Summary
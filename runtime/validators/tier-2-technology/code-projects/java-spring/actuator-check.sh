@@ -1,6 +1,7 @@
 #!/bin/bash
 # actuator-check.sh
 # Validates Spring Boot Actuator configuration
+# CACHE_INPUTS: pom.xml src/main/resources/application.yml src/main/resources/application.properties
 
 SERVICE_DIR=${1:-.}
 APP_YML="$SERVICE_DIR/src/main/resources/application.yml"
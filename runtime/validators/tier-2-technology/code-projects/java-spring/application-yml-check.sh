@@ -1,6 +1,7 @@
 #!/bin/bash
 # application-yml-check.sh
 # Validates application.yml syntax and basic structure
+# CACHE_INPUTS: src/main/resources/application.yml
 
 SERVICE_DIR=${1:-.}
 APP_YML="$SERVICE_DIR/src/main/resources/application.yml"
@@ -1,6 +1,7 @@
 #!/bin/bash
 # compile-check.sh
 # Validates Maven compilation
+# CACHE: off (depends on the Maven/JDK toolchain and the network, not only on files)
 
 SERVICE_DIR=${1:-.}
 
@@ -2,23 +2,36 @@
 # ==============================================================================
 # SYNTAX-CHECK.SH - Java Syntax Validation without Maven
 # ==============================================================================
-# Version: 1.1
-# Updated: 2026-01-23
+# Version: 1.2
+# Updated: 2026-10-18
 # Purpose: Detect known LLM hallucinations and syntax errors without requiring
 #          a full Maven build (which needs JDK and network access)
-# Changes: Semicolon check is now warning-only (builder pattern false positives)
+# Changes: Checks query the one-pass Java source index (lib/java-index.sh)
+#          instead of running grep/wc per file and per check
 #
 # Usage: ./syntax-check.sh <project-directory>
 # Returns: 0 if all checks pass, 1 if errors found
 # Output: List of errors with file:line:issue format for auto-correction
+# CACHE_INPUTS: *.java
 # ==============================================================================
 
 # Note: Not using 'set -e' to handle errors manually
 
 PROJECT_DIR="${1:-.}"
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 ERRORS_FOUND=0
 ERROR_LOG=""
 
+# scripts/lib/ in an assembled package, runtime/validators/lib/ in the KB
+for LIB_DIR in "$SCRIPT_DIR/../lib" "$SCRIPT_DIR/../../../lib"; do
+    [ -f "$LIB_DIR/java-index.sh" ] && break
+done
+if [ ! -f "$LIB_DIR/java-index.sh" ]; then
+    echo "❌ java-index.sh not found (expected in $SCRIPT_DIR/../lib)"
+    exit 1
+fi
+source "$LIB_DIR/java-index.sh"
+
 log_error() {
     local file="$1"
     local line="$2"
@@ -32,10 +45,41 @@ log_error() {
     fi
 }
 
+# Findings of one check, read from the index: <file> TAB <line> TAB <detail>
+index_findings() {
+    awk -F'\t' -v check="$1" -v root="$PROJECT_DIR" '
+function flush() {
+    if (file == "") return
+    if (check == "transactional" && api) printf "%s", tx
+    if (check == "package" && !pkg) print root "/" file, 1, "-"
+    if (check == "type" && !typ) print root "/" file, "?", "-"
+}
+BEGIN { OFS = "\t" }
+$2 == "file" {
+    flush()
+    file = $1
+    pkg = typ = 0
+    tx = ""
+    out = ("/" file ~ /\/adapter\/out\//)
+    api = 0
+    next
+}
+check == "replace" && $2 == "lint" && $3 == "replace-3-args" { print root "/" file, $4, "-" }
+check == "strings" && $2 == "lint" && $3 == "unclosed-string" { print root "/" file, $4, "-" }
+check == "transactional" && out && $2 == "lint" && $3 == "transactional" { tx = tx root "/" file "\t" $4 "\t-\n" }
+check == "transactional" && $2 == "lint" && $3 == "systemapi" { api = 1 }
+$2 == "package" && $3 ~ /^[a-z]/ && $4 <= 20 { pkg = 1 }
+$2 == "type" && $3 ~ /^[A-Z]/ { typ = 1 }
+(check == "braces" || check == "parens") && $2 == check && $3 != $4 { print root "/" file, "EOF", "open=" $3 ", close=" $4 }
+END { flush() }' "$JAVA_INDEX"
+}
+
 echo "=== Java Syntax Validation (No Maven Required) ==="
 echo "Project: $PROJECT_DIR"
 echo ""
 
+java_index_build "$PROJECT_DIR"
+
 # ==============================================================================
 # 1. KNOWN LLM HALLUCINATIONS
 # ==============================================================================
@@ -44,15 +88,11 @@ echo "--- Checking for Known LLM Hallucinations ---"
 
 # HALLUCINATION-001: String.replace with 3 arguments
 echo -n "Checking HALLUCINATION-001 (String.replace with 3 args)... "
-while IFS= read -r file; do
-    # Look for patterns like: .replace("x", "y", index) or .replace("x", "y", 3)
-    while IFS=: read -r line_num content; do
-        if echo "$content" | grep -qE '\.replace\s*\(\s*"[^"]*"\s*,\s*"[^"]*"\s*,\s*[^)]+\)'; then
-            log_error "$file" "$line_num" "String.replace() with 3 arguments does not exist in Java" \
-                "Use substring() or DateTimeFormatter for timestamp parsing"
-        fi
-    done < <(grep -n '\.replace\s*(' "$file" 2>/dev/null || true)
-done < <(find "$PROJECT_DIR" -name "*.java" -type f 2>/dev/null)
+# Patterns like: .replace("x", "y", index) or .replace("x", "y", 3)
+while IFS=$'\t' read -r file line_num detail; do
+    log_error "$file" "$line_num" "String.replace() with 3 arguments does not exist in Java" \
+        "Use substring() or DateTimeFormatter for timestamp parsing"
+done < <(index_findings replace)
 
 if [ $ERRORS_FOUND -eq 0 ]; then
     echo "PASS"
@@ -63,17 +103,11 @@ fi
 # HALLUCINATION-002: @Transactional with System API
 PREV_ERRORS=$ERRORS_FOUND
 echo -n "Checking HALLUCINATION-002 (@Transactional with System API)... "
-# Find files in adapter/out/systemapi that have @Transactional
-while IFS= read -r file; do
-    if grep -q "systemapi\|SystemApi\|system-api" "$file" 2>/dev/null; then
-        while IFS=: read -r line_num content; do
-            if echo "$content" | grep -qE '@Transactional'; then
-                log_error "$file" "$line_num" "@Transactional used with System API persistence" \
-                    "Remove @Transactional - HTTP calls don't support local transactions"
-            fi
-        done < <(grep -n '@Transactional' "$file" 2>/dev/null || true)
-    fi
-done < <(find "$PROJECT_DIR" -path "*/adapter/out/*" -name "*.java" -type f 2>/dev/null)
+# @Transactional in adapter/out files that refer to a System API
+while IFS=$'\t' read -r file line_num detail; do
+    log_error "$file" "$line_num" "@Transactional used with System API persistence" \
+        "Remove @Transactional - HTTP calls don't support local transactions"
+done < <(index_findings transactional)
 
 if [ $ERRORS_FOUND -eq $PREV_ERRORS ]; then
     echo "PASS"
@@ -91,12 +125,10 @@ echo "--- Basic Syntax Checks ---"
 # 2.1 Package declaration
 PREV_ERRORS=$ERRORS_FOUND
 echo -n "Checking package declarations... "
-while IFS= read -r file; do
-    if ! head -20 "$file" | grep -qE '^\s*package\s+[a-z]'; then
-        log_error "$file" "1" "Missing or invalid package declaration" \
-            "Add 'package com.xxx.yyy;' at the start of the file"
-    fi
-done < <(find "$PROJECT_DIR" -name "*.java" -type f 2>/dev/null)
+while IFS=$'\t' read -r file line_num detail; do
+    log_error "$file" "$line_num" "Missing or invalid package declaration" \
+        "Add 'package com.xxx.yyy;' at the start of the file"
+done < <(index_findings package)
 
 if [ $ERRORS_FOUND -eq $PREV_ERRORS ]; then
     echo "PASS"
@@ -107,11 +139,9 @@ fi
 # 2.2 Class/Interface/Enum/Record declaration
 PREV_ERRORS=$ERRORS_FOUND
 echo -n "Checking type declarations... "
-while IFS= read -r file; do
-    if ! grep -qE '(public|private|protected)?\s*(class|interface|enum|record)\s+[A-Z]' "$file" 2>/dev/null; then
-        log_error "$file" "?" "Missing class/interface/enum/record declaration"
-    fi
-done < <(find "$PROJECT_DIR" -name "*.java" -type f 2>/dev/null)
+while IFS=$'\t' read -r file line_num detail; do
+    log_error "$file" "$line_num" "Missing class/interface/enum/record declaration"
+done < <(index_findings type)
 
 if [ $ERRORS_FOUND -eq $PREV_ERRORS ]; then
     echo "PASS"
@@ -122,13 +152,9 @@ fi
 # 2.3 Brace balance
 PREV_ERRORS=$ERRORS_FOUND
 echo -n "Checking brace balance... "
-while IFS= read -r file; do
-    OPEN=$(grep -o "{" "$file" 2>/dev/null | wc -l)
-    CLOSE=$(grep -o "}" "$file" 2>/dev/null | wc -l)
-    if [ "$OPEN" -ne "$CLOSE" ]; then
-        log_error "$file" "EOF" "Unbalanced braces (open=$OPEN, close=$CLOSE)"
-    fi
-done < <(find "$PROJECT_DIR" -name "*.java" -type f 2>/dev/null)
+while IFS=$'\t' read -r file line_num detail; do
+    log_error "$file" "$line_num" "Unbalanced braces ($detail)"
+done < <(index_findings braces)
 
 if [ $ERRORS_FOUND -eq $PREV_ERRORS ]; then
     echo "PASS"
@@ -139,13 +165,9 @@ fi
 # 2.4 Parenthesis balance
 PREV_ERRORS=$ERRORS_FOUND
 echo -n "Checking parenthesis balance... "
-while IFS= read -r file; do
-    OPEN=$(grep -o "(" "$file" 2>/dev/null | wc -l)
-    CLOSE=$(grep -o ")" "$file" 2>/dev/null | wc -l)
-    if [ "$OPEN" -ne "$CLOSE" ]; then
-        log_error "$file" "EOF" "Unbalanced parentheses (open=$OPEN, close=$CLOSE)"
-    fi
-done < <(find "$PROJECT_DIR" -name "*.java" -type f 2>/dev/null)
+while IFS=$'\t' read -r file line_num detail; do
+    log_error "$file" "$line_num" "Unbalanced parentheses ($detail)"
+done < <(index_findings parens)
 
 if [ $ERRORS_FOUND -eq $PREV_ERRORS ]; then
     echo "PASS"
@@ -163,18 +185,12 @@ echo "--- Common Mistakes ---"
 # 3.1 Unclosed string literals (basic check)
 PREV_ERRORS=$ERRORS_FOUND
 echo -n "Checking for obvious string issues... "
-while IFS= read -r file; do
-    # Check for lines with odd number of quotes (excluding escaped quotes)
-    while IFS=: read -r line_num content; do
-        # Remove escaped quotes for counting
-        clean_line=$(echo "$content" | sed 's/\\"/X/g')
-        quote_count=$(echo "$clean_line" | grep -o '"' | wc -l)
-        if [ $((quote_count % 2)) -ne 0 ]; then
-            # Could be a false positive (multi-line string), but flag it
-            log_error "$file" "$line_num" "Possible unclosed string literal"
-        fi
-    done < <(grep -n '"' "$file" 2>/dev/null | head -100 || true)
-done < <(find "$PROJECT_DIR" -name "*.java" -type f 2>/dev/null)
+# Lines with an odd number of quotes (escaped quotes excluded), among the
+# first 100 quoted lines of each file. Could be a false positive (multi-line
+# string), but flag it
+while IFS=$'\t' read -r file line_num detail; do
+    log_error "$file" "$line_num" "Possible unclosed string literal"
+done < <(index_findings strings)
 
 if [ $ERRORS_FOUND -eq $PREV_ERRORS ]; then
     echo "PASS"
@@ -197,7 +213,7 @@ echo ""
 echo "==========================================="
 if [ $ERRORS_FOUND -eq 0 ]; then
     echo "✅ SYNTAX CHECK PASSED"
-    echo "   All $(find "$PROJECT_DIR" -name "*.java" -type f 2>/dev/null | wc -l) Java files validated"
+    echo "   All $(java_files | wc -l) Java files validated"
     exit 0
 else
     echo "❌ SYNTAX CHECK FAILED"
@@ -1,6 +1,8 @@
 #!/bin/bash
 # test-check.sh
 # Validates Maven tests execution
+# RUN_AFTER: compile-check
+# CACHE: off (depends on the Maven/JDK toolchain and the network, not only on files)
 
 SERVICE_DIR=${1:-.}
 
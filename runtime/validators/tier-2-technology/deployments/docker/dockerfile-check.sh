@@ -1,6 +1,7 @@
 #!/bin/bash
 # dockerfile-check.sh
 # Validates Dockerfile syntax and best practices
+# CACHE: off (the syntax check uses the local docker CLI when installed)
 
 SERVICE_DIR=${1:-.}
 DOCKERFILE="$SERVICE_DIR/Dockerfile"